@@ -0,0 +1,103 @@
+"""
+Benchmark AudioServiceClient against AsyncAudioServiceClient with many
+concurrent sessions.
+
+Each session makes CALLS StartAudioProcessing calls, each followed by a
+GetProcessingStatus poll, against a local FakeAudioService answering every
+call after PROCESSING_DELAY seconds (a stand-in for recording and
+inference). "sync" runs each session on its own thread sharing one
+blocking client, as main.py does. "async" runs every session as a task on
+one event loop sharing one grpc.aio client. The server runs in a child
+process with enough workers for every session, so the CPU time and thread
+counts are those of the client alone.
+
+Run with: python -m benchmarks.bench_audio_clients
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+
+from src.audio_client import AsyncAudioServiceClient, AudioServiceClient
+from src.fake_audio_service import FakeAudioService, start_fake_server
+
+CALLS = 5
+PROCESSING_DELAY = 0.05
+SESSIONS = (1, 10, 100, 200)
+
+
+def serve(addresses, stop):
+  server, address = start_fake_server(
+    FakeAudioService(processing_delay=PROCESSING_DELAY),
+    max_workers=max(SESSIONS) * 2,
+  )
+  addresses.put(address)
+  stop.wait()
+  server.stop(0)
+
+
+def run_sync(address, sessions):
+  client = AudioServiceClient(server_address=address)
+
+  def session():
+    for _ in range(CALLS):
+      result = client.start_audio_processing(duration=5)
+      client.get_processing_status(result['session_id'])
+
+  threads = [threading.Thread(target=session) for _ in range(sessions)]
+  start = time.perf_counter()
+  for thread in threads:
+    thread.start()
+  peak_threads = threading.active_count()
+  for thread in threads:
+    thread.join()
+  elapsed = time.perf_counter() - start
+  client.close()
+  return elapsed, peak_threads
+
+
+def run_async(address, sessions):
+  async def main():
+    async with AsyncAudioServiceClient(server_address=address) as client:
+      async def session():
+        for _ in range(CALLS):
+          result = await client.start_audio_processing(duration=5)
+          await client.get_processing_status(result['session_id'])
+
+      start = time.perf_counter()
+      tasks = [asyncio.create_task(session()) for _ in range(sessions)]
+      await asyncio.sleep(0)
+      peak_threads = threading.active_count()
+      await asyncio.gather(*tasks)
+      return time.perf_counter() - start, peak_threads
+
+  return asyncio.run(main())
+
+
+def main():
+  addresses = multiprocessing.Queue()
+  stop = multiprocessing.Event()
+  server = multiprocessing.Process(target=serve, args=(addresses, stop))
+  server.start()
+  address = addresses.get()
+  baseline = threading.active_count()
+  print(f"{CALLS} calls + {CALLS} status polls per session, {PROCESSING_DELAY * 1000:.0f} ms per call\n")
+  print(f"{'sessions':>8}  {'client':<6}{'wall':>10}{'calls/s':>10}{'CPU':>10}{'threads':>9}")
+  for sessions in SESSIONS:
+    for name, run in (("sync", run_sync), ("async", run_async)):
+      cpu = time.process_time()
+      elapsed, peak_threads = run(address, sessions)
+      cpu = time.process_time() - cpu
+      calls = sessions * CALLS * 2
+      print(
+        f"{sessions:>8}  {name:<6}{elapsed:>9.2f}s{calls / elapsed:>10.0f}"
+        f"{cpu:>9.2f}s{peak_threads - baseline:>9}"
+      )
+  stop.set()
+  server.join()
+  print("\nthreads counts the threads added by the client at peak")
+
+
+if __name__ == "__main__":
+  main()
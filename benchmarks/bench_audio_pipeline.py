@@ -0,0 +1,71 @@
+"""
+Benchmark how much of a session is recorded by the serial audio loop and by
+AudioPipeline.
+
+Times are scaled down by SCALE so a session of SESSION scaled seconds runs
+in a few real seconds: the FakeAudioService records 5 s per call, and the
+serial loops sleep as the previous audio_processing_loop did. "serial
+(original)" showed the class, slept 2 s, showed the confidence, slept 1 s.
+"serial (1 s pause)" is the loop with the asynchronous LCD, which kept
+only the last sleep. Coverage is recorded seconds over elapsed seconds.
+
+Run with: python -m benchmarks.bench_audio_pipeline
+"""
+
+import time
+
+from src.audio_client import AudioServiceClient
+from src.audio_pipeline import AudioPipeline, CoverageMeter
+from src.fake_audio_service import FakeAudioService, start_fake_server
+
+SCALE = 0.02
+DURATION = 5
+SESSION = 120
+
+
+def serial(client, pauses):
+  coverage = CoverageMeter()
+  coverage.start()
+  deadline = time.monotonic() + SESSION * SCALE
+  while time.monotonic() < deadline:
+    result = client.start_audio_processing(duration=DURATION)
+    if result and result.get('success'):
+      coverage.add(DURATION * SCALE)
+    for pause in pauses:
+      time.sleep(pause * SCALE)
+  coverage.stop()
+  return coverage
+
+
+def pipelined(client):
+  # The presenter pauses like the original loop, on its own thread
+  def present(result):
+    time.sleep(3 * SCALE)
+
+  pipeline = AudioPipeline(client, present, duration=DURATION)
+  deadline = time.monotonic() + SESSION * SCALE
+  pipeline.run(keep_running=lambda: time.monotonic() < deadline)
+  # The pipeline counts the requested duration, scale it like the serial loops
+  pipeline.coverage.recorded *= SCALE
+  return pipeline.coverage
+
+
+def main():
+  server, address = start_fake_server(FakeAudioService(time_scale=SCALE))
+  client = AudioServiceClient(server_address=address)
+  print(f"{SESSION} s session, {DURATION} s recordings, time scaled by {SCALE}\n")
+  print(f"{'loop':<22}{'recordings':>11}{'coverage':>10}")
+  for name, run in (
+    ("serial (original)", lambda: serial(client, (2, 1))),
+    ("serial (1 s pause)", lambda: serial(client, (1,))),
+    ("pipelined", lambda: pipelined(client)),
+  ):
+    coverage = run()
+    recordings = round(coverage.recorded / (DURATION * SCALE))
+    print(f"{name:<22}{recordings:>11}{coverage.ratio:>9.0%}")
+  client.close()
+  server.stop(0)
+
+
+if __name__ == "__main__":
+  main()
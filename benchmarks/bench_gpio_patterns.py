@@ -0,0 +1,66 @@
+"""
+Benchmark how long swipe feedback holds the caller, and how precisely the
+PatternEngine keeps pattern timing.
+
+"blocking" is the previous feedback, turn_on(), sleep(0.1), turn_off(), run
+on the read loop. "pattern engine" submits the same beep to a PatternEngine.
+The GPIO is a no-op stand-in, so the figures are the software cost only.
+
+Run with: python -m benchmarks.bench_gpio_patterns
+"""
+
+import time
+
+from src.gpio.gpio_controller import GPIOController
+from src.gpio.patterns import PatternEngine, beep, blink
+
+SWIPES = 20
+
+
+class NullGPIO:
+  BCM = OUT = HIGH = LOW = 0
+
+  def setmode(self, mode):
+    pass
+
+  def setup(self, pin, mode):
+    pass
+
+  def output(self, pin, value):
+    pass
+
+
+def blocking(buzzer):
+  buzzer.turn_on()
+  time.sleep(0.1)
+  buzzer.turn_off()
+
+
+def main():
+  buzzer = GPIOController(NullGPIO(), 16, component_type="BUZZER")
+  led = GPIOController(NullGPIO(), 6)
+
+  start = time.perf_counter()
+  for _ in range(SWIPES):
+    blocking(buzzer)
+  blocking_time = (time.perf_counter() - start) / SWIPES
+
+  engine = PatternEngine()
+  engine.start()
+  engine.play(led, blink(None, on=0.05, off=0.05))
+  held = 0.0
+  for _ in range(SWIPES):
+    start = time.perf_counter()
+    run = engine.play(buzzer, beep(0.1))
+    held += time.perf_counter() - start
+    run.wait()
+  engine.close()
+
+  print(f"{'mode':<16}{'caller held/swipe':>20}")
+  print(f"{'blocking':<16}{blocking_time * 1000:>17.3f} ms")
+  print(f"{'pattern engine':<16}{held / SWIPES * 1000:>17.3f} ms")
+  print(f"\nsteps played: {engine.played}, worst step lateness: {engine.late * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+  main()
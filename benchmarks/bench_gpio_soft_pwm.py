@@ -0,0 +1,100 @@
+"""
+Benchmark the CPU cost of soft PWM status LEDs.
+
+Each scenario runs for DURATION seconds and reports the process CPU time
+used over that time as a percentage of one core. "shared" is SoftPWM, one
+thread driving every LED. "per LED" is the alternative of one thread per
+LED, each running the same on/sleep/off/sleep loop. Steady levels are
+included to show that an LED fully on or off costs nothing. The GPIO is a
+no-op stand-in, so the figures are the software cost only; RPi.GPIO adds
+a few microseconds per write.
+
+Run with: python -m benchmarks.bench_gpio_soft_pwm
+"""
+
+import threading
+import time
+
+from src.gpio.gpio_controller import GPIOController
+from src.gpio.pwm import PWMOutput, SoftPWM
+
+DURATION = 2.0
+FREQUENCY = 100.0
+
+
+class NullGPIO:
+  BCM = OUT = HIGH = LOW = 0
+
+  def setmode(self, mode):
+    pass
+
+  def setup(self, pin, mode):
+    pass
+
+  def output(self, pin, value):
+    pass
+
+
+def measure(run):
+  start_cpu = time.process_time()
+  start = time.perf_counter()
+  run()
+  return (time.process_time() - start_cpu) / (time.perf_counter() - start) * 100
+
+
+def shared(leds, configure):
+  def run():
+    soft_pwm = SoftPWM(FREQUENCY)
+    outputs = [
+      PWMOutput(GPIOController(NullGPIO(), pin), soft_pwm, hardware=False)
+      for pin in range(leds)
+    ]
+    for output in outputs:
+      configure(output)
+    time.sleep(DURATION)
+    soft_pwm.close()
+  return run
+
+
+def per_led(leds, duty):
+  def run():
+    stop = threading.Event()
+
+    def loop(controller):
+      period = 1.0 / FREQUENCY
+      while not stop.is_set():
+        controller.turn_on()
+        time.sleep(period * duty)
+        controller.turn_off()
+        time.sleep(period * (1 - duty))
+
+    threads = [
+      threading.Thread(target=loop, args=(GPIOController(NullGPIO(), pin),))
+      for pin in range(leds)
+    ]
+    for thread in threads:
+      thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+      thread.join()
+  return run
+
+
+def main():
+  scenarios = [
+    ("shared, 2 steady", shared(2, lambda output: output.set_brightness(1.0))),
+    ("shared, 1 at 50% duty", shared(1, lambda output: output.set_brightness(0.73))),
+    ("shared, 2 breathing", shared(2, lambda output: output.breathe(1.5, 0.05, 0.8))),
+    ("shared, 8 breathing", shared(8, lambda output: output.breathe(1.5, 0.05, 0.8))),
+    ("per LED, 2 at 50% duty", per_led(2, 0.5)),
+    ("per LED, 8 at 50% duty", per_led(8, 0.5)),
+  ]
+  print(f"{FREQUENCY:.0f} Hz PWM, {DURATION:.0f} s per scenario\n")
+  print(f"{'scenario':<24}{'CPU':>8}")
+  for name, run in scenarios:
+    print(f"{name:<24}{measure(run):>7.2f}%")
+
+
+if __name__ == "__main__":
+  main()
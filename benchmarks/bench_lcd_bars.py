@@ -0,0 +1,71 @@
+"""
+Benchmark the I2C traffic of probability bar updates with and without the
+CharLCDWriter CGRAM glyph cache.
+
+"upload every update" writes the bitmaps of the bar glyphs used by each
+update to CGRAM before drawing it, as code calling create_char() directly
+would. "glyph cache" uploads a glyph the first time it is needed and keeps
+it resident.
+
+RPLCD runs unmodified on top of a fake SMBus that counts the bytes written
+to the PCF8574 expander.
+
+Run with: python -m benchmarks.bench_lcd_bars
+"""
+
+import random
+import time
+from unittest import mock
+
+import RPLCD.i2c
+
+from benchmarks.bench_lcd_frame_buffer import CountingSMBus
+from src.lcd.glyphs import BAR_GLYPHS, bar_chart
+from src.lcd.implementations.charlcd_writer import CharLCDWriter
+
+LABELS = ["Dog bark", "Siren", "Speech", "Car horn", "Music"]
+UPDATES = 200
+
+
+def predictions(rng):
+  labels = rng.sample(LABELS, 2)
+  first = rng.uniform(0.4, 1.0)
+  return [(labels[0], first), (labels[1], rng.uniform(0.0, 1.0 - first))]
+
+
+def upload_every_update(writer, text):
+  # Only the first glyphs are resident: slots are reassigned per update
+  slots = {char: slot for slot, char in enumerate(sorted(set(text) & set(BAR_GLYPHS)))}
+  for char, slot in slots.items():
+    writer.lcd.create_char(slot, BAR_GLYPHS[char])
+  writer.lcd.clear()
+  writer.lcd.write_string("".join(chr(slots[char]) if char in slots else char for char in text).replace("\n", "\r\n"))
+
+
+def glyph_cache(writer, text):
+  writer.write(text)
+
+
+def run(update):
+  rng = random.Random(1)
+  with mock.patch.object(RPLCD.i2c, "SMBus", CountingSMBus):
+    writer = CharLCDWriter()
+    bus = writer.lcd.bus
+    bus.bytes_written = 0
+    start = time.perf_counter()
+    for _ in range(UPDATES):
+      update(writer, bar_chart(predictions(rng), writer.cols))
+    elapsed = time.perf_counter() - start
+  return bus.bytes_written / UPDATES, elapsed / UPDATES, writer
+
+
+def main():
+  print(f"{'mode':<22}{'I2C bytes/update':>18}{'time/update':>14}{'uploads':>10}")
+  for name, update in (("upload every update", upload_every_update), ("glyph cache", glyph_cache)):
+    per_update, elapsed, writer = run(update)
+    uploads = writer.glyph_uploads if update is glyph_cache else "-"
+    print(f"{name:<22}{per_update:>18.0f}{elapsed * 1000:>11.2f} ms{uploads:>10}")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,83 @@
+"""
+Benchmark display throughput of CharLCDWriter (RPLCD, one SMBus byte write
+per expander byte) against PCF8574BlockWriter (one i2c_rdwr transaction per
+update).
+
+Both writers run on fake buses that count the I2C traffic instead of
+sending it. Time per update is the time spent in the writer, the driver
+sleeps included, plus the bus time of the counted traffic at 100 kHz:
+a byte write is a start, the address, the data byte and a stop (20 bit
+times), and a transaction streams all its bytes after one address.
+
+"full screen" rewrites every cell on each update, which measures raw
+character throughput. "status messages" are the audio loop's messages.
+
+Run with: python -m benchmarks.bench_lcd_block_writes
+"""
+
+import time
+from unittest import mock
+
+import RPLCD.i2c
+
+from src.lcd.implementations import pcf8574_writer
+from src.lcd.implementations.charlcd_writer import CharLCDWriter
+from src.lcd.implementations.pcf8574_writer import PCF8574BlockWriter
+
+BUS_HZ = 100000
+UPDATES = 40
+SCENARIOS = {
+  "full screen": ["ABCDEFGHIJKLMNOPQRSTUVWXYZ012345", "abcdefghijklmnopqrstuvwxyz6789!?"],
+  "status messages": ["Processing audio...", "Audio: Dog bark", "Confidence: 0.87", "Audio: Siren"],
+}
+
+
+class ByteWriteBus:
+  def __init__(self, port):
+    self.bits = 0
+
+  def write_byte(self, address, value):
+    self.bits += 20
+
+  def close(self):
+    pass
+
+
+class BlockWriteBus:
+  def __init__(self, port):
+    self.bits = 0
+
+  def i2c_rdwr(self, *messages):
+    for message in messages:
+      self.bits += 2 + 9 * (1 + message.len)
+
+  def close(self):
+    pass
+
+
+def run(create, messages):
+  with mock.patch.object(RPLCD.i2c, "SMBus", ByteWriteBus), \
+      mock.patch.object(pcf8574_writer, "SMBus", BlockWriteBus):
+    writer = create()
+    bus = writer.lcd.bus
+    bus.bits = 0
+    chars = 0
+    start = time.perf_counter()
+    for index in range(UPDATES):
+      message = messages[index % len(messages)]
+      writer.write(message)
+      chars += len(message)
+    elapsed = time.perf_counter() - start + bus.bits / BUS_HZ
+  return chars / elapsed, UPDATES / elapsed, writer.i2c_bytes / UPDATES
+
+
+def main():
+  print(f"{'scenario':<18}{'writer':<22}{'chars/s':>10}{'updates/s':>12}{'I2C bytes/update':>18}")
+  for scenario, messages in SCENARIOS.items():
+    for name, create in (("CharLCDWriter", CharLCDWriter), ("PCF8574BlockWriter", PCF8574BlockWriter)):
+      chars_per_second, updates_per_second, per_update = run(create, messages)
+      print(f"{scenario:<18}{name:<22}{chars_per_second:>10.0f}{updates_per_second:>12.1f}{per_update:>18.0f}")
+
+
+if __name__ == "__main__":
+  main()
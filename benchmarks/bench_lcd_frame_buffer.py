@@ -0,0 +1,95 @@
+"""
+Benchmark the I2C traffic of display updates with and without the
+CharLCDWriter frame buffer.
+
+RPLCD runs unmodified on top of a fake SMBus that counts the bytes written
+to the PCF8574 expander. "clear + write" reproduces the previous writer,
+which cleared the display and wrote the whole string on every update.
+
+"status messages" are the audio loop's one-line messages, which share
+little text, so the frame buffer mostly falls back to clear and redraw.
+"result refresh" keeps the label and class on screen and only updates the
+confidence, which is where rewriting changed cells pays off.
+
+Run with: python -m benchmarks.bench_lcd_frame_buffer
+"""
+
+import time
+from unittest import mock
+
+import RPLCD.i2c
+
+from src.lcd.implementations.charlcd_writer import CharLCDWriter
+
+SCENARIOS = {
+  "status messages": [
+    "Processing audio...",
+    "Audio: Dog bark",
+    "Confidence: 0.87",
+    "Processing audio...",
+    "Audio: Dog bark",
+    "Confidence: 0.91",
+    "Processing audio...",
+    "Audio: Siren",
+    "Confidence: 0.64",
+  ],
+  "result refresh": [
+    "Audio: Dog bark\nConfidence: 0.87",
+    "Audio: Dog bark\nConfidence: 0.91",
+    "Audio: Dog bark\nConfidence: 0.90",
+    "Audio: Siren\nConfidence: 0.64",
+    "Audio: Siren\nConfidence: 0.71",
+    "Audio: Siren\nConfidence: 0.73",
+  ],
+}
+CYCLES = 5
+
+
+class CountingSMBus:
+  def __init__(self, port):
+    self.bytes_written = 0
+
+  def write_byte(self, address, value):
+    self.bytes_written += 1
+
+  def write_byte_data(self, address, register, value):
+    self.bytes_written += 2
+
+  def close(self):
+    pass
+
+
+def run(update, messages):
+  with mock.patch.object(RPLCD.i2c, "SMBus", CountingSMBus):
+    writer = CharLCDWriter()
+    bus = writer.lcd.bus
+    bus.bytes_written = 0
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+      for message in messages:
+        update(writer, message)
+    elapsed = time.perf_counter() - start
+  updates = CYCLES * len(messages)
+  return bus.bytes_written / updates, elapsed / updates, writer
+
+
+def clear_and_write(writer, message):
+  writer.lcd.clear()
+  writer.lcd.write_string(message.replace("\n", "\r\n"))
+
+
+def frame_buffer(writer, message):
+  writer.write(message)
+
+
+def main():
+  print(f"{'scenario':<18}{'mode':<16}{'I2C bytes/update':>18}{'counted':>10}{'time/update':>14}")
+  for scenario, messages in SCENARIOS.items():
+    for name, update in (("clear + write", clear_and_write), ("frame buffer", frame_buffer)):
+      per_update, elapsed, writer = run(update, messages)
+      counted = writer.i2c_bytes / (CYCLES * len(messages))
+      print(f"{scenario:<18}{name:<16}{per_update:>18.0f}{counted:>10.0f}{elapsed * 1000:>11.2f} ms")
+
+
+if __name__ == "__main__":
+  main()
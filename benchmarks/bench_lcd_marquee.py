@@ -0,0 +1,92 @@
+"""
+Benchmark marquee scrolling of a message longer than the display.
+
+"recompute + redraw" builds each scroll step's text by slicing the message
+again and redraws the display with clear and write_string, as a naive
+marquee would. "cached frames" plays the frames from message_frames(),
+computed once per message, through the CharLCDWriter frame buffer, which
+rewrites only the cells that changed.
+
+RPLCD runs unmodified on top of a fake SMBus that counts the bytes written
+to the PCF8574 expander.
+
+Run with: python -m benchmarks.bench_lcd_marquee
+"""
+
+import time
+from unittest import mock
+
+import RPLCD.i2c
+
+from benchmarks.bench_lcd_frame_buffer import CountingSMBus
+from src.lcd.frame import message_frames
+from src.lcd.implementations.charlcd_writer import CharLCDWriter
+
+MESSAGES = [
+  "Audio: Emergency vehicle siren, confidence 0.92",
+  "Unrecognised card, please present it again",
+]
+CYCLES = 3
+COMPUTE_ROUNDS = 2000
+
+
+def naive_frames(text, cols, rows, gap=4):
+  loop = " ".join(text.split()) + " " * gap
+  doubled = loop * (cols // len(loop) + 2)
+  return [doubled[step:step + cols] for step in range(len(loop))]
+
+
+def recompute_and_redraw(writer, text):
+  steps = 0
+  for _ in range(CYCLES):
+    for line in naive_frames(text, writer.cols, writer.rows):
+      writer.lcd.clear()
+      writer.lcd.write_string(line)
+      steps += 1
+  return steps
+
+
+def cached_frames(writer, text):
+  steps = 0
+  for _ in range(CYCLES):
+    for frame in message_frames(text, writer.cols, writer.rows):
+      writer.write_lines(frame)
+      steps += 1
+  return steps
+
+
+def run(play):
+  with mock.patch.object(RPLCD.i2c, "SMBus", CountingSMBus):
+    writer = CharLCDWriter()
+    bus = writer.lcd.bus
+    bus.bytes_written = 0
+    steps = 0
+    start = time.perf_counter()
+    for text in MESSAGES:
+      steps += play(writer, text)
+    elapsed = time.perf_counter() - start
+  return bus.bytes_written / steps, elapsed / steps
+
+
+def compute(frames_for):
+  start = time.perf_counter()
+  for _ in range(COMPUTE_ROUNDS):
+    for text in MESSAGES:
+      frames_for(text, 16, 2)
+  return (time.perf_counter() - start) / (COMPUTE_ROUNDS * len(MESSAGES))
+
+
+def main():
+  print(f"{'mode':<22}{'I2C bytes/step':>16}{'time/step':>14}")
+  for name, play in (("recompute + redraw", recompute_and_redraw), ("cached frames", cached_frames)):
+    per_step, elapsed = run(play)
+    print(f"{name:<22}{per_step:>16.0f}{elapsed * 1000:>11.3f} ms")
+
+  print()
+  uncached = compute(message_frames.__wrapped__)
+  cached = compute(message_frames)
+  print(f"frame computation per message: uncached {uncached * 1e6:.1f} us, cached {cached * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,41 @@
+"""
+Benchmark the overhead of ReadPathMetrics on the read path, using the
+simulated MFRC522 chip with zero transaction cost so that only the Python
+work of the read path and the timing hooks is measured.
+
+Run with: python -m benchmarks.bench_reader_instrumentation
+"""
+
+import time
+
+from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.instrumentation import ReadPathMetrics
+from src.reader.reader_service import ReaderService
+from src.reader.simulation import SimulatedMFRC522
+
+READS = 20000
+UID = [0x12, 0x34, 0x56, 0x78, 0x08]
+
+
+def run(metrics):
+  chip = SimulatedMFRC522(request_timeout=0.0, transaction_time=0.0)
+  chip.present(UID)
+  service = ReaderService(reader=MFRC522Reader(chip=chip, metrics=metrics), metrics=metrics)
+  with service:
+    start = time.perf_counter()
+    for _ in range(READS):
+      service.read()
+    return (time.perf_counter() - start) / READS
+
+
+def main():
+  plain = run(None)
+  metrics = ReadPathMetrics()
+  instrumented = run(metrics)
+  print(f"without metrics: {plain * 1e6:.2f} us per read")
+  print(f"with metrics:    {instrumented * 1e6:.2f} us per read (+{(instrumented - plain) * 1e6:.2f} us)")
+  print(metrics.format())
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,54 @@
+"""
+Benchmark one inventory cycle against the number of tags in the field, using
+the simulated MFRC522 chip.
+
+Each enumerated tag costs an anticollision, a SELECT and a HALT with a
+shortened timer, and the cycle ends with one request that nobody answers,
+so the cycle time should grow linearly with the tag count.
+
+Run with: python -m benchmarks.bench_reader_inventory
+"""
+
+import time
+
+from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.simulation import SimulatedMFRC522
+
+CYCLES = 50
+MAX_TAGS = 8
+REQUEST_TIMEOUT = 0.015
+TRANSACTION_TIME = 0.001
+
+
+def make_uid(index):
+  uid = [0x04, 0x10 + index, 0x20, 0x30]
+  bcc = 0
+  for byte in uid:
+    bcc ^= byte
+  return uid + [bcc]
+
+
+def inventory_cycle(tag_count, cycles=CYCLES):
+  chip = SimulatedMFRC522(request_timeout=REQUEST_TIMEOUT, transaction_time=TRANSACTION_TIME)
+  for index in range(tag_count):
+    chip.present(make_uid(index))
+  reader = MFRC522Reader(chip=chip, max_tags=MAX_TAGS)
+  found = 0
+  start = time.perf_counter()
+  for _ in range(cycles):
+    found = len(reader.inventory())
+  return (time.perf_counter() - start) / cycles, found, chip.transactions / cycles
+
+
+def main():
+  print(f"{'tags':>6}{'found':>8}{'per cycle':>14}{'per tag':>12}{'transactions':>14}")
+  for tag_count in range(1, MAX_TAGS + 1):
+    cycle, found, transactions = inventory_cycle(tag_count)
+    print(
+      f"{tag_count:>6}{found:>8}{cycle * 1000:>11.3f} ms"
+      f"{cycle / tag_count * 1000:>9.3f} ms{transactions:>14.1f}"
+    )
+
+
+if __name__ == "__main__":
+  main()
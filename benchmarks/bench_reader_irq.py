@@ -0,0 +1,69 @@
+"""
+Benchmark tag detection latency and CPU use of MFRC522Reader.wait_for_tag()
+in polling mode versus IRQ mode, using the simulated chip and fake IRQ pin.
+
+Run with: python -m benchmarks.bench_reader_irq
+"""
+
+import random
+import statistics
+import threading
+import time
+
+from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.irq import FakeIRQBackend
+from src.reader.simulation import SimulatedMFRC522
+
+SWIPES = 20
+UID = [0x12, 0x34, 0x56, 0x78, 0x08]
+
+
+def run(mode, swipes=SWIPES, seed=1):
+  rng = random.Random(seed)
+  irq = FakeIRQBackend() if mode == "irq" else None
+  chip = SimulatedMFRC522(irq=irq)
+  reader = MFRC522Reader(chip=chip, irq=irq)
+  latencies = []
+  presented_at = [None]
+
+  def swiper():
+    for _ in range(swipes):
+      time.sleep(rng.uniform(0.05, 0.25))
+      presented_at[0] = time.perf_counter()
+      chip.present(UID)
+      time.sleep(0.3)
+      chip.remove(UID)
+
+  thread = threading.Thread(target=swiper)
+  wall_start = time.perf_counter()
+  cpu_start = time.process_time()
+  thread.start()
+  while len(latencies) < swipes:
+    try:
+      reader.wait_for_tag(timeout=1.0, poll_interval=0.1)
+    except Exception:
+      continue
+    latencies.append(time.perf_counter() - presented_at[0])
+    while chip.tags:
+      time.sleep(0.01)
+  thread.join()
+  wall = time.perf_counter() - wall_start
+  cpu = time.process_time() - cpu_start
+  return {
+    "mode": mode,
+    "mean_ms": statistics.mean(latencies) * 1000,
+    "max_ms": max(latencies) * 1000,
+    "cpu_pct": cpu / wall * 100,
+    "transactions": chip.transactions,
+  }
+
+
+def main():
+  print(f"{'mode':<8}{'mean latency':>14}{'max latency':>14}{'cpu':>8}{'transactions':>14}")
+  for mode in ("poll", "irq"):
+    r = run(mode)
+    print(f"{r['mode']:<8}{r['mean_ms']:>11.1f} ms{r['max_ms']:>11.1f} ms{r['cpu_pct']:>7.1f}%{r['transactions']:>14}")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,53 @@
+"""
+Benchmark fixed-rate polling against the adaptive poll scheduler during an
+idle period, using the simulated MFRC522 chip with no tag in the field.
+
+Intervals are scaled down by 10 from the values used in main.py, so one
+second of run time stands for ten seconds of an idle station.
+
+Run with: python -m benchmarks.bench_reader_scheduler
+"""
+
+import time
+
+from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.reader_service import ReaderService
+from src.reader.scheduler import AdaptivePollScheduler
+from src.reader.simulation import SimulatedMFRC522
+
+DURATION = 3.0
+POLL_INTERVAL = 0.01
+MAX_INTERVAL = 0.1
+IDLE_AFTER = 0.5
+REQUEST_TIMEOUT = 0.0015
+
+
+def run(scheduler):
+  chip = SimulatedMFRC522(request_timeout=REQUEST_TIMEOUT)
+  service = ReaderService(reader=MFRC522Reader(chip=chip), poll_interval=POLL_INTERVAL, scheduler=scheduler)
+  if scheduler is not None:
+    scheduler.set_active(False)
+  start_cpu = time.process_time()
+  with service:
+    service.wait_for_tag(timeout=DURATION)
+  cpu = time.process_time() - start_cpu
+  return chip.transactions, cpu / DURATION
+
+
+def main():
+  print(f"{'mode':<12}{'polls':>8}{'polls/s':>10}{'CPU':>8}")
+  modes = (
+    ("fixed", None),
+    ("adaptive", AdaptivePollScheduler(
+      min_interval=POLL_INTERVAL, max_interval=MAX_INTERVAL, idle_after=IDLE_AFTER,
+    )),
+  )
+  for name, scheduler in modes:
+    polls, cpu = run(scheduler)
+    print(f"{name:<12}{polls:>8}{polls / DURATION:>10.1f}{cpu * 100:>7.1f}%")
+    if scheduler is not None:
+      print(f"  scheduler: {scheduler.stats()}")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,57 @@
+"""
+Benchmark the cost of one poll cycle with and without a persistent reader
+session, using the simulated MFRC522 chip.
+
+"per-poll cleanup" reproduces the old ReaderService behaviour, which cleaned
+the reader up after every read and so re-initialised it on the next one.
+"session" keeps the reader open for the whole run.
+
+Run with: python -m benchmarks.bench_reader_session
+"""
+
+import time
+
+from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.reader_service import ReaderService
+from src.reader.simulation import SimulatedMFRC522
+
+POLLS = 200
+# The chip initialisation writes ~10 registers after a soft reset; together
+# with re-opening SPI this is modelled as 2 ms.
+INIT_TIME = 0.002
+REQUEST_TIMEOUT = 0.001
+
+
+def make_reader():
+  chip = SimulatedMFRC522(request_timeout=REQUEST_TIMEOUT, init_time=INIT_TIME)
+  return chip, MFRC522Reader(chip=chip)
+
+
+def per_poll_cleanup(polls=POLLS):
+  chip, reader = make_reader()
+  service = ReaderService(reader=reader)
+  start = time.perf_counter()
+  for _ in range(polls):
+    service.read()
+    service.close()
+  return (time.perf_counter() - start) / polls, chip.init_count
+
+
+def session(polls=POLLS):
+  chip, reader = make_reader()
+  start = time.perf_counter()
+  with ReaderService(reader=reader) as service:
+    for _ in range(polls):
+      service.read()
+  return (time.perf_counter() - start) / polls, chip.init_count
+
+
+def main():
+  print(f"{'mode':<20}{'per poll':>12}{'chip inits':>12}")
+  for name, run in (("per-poll cleanup", per_poll_cleanup), ("session", session)):
+    cycle, inits = run()
+    print(f"{name:<20}{cycle * 1000:>9.3f} ms{inits:>12}")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,79 @@
+"""
+Benchmark the swipe pipeline (reader service, debouncer, authorisation)
+by replaying a synthetic trace with ReplayReader.
+
+"as fast as possible" measures the pipeline's throughput with no reader
+latency at all. The paced runs replay the trace at 10x and 50x and report
+how late each event is delivered relative to its scheduled time.
+
+Run with: python -m benchmarks.bench_swipe_pipeline
+"""
+
+import os
+import json
+import statistics
+import tempfile
+import time
+
+from src.reader.authorization import AuthorizationIndex
+from src.reader.debounce import TagDebouncer
+from src.reader.events import TagEventType
+from src.reader.implementations.replay_reader import ReplayReader
+from src.reader.reader_service import ReaderService
+
+SWIPES = 2000
+BADGES = 500
+SWIPE_INTERVAL = 0.5
+
+
+def make_trace(swipes=SWIPES, interval=SWIPE_INTERVAL):
+  # Each swipe is a distinct badge so the debouncer reports every one
+  return [
+    {"t": i * interval, "uid": [0x04, (i >> 8) & 0xFF, i & 0xFF, 0x30, 0x00], "text": ""}
+    for i in range(swipes)
+  ]
+
+
+def make_index(trace):
+  fd, path = tempfile.mkstemp(suffix=".json")
+  with os.fdopen(fd, "w") as f:
+    json.dump({"allow": [entry["uid"] for entry in trace[:BADGES]]}, f)
+  index = AuthorizationIndex(path)
+  index.load()
+  os.remove(path)
+  return index
+
+
+def run(trace, speed, index):
+  reader = ReplayReader(trace, speed=speed)
+  service = ReaderService(reader=reader, debouncer=TagDebouncer(presence_timeout=0, hold_off=0, max_entries=64))
+  lateness = []
+  authorised = 0
+  start = time.monotonic()
+  with service:
+    while not reader.finished:
+      for event in service.poll_events(timeout=1.0):
+        if event.kind != TagEventType.ARRIVED:
+          continue
+        authorised += index.is_authorized(event.uid)
+        if speed is not None:
+          entry = trace[reader.position - 1]
+          lateness.append(time.monotonic() - start - entry["t"] / speed)
+  return time.monotonic() - start, lateness, authorised
+
+
+def main():
+  trace = make_trace()
+  index = make_index(trace)
+  elapsed, _, authorised = run(trace, None, index)
+  print(f"as fast as possible: {SWIPES / elapsed:,.0f} swipes/s, {authorised} authorised")
+  for speed, swipes in ((10, 100), (50, 500)):
+    elapsed, lateness, _ = run(trace[:swipes], speed, index)
+    print(
+      f"{speed}x: {swipes} swipes in {elapsed:.2f} s, lateness"
+      f" median {statistics.median(lateness) * 1000:.2f} ms, max {max(lateness) * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+  main()
@@ -1,14 +1,24 @@
 from src.reader.reader_service import ReaderService
+from src.reader.multi_reader_service import MultiReaderService
 from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.irq import GPIOIRQBackend
+from src.reader.debounce import TagDebouncer
+from src.reader.scheduler import AdaptivePollScheduler
+from src.reader.authorization import AuthorizationIndex
+from src.reader.instrumentation import ReadPathMetrics
+from src.reader.events import TagEventType
+from src.reader.uid import num_to_uid
 
 from src.lcd.lcd_service import LCDService
 from src.lcd.implementations.charlcd_writer import CharLCDWriter
 
-from src.gpio.gpio_controller import GPIOController
+from src.gpio.registry import GPIORegistry
+from src.gpio.pwm import StatusLED
+from src.gpio.patterns import PatternEngine, beep, double_beep
 from src.audio_client import AudioServiceClient
+from src.audio_pipeline import AudioPipeline, CoverageMeter
 from fp_mqtt_broker.factories import BrokerFactory
 from RPi import GPIO
-from time import sleep
 
 import logging
 import threading
@@ -21,85 +31,193 @@ logger = logging.getLogger(__name__)
 RED_LED_PIN = 5
 GREEN_LED_PIN = 6
 BUZZER_PIN = 16
+TAG_WAIT_TIMEOUT = 1.0
+TAG_PRESENCE_TIMEOUT = 1.5
+TAG_HOLD_OFF = 3.0
+MESSAGE_DISPLAY_TIME = 3.0
+RESULT_DISPLAY_TIME = 2.0
+# Audio results are taken down once the next one is overdue, so none outlives its session
+RESULT_SHOW_TIME = 10.0
+STATUS_DISPLAY_TIME = 2.0
+# LCD message priorities, swipe feedback wins over audio results
+PRIORITY_STATUS = 0
+PRIORITY_AUDIO = 1
+PRIORITY_SWIPE = 2
+POLL_MIN_INTERVAL = 0.1
+POLL_MAX_INTERVAL = 1.0
+POLL_IDLE_AFTER = 30.0
+ACCESS_RELOAD_INTERVAL = 1.0
+AUDIO_WINDOW = 5
 IS_READING = False
 
-def audio_processing_loop(audio_client, lcd_service, logger):
-  """Continuously process audio in background while IS_READING is True"""
-  global IS_READING
+def show_audio_result(result, lcd_service, logger):
+  """Show an audio result on the LCD, the prediction then its probability bars"""
+  if result and result.get('success'):
+    predicted_class = result.get('predicted_class', 'Unknown')
+    confidence = result.get('confidence', 0)
+    
+    predictions = [(p['class_name'], p['probability']) for p in result.get('top_predictions', [])]
+    
+    # Display prediction on LCD, the probability bars follow once the class has been shown
+    lcd_service.post(
+      f"Audio: {predicted_class}",
+      priority=PRIORITY_AUDIO,
+      min_display=RESULT_DISPLAY_TIME,
+      duration=RESULT_SHOW_TIME,
+    )
+    lcd_service.post(
+      lcd_service.bar_text(predictions or [(predicted_class, confidence)]),
+      priority=PRIORITY_AUDIO,
+      min_display=RESULT_DISPLAY_TIME,
+      duration=RESULT_SHOW_TIME,
+    )
+    
+    logger.info(f"Audio prediction: {predicted_class} (confidence: {confidence:.2f})")
+  else:
+    lcd_service.post(
+      "Audio processing failed",
+      priority=PRIORITY_AUDIO,
+      min_display=RESULT_DISPLAY_TIME,
+      duration=RESULT_SHOW_TIME,
+    )
+    error_msg = result.get('error_message', 'Unknown error') if result else 'No response'
+    logger.error(f"Audio processing failed: {error_msg}")
+
+def audio_streaming_loop(audio_client, present, coverage, logger, stopped):
+  """Present the prediction of every window of one continuous stream until the session is stopped"""
+  logger.info("Streaming audio classifications via gRPC")
+  stream = audio_client.stream_classifications(window_duration=AUDIO_WINDOW)
+  try:
+    for result in stream:
+      if stopped.is_set():
+        break
+      if result.get('success'):
+        coverage.add(result['window_end'] - result['window_start'])
+      present(result)
+  finally:
+    stream.close()
+
+def audio_processing_loop(audio_client, lcd_service, logger, stopped, publish=None):
+  """Continuously process audio in background until the session's stopped event is set"""
+  def present(result):
+    # The call in flight when the session stopped must not show up after "Goodbye!"
+    if stopped.is_set():
+      return
+    show_audio_result(result, lcd_service, logger)
+    if publish is not None and result:
+      publish(result)
+
+  lcd_service.post("Processing audio...", priority=PRIORITY_AUDIO)
+  coverage = CoverageMeter()
+  coverage.start()
   
-  while IS_READING:
+  # One stream covers the whole session, one call per recording is the fallback
+  # for services without streaming or when the stream breaks
+  if audio_client.streaming_supported:
     try:
-      # Trigger audio recording and prediction via gRPC
-      lcd_service.write("Processing audio...")
-      logger.info("Triggering audio recording and prediction via gRPC")
-      
-      result = audio_client.start_audio_processing(duration=5)
-      if result and result.get('success'):
-        predicted_class = result.get('predicted_class', 'Unknown')
-        confidence = result.get('confidence', 0)
-        
-        # Display prediction on LCD
-        lcd_service.clear()
-        lcd_service.write(f"Audio: {predicted_class}")
-        sleep(2)
-        lcd_service.write(f"Confidence: {confidence:.2f}")
-        
-        logger.info(f"Audio prediction: {predicted_class} (confidence: {confidence:.2f})")
-      else:
-        lcd_service.write("Audio processing failed")
-        error_msg = result.get('error_message', 'Unknown error') if result else 'No response'
-        logger.error(f"Audio processing failed: {error_msg}")
-      
-      # Small delay before next iteration (only if still reading)
-      if IS_READING:
-        sleep(1)
-        
+      audio_streaming_loop(audio_client, present, coverage, logger, stopped)
     except Exception as e:
-      lcd_service.write("Audio error")
-      logger.error(f"Audio processing error: {e}")
-      if IS_READING:
-        sleep(1)
+      logger.error(f"Audio streaming error: {e}")
+  
+  # A stream cancelled by the stop swipe ends the session, only a broken one falls back
+  if not stopped.is_set():
+    # Record back to back, results are shown and published on their own thread
+    logger.info("Triggering audio recording and prediction via gRPC")
+    pipeline = AudioPipeline(audio_client, present, duration=AUDIO_WINDOW, coverage=coverage)
+    pipeline.run(keep_running=lambda: not stopped.is_set())
+    if pipeline.dropped:
+      logger.info(f"Audio results dropped while the display was busy: {pipeline.dropped}")
   
-  # When exiting the loop, clear the display
-  lcd_service.clear()
-  logger.info("Audio processing loop ended")
+  coverage.stop()
+  stats = coverage.stats()
+  logger.info(
+    f"Audio processing loop ended, recorded {stats['recorded_seconds']:.0f} s"
+    f" of {stats['elapsed_seconds']:.0f} s ({stats['coverage']:.0%} coverage)"
+  )
 
 with open('config.json', 'r') as config_file:
   config = json.load(config_file)
 
 def main():
-  red_led = GPIOController(GPIO, RED_LED_PIN)
-  red_led.turn_on()
+  # Sets the GPIO mode once and turns every output off at shutdown
+  gpio = GPIORegistry(GPIO)
+  red_led = gpio.controller(RED_LED_PIN, initial=True)
+  # The green LED shows the session state as a brightness or a breathing rhythm.
+  # Only this thread sets it, so a quick stop swipe always leaves it off.
+  green_led = StatusLED(gpio.pwm(GREEN_LED_PIN))
 
-  green_led = GPIOController(GPIO, GREEN_LED_PIN)
-  green_led.turn_off()
-
-  buzzer = GPIOController(GPIO, BUZZER_PIN, component_type="BUZZER")
+  buzzer = gpio.controller(BUZZER_PIN, component_type="BUZZER", initial=False)
+  # Beeps and blinks play on their own thread so feedback never stalls the read loop
+  patterns = PatternEngine()
+  gpio.on_shutdown(patterns.close)
 
   lcd_writer = CharLCDWriter(
     i2c_expander='PCF8574',
     address=0x27,
   )
-  lcd_service = LCDService(lcd_writer)
-  lcd_service.write("RFID Reader started")
+  # Draw on a render thread so slow I2C never stalls the reader or audio loops
+  lcd_service = LCDService(lcd_writer, asynchronous=True)
+  lcd_service.post("RFID Reader started", min_display=STATUS_DISPLAY_TIME)
 
   # Initialize audio service client (uses AUDIO_SERVICE_URL env var)
   audio_client = AudioServiceClient()
   
   # Wait for audio service to be available
-  lcd_service.write("Waiting for audio...")
-  if not audio_client.wait_for_service():
-    lcd_service.write("Audio service unavailable")
+  lcd_service.post("Waiting for audio...")
+  green_led.set("connecting")
+  ready = audio_client.wait_for_service()
+  green_led.set("off")
+  if not ready:
+    lcd_service.post("Audio service unavailable", min_display=STATUS_DISPLAY_TIME)
     logger.error("Audio service is not available")
   else:
-    lcd_service.write("Audio service ready")
-    sleep(2)
-    lcd_service.clear()
+    lcd_service.post("Audio service ready", min_display=STATUS_DISPLAY_TIME, duration=STATUS_DISPLAY_TIME)
 
-  reader = MFRC522Reader()
-  reader_service = ReaderService(
-    reader=reader,
-  )
+  reader_services = []
+  for reader_config in config['readers']:
+    # Readers without an IRQ line are polled, at a rate that backs off when idle.
+    # Readers with one re-arm at a fixed rate, the scheduler does not apply to them.
+    irq = None
+    scheduler = None
+    if 'pin_irq' in reader_config:
+      irq = GPIOIRQBackend(GPIO, reader_config['pin_irq'])
+    else:
+      scheduler = AdaptivePollScheduler(
+        min_interval=POLL_MIN_INTERVAL,
+        max_interval=POLL_MAX_INTERVAL,
+        idle_after=POLL_IDLE_AFTER,
+      )
+    metrics = ReadPathMetrics()
+    reader = MFRC522Reader(
+      irq=irq,
+      metrics=metrics,
+      bus=reader_config.get('bus', 0),
+      device=reader_config.get('device', 0),
+      pin_rst=reader_config.get('pin_rst', -1),
+    )
+    reader_services.append(ReaderService(
+      reader=reader,
+      reader_id=reader_config['id'],
+      debouncer=TagDebouncer(
+        presence_timeout=TAG_PRESENCE_TIMEOUT,
+        hold_off=TAG_HOLD_OFF,
+      ),
+      scheduler=scheduler,
+      metrics=metrics,
+    ))
+  readers = MultiReaderService(reader_services, poll_timeout=TAG_WAIT_TIMEOUT)
+  readers.start()
+
+  # Without an access list every badge may start a session
+  access = None
+  if 'access' in config:
+    access = AuthorizationIndex(
+      config['access']['file'],
+      use_bloom=config['access'].get('bloom', False),
+    )
+    access.load()
+    access.start_watching(interval=config['access'].get('reload_interval', ACCESS_RELOAD_INTERVAL))
+    logger.info(f"Loaded access list with {len(access)} entries")
 
   # Initialize MQTT broker
   mqtt_broker = BrokerFactory.create_broker(
@@ -113,57 +231,90 @@ def main():
     logger.error("Failed to start MQTT broker")
     return
 
-  lcd_service.write("MQTT Broker ready")
+  lcd_service.post("MQTT Broker ready", min_display=STATUS_DISPLAY_TIME, duration=STATUS_DISPLAY_TIME)
+
+  # Audio results are published when a topic is configured for them
+  publish_audio_result = None
+  if 'audio_results' in config['mqtt']['topics']:
+    def publish_audio_result(result):
+      mqtt_broker.publish_message(
+        topic=config['mqtt']['topics']['audio_results'],
+        payload=json.dumps(result)
+      )
 
   while True:
     try:
-      id, text = reader_service.read()
       global IS_READING
-      if id is not None:
-        lcd_service.clear()
-        buzzer.turn_on()
-        sleep(0.1)  # Buzzer on for 0.1 seconds
-        buzzer.turn_off()
-        if not IS_READING:
-          lcd_service.write("Welcome!")
+      for event in readers.get_events(timeout=TAG_WAIT_TIMEOUT):
+        if event.kind != TagEventType.ARRIVED:
+          continue
+        id = event.uid
+        if access is not None and not access.is_authorized(id):
+          patterns.play(buzzer, double_beep())
+          logger.info(f"Access denied for badge {id}")
+          lcd_service.post("Access denied", priority=PRIORITY_SWIPE, min_display=MESSAGE_DISPLAY_TIME, duration=MESSAGE_DISPLAY_TIME)
+        elif not IS_READING:
+          patterns.play(buzzer, beep(0.1))
+          lcd_service.post("Welcome!", priority=PRIORITY_SWIPE, min_display=MESSAGE_DISPLAY_TIME, duration=MESSAGE_DISPLAY_TIME)
           IS_READING = True
+          readers.set_active(True)
           red_led.turn_off()
-          green_led.turn_on()
+          green_led.set("recording")
 
-          # Start audio processing in background thread
+          # Start audio processing in background thread, each session has its own
+          # stop event so a thread still finishing an old session never runs on
+          session_stopped = threading.Event()
           audio_thread = threading.Thread(
             target=audio_processing_loop,
-            args=(audio_client, lcd_service, logger)
+            args=(audio_client, lcd_service, logger, session_stopped, publish_audio_result)
           )
           audio_thread.daemon = True  # Thread will exit when main program exits
           audio_thread.start()
 
           mqtt_broker.publish_message(
             topic=config['mqtt']['topics']['recording_control'],
-            payload=json.dumps({"action": "start", "session_id": id})
+            payload=json.dumps({"action": "start", "session_id": num_to_uid(id)})
           )
           
         else:
           # Second RFID swipe - stop the audio processing
-          lcd_service.write("Goodbye!")
-          IS_READING = False  # This will cause the background loop to exit
+          patterns.play(buzzer, beep(0.1))
+          lcd_service.post("Goodbye!", priority=PRIORITY_SWIPE, min_display=MESSAGE_DISPLAY_TIME, duration=MESSAGE_DISPLAY_TIME)
+          IS_READING = False
+          # Set before cancelling so the audio loop does not fall back to single calls
+          session_stopped.set()
+          audio_client.cancel_streams()
+          readers.set_active(False)
           red_led.turn_on()
-          green_led.turn_off()
+          green_led.set("off")
 
           mqtt_broker.publish_message(
             topic=config['mqtt']['topics']['recording_control'],
-            payload=json.dumps({"action": "stop", "session_id": id})
+            payload=json.dumps({"action": "stop", "session_id": num_to_uid(id)})
           )
-        sleep(3)
-        lcd_service.clear()
-      else:
-        sleep(0.1)  # Wait before retrying if no tag is detected
     except KeyboardInterrupt:
       print("Exiting...")
       break
     except Exception as e:
       print(f"An error occurred: {e}")
-  GPIO.cleanup()  # Clean up GPIO settings on exit
+  readers.stop()
+  logger.info(f"Reader stats: {readers.stats()}")
+  for service in readers.services:
+    logger.info(f"Read path latency for {service.reader_id} (ms):\n{service.metrics.format()}")
+  if access is not None:
+    access.stop_watching()
+  logger.info(
+    f"LCD frames: {lcd_service.rendered_frames} drawn, {lcd_service.dropped_frames} dropped,"
+    f" {lcd_service.skipped_updates} skipped as unchanged, max queue depth {lcd_service.max_queue_depth},"
+    f" {lcd_service.contentions} contended"
+  )
+  lcd_service.close()
+  logger.info(
+    f"GPIO writes: {sum(c.writes for c in gpio.bank.controllers)} sent,"
+    f" {sum(c.skipped_writes for c in gpio.bank.controllers)} skipped as unchanged"
+  )
+  # Stops the patterns and the soft PWM, then turns every output off and releases the pins
+  logger.info(f"GPIO shutdown took {gpio.shutdown() * 1000:.2f} ms")
   
   # Close audio client connection
   try:
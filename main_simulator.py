@@ -1,13 +1,22 @@
 """
 RFID Service Simulator - For testing without hardware
 Simulates RFID card detection and communicates with audio service via gRPC
+
+Set RFID_TRACE to a trace recorded with RecordingReader to replay real swipes
+instead of random card ids, and RFID_TRACE_SPEED to replay it faster.
 """
 
+import os
 import time
 import logging
 import uuid
 import threading
 from src.audio_client import AudioServiceClient
+from src.lcd.lcd_service import LCDService
+from src.lcd.implementations.virtual_lcd_writer import VirtualLCDWriter
+from src.reader.reader_service import ReaderService
+from src.reader.implementations.replay_reader import ReplayReader
+from src.reader.uid import uid_to_num
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,16 +26,30 @@ logger = logging.getLogger(__name__)
 class RFIDSimulator:
     """Simulate RFID reader behavior for testing"""
     
-    def __init__(self):
+    def __init__(self, trace=None, speed=1.0):
         self.is_reading = False
         self.simulation_interval = 10  # seconds between simulated card detections
+
+        # Replay recorded swipes when a trace is given
+        self.replay_reader = ReplayReader(trace, speed=speed) if trace else None
+
+        # Emulated 16x2 display, every update is printed as it would look
+        self.lcd_service = LCDService(VirtualLCDWriter(on_update=self.print_lcd_update))
         
         # Initialize audio service client (uses AUDIO_SERVICE_URL env var)
         self.audio_client = AudioServiceClient()
     
     def simulate_lcd_write(self, message):
-        """Simulate LCD display"""
-        print(f"[LCD] {message}")
+        """Simulate LCD display, an empty message clears it"""
+        if message:
+            self.lcd_service.write(message)
+        else:
+            self.lcd_service.clear()
+
+    def print_lcd_update(self, update):
+        """Print the emulated display after an update"""
+        rows = "|".join(update.lines)
+        print(f"[LCD] |{rows}| ({update.i2c_bytes} I2C bytes, {update.duration * 1000:.1f} ms)")
     
     def simulate_led_control(self, led_color, state):
         """Simulate LED control"""
@@ -90,9 +113,10 @@ class RFIDSimulator:
             self.simulate_lcd_write("")  # Clear display
             return True
     
-    def simulate_rfid_detection(self):
+    def simulate_rfid_detection(self, card_id=None):
         """Simulate RFID card detection"""
-        card_id = f"CARD_{uuid.uuid4().hex[:8].upper()}"
+        if card_id is None:
+            card_id = f"CARD_{uuid.uuid4().hex[:8].upper()}"
         logger.info(f"Simulating RFID card detection: {card_id}")
         
         # Simulate buzzer
@@ -119,6 +143,15 @@ class RFIDSimulator:
         time.sleep(3)
         self.simulate_lcd_write("")  # Clear display
     
+    def replay_swipes(self):
+        """Feed the swipes of the recorded trace through a ReaderService"""
+        print(f"Replaying {len(self.replay_reader.entries)} recorded reads")
+        with ReaderService(reader=self.replay_reader) as reader_service:
+            while not self.replay_reader.finished:
+                id, text = reader_service.wait_for_tag(timeout=1.0)
+                if id is not None:
+                    self.simulate_rfid_detection(uid_to_num(id))
+
     def run_simulation(self):
         """Run the RFID simulation"""
         print("=== RFID Service Simulator Started ===")
@@ -134,6 +167,9 @@ class RFIDSimulator:
             return
         
         try:
+            if self.replay_reader is not None:
+                self.replay_swipes()
+                return
             iteration = 1
             while True:
                 print(f"\n--- Simulation Iteration {iteration} ---")
@@ -159,7 +195,9 @@ class RFIDSimulator:
 
 def main():
     """Main entry point for simulator"""
-    simulator = RFIDSimulator()
+    trace = os.getenv('RFID_TRACE')
+    speed = float(os.getenv('RFID_TRACE_SPEED', '1.0'))
+    simulator = RFIDSimulator(trace=trace, speed=speed)
     simulator.run_simulation()
 
 
@@ -1,14 +1,44 @@
+import asyncio
 import grpc
+import grpc.aio
+import threading
 import time
 import uuid
 import logging
 import os
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Iterator, Optional
 
 from src.grpc_generated import audio_service_pb2
 from src.grpc_generated import audio_service_pb2_grpc
 
 
+def _response_to_dict(response, logger) -> Dict:
+    """Convert an AudioResponse to a dict, logging failures"""
+    if response.success:
+        # Convert protobuf response to dict
+        top_predictions = []
+        for pred in response.top_predictions:
+            top_predictions.append({
+                'class_name': pred.class_name,
+                'probability': pred.probability
+            })
+        
+        return {
+            'session_id': response.session_id,
+            'success': True,
+            'predicted_class': response.predicted_class,
+            'confidence': response.confidence,
+            'top_predictions': top_predictions
+        }
+    else:
+        logger.error(f"Audio processing failed: {response.error_message}")
+        return {
+            'session_id': response.session_id,
+            'success': False,
+            'error_message': response.error_message
+        }
+
+
 class AudioServiceClient:
     """gRPC client for Audio Service"""
     
@@ -21,6 +51,9 @@ class AudioServiceClient:
         self.timeout = timeout
         self.channel = None
         self.stub = None
+        self.streaming_supported = True
+        self._streams = set()
+        self._streams_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
         
         self._connect()
@@ -81,35 +114,73 @@ class AudioServiceClient:
             )
             
             response = self.stub.StartAudioProcessing(request, timeout=self.timeout)
-            
-            if response.success:
-                # Convert protobuf response to dict
-                top_predictions = []
-                for pred in response.top_predictions:
-                    top_predictions.append({
-                        'class_name': pred.class_name,
-                        'probability': pred.probability
-                    })
-                
-                return {
-                    'session_id': response.session_id,
-                    'success': True,
-                    'predicted_class': response.predicted_class,
-                    'confidence': response.confidence,
-                    'top_predictions': top_predictions
-                }
-            else:
-                self.logger.error(f"Audio processing failed: {response.error_message}")
-                return {
-                    'session_id': response.session_id,
-                    'success': False,
-                    'error_message': response.error_message
-                }
+            return _response_to_dict(response, self.logger)
                 
         except Exception as e:
             self.logger.error(f"Failed to start audio processing: {e}")
             return None
     
+    def stream_classifications(self, window_duration: int = 5, session_id: Optional[str] = None,
+                               max_windows: int = 0) -> Iterator[Dict]:
+        """
+        Record continuously and yield the prediction of every window
+        
+        A single streaming call covers the whole session, so no audio is lost
+        between windows and no call is set up per window. Closing the
+        generator cancels the call, and cancel_streams() cancels it from
+        another thread.
+        
+        Args:
+            window_duration: Duration of each window in seconds
+            session_id: Optional session ID (will generate if not provided)
+            max_windows: Number of windows to classify, 0 until the generator is closed
+            
+        Yields:
+            Dict with the results of each window, as returned by
+            start_audio_processing, with window_start and window_end in
+            seconds from the start of the session. The stream ends early if
+            the call fails, streaming_supported is set to False if the
+            service does not implement it.
+        """
+        if session_id is None:
+            session_id = str(uuid.uuid4())
+        
+        request = audio_service_pb2.SessionRequest(
+            session_id=session_id,
+            window_duration=window_duration,
+            max_windows=max_windows
+        )
+        
+        call = None
+        try:
+            call = self.stub.StreamClassifications(request)
+            with self._streams_lock:
+                self._streams.add(call)
+            for response in call:
+                result = _response_to_dict(response, self.logger)
+                result['window_start'] = response.window_start
+                result['window_end'] = response.window_end
+                yield result
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                self.streaming_supported = False
+            if e.code() != grpc.StatusCode.CANCELLED:
+                self.logger.error(f"Classification stream failed: {e.details()}")
+        except Exception as e:
+            self.logger.error(f"Classification stream failed: {e}")
+        finally:
+            if call is not None:
+                call.cancel()
+                with self._streams_lock:
+                    self._streams.discard(call)
+    
+    def cancel_streams(self):
+        """Cancel every classification stream in progress, ending their generators"""
+        with self._streams_lock:
+            streams = list(self._streams)
+        for call in streams:
+            call.cancel()
+    
     def get_processing_status(self, session_id: str) -> Optional[Dict]:
         """
         Get the status of audio processing
@@ -139,3 +210,162 @@ class AudioServiceClient:
         if self.channel:
             self.channel.close()
             self.logger.info("Audio service connection closed")
+
+
+class AsyncAudioServiceClient:
+    """
+    asyncio gRPC client for Audio Service
+    
+    Same calls as AudioServiceClient, as coroutines on a grpc.aio channel.
+    An in-flight call holds no thread, so any number of sessions and status
+    polls can wait on one event loop. Create it inside the event loop it is
+    used from.
+    """
+    
+    def __init__(self, server_address: str = None, timeout: int = 30):
+        # Use environment variable or default to Docker service name
+        if server_address is None:
+            server_address = os.environ.get('AUDIO_SERVICE_URL', 'localhost:50051')
+        
+        self.server_address = server_address
+        self.timeout = timeout
+        self.channel = None
+        self.stub = None
+        self.streaming_supported = True
+        self.logger = logging.getLogger(__name__)
+        
+        self._connect()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    def _connect(self):
+        """Create the channel to audio service, connected on the first call"""
+        try:
+            self.logger.info(f"Attempting to connect to audio service at {self.server_address}")
+            self.channel = grpc.aio.insecure_channel(self.server_address)
+            self.stub = audio_service_pb2_grpc.AudioServiceStub(self.channel)
+            self.logger.info(f"Connected to audio service at {self.server_address}")
+        except Exception as e:
+            self.logger.error(f"Failed to connect to audio service: {e}")
+            raise
+    
+    async def health_check(self) -> bool:
+        """Check if the audio service is healthy"""
+        try:
+            request = audio_service_pb2.HealthCheckRequest()
+            response = await self.stub.HealthCheck(request, timeout=5)
+            return response.status == "SERVING"
+        except Exception as e:
+            self.logger.error(f"Health check failed: {e}")
+            return False
+    
+    async def wait_for_service(self, max_retries: int = 10, retry_delay: int = 2) -> bool:
+        """Wait for the audio service to become available"""
+        for attempt in range(max_retries):
+            if await self.health_check():
+                self.logger.info("Audio service is ready")
+                return True
+            
+            self.logger.info(f"Waiting for audio service... (attempt {attempt + 1}/{max_retries})")
+            await asyncio.sleep(retry_delay)
+        
+        self.logger.error("Audio service did not become available")
+        return False
+    
+    async def start_audio_processing(self, duration: int = 5, session_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        Start audio recording and processing
+        
+        Args:
+            duration: Recording duration in seconds
+            session_id: Optional session ID (will generate if not provided)
+            
+        Returns:
+            Dict with processing results or None if failed
+        """
+        try:
+            if session_id is None:
+                session_id = str(uuid.uuid4())
+            
+            request = audio_service_pb2.AudioRequest(
+                session_id=session_id,
+                recording_duration=duration,
+                output_format="wav"
+            )
+            
+            response = await self.stub.StartAudioProcessing(request, timeout=self.timeout)
+            return _response_to_dict(response, self.logger)
+                
+        except Exception as e:
+            self.logger.error(f"Failed to start audio processing: {e}")
+            return None
+    
+    async def stream_classifications(self, window_duration: int = 5, session_id: Optional[str] = None,
+                                     max_windows: int = 0) -> AsyncIterator[Dict]:
+        """
+        Record continuously and yield the prediction of every window
+        
+        See AudioServiceClient.stream_classifications(). Closing the
+        generator or cancelling the task iterating it cancels the call.
+        """
+        if session_id is None:
+            session_id = str(uuid.uuid4())
+        
+        request = audio_service_pb2.SessionRequest(
+            session_id=session_id,
+            window_duration=window_duration,
+            max_windows=max_windows
+        )
+        
+        call = None
+        try:
+            call = self.stub.StreamClassifications(request)
+            async for response in call:
+                result = _response_to_dict(response, self.logger)
+                result['window_start'] = response.window_start
+                result['window_end'] = response.window_end
+                yield result
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                self.streaming_supported = False
+            if e.code() != grpc.StatusCode.CANCELLED:
+                self.logger.error(f"Classification stream failed: {e.details()}")
+        except Exception as e:
+            self.logger.error(f"Classification stream failed: {e}")
+        finally:
+            if call is not None:
+                call.cancel()
+    
+    async def get_processing_status(self, session_id: str) -> Optional[Dict]:
+        """
+        Get the status of audio processing
+        
+        Args:
+            session_id: Session ID to check
+            
+        Returns:
+            Dict with status information or None if failed
+        """
+        try:
+            request = audio_service_pb2.StatusRequest(session_id=session_id)
+            response = await self.stub.GetProcessingStatus(request, timeout=5)
+            
+            return {
+                'session_id': response.session_id,
+                'status': response.status,
+                'current_operation': response.current_operation
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get processing status: {e}")
+            return None
+    
+    async def close(self):
+        """Close the gRPC channel, cancelling the calls in flight"""
+        if self.channel:
+            await self.channel.close()
+            self.logger.info("Audio service connection closed")
@@ -0,0 +1,171 @@
+import logging
+import queue
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+
+class CoverageMeter:
+    """
+    Fraction of a session's wall-clock time during which audio was recorded
+
+    Attributes:
+        recorded: Seconds of audio recorded
+        started: Monotonic time the session started, None before start()
+        stopped: Monotonic time the session stopped, None while running
+    """
+
+    def __init__(self):
+        self.recorded = 0.0
+        self.started = None
+        self.stopped = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            self.recorded = 0.0
+            self.started = time.monotonic()
+            self.stopped = None
+
+    def stop(self):
+        with self._lock:
+            if self.started is not None and self.stopped is None:
+                self.stopped = time.monotonic()
+
+    def add(self, seconds: float):
+        """Count seconds of recorded audio"""
+        with self._lock:
+            self.recorded += seconds
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the session started, until it stopped"""
+        if self.started is None:
+            return 0.0
+        end = self.stopped if self.stopped is not None else time.monotonic()
+        return end - self.started
+
+    @property
+    def ratio(self) -> float:
+        """Recorded seconds over elapsed seconds, 0 before any time has passed"""
+        elapsed = self.elapsed
+        return self.recorded / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> Dict:
+        return {
+            'recorded_seconds': self.recorded,
+            'elapsed_seconds': self.elapsed,
+            'coverage': self.ratio,
+        }
+
+
+class AudioPipeline:
+    """
+    Records audio back to back and presents the results on a separate stage
+
+    The recording stage issues the next StartAudioProcessing call as soon as
+    the previous one returns, so the service is idle only for the round
+    trip. Results go through a queue of `depth` slots to the presenting
+    stage, which displays or publishes them on its own thread, so slow
+    presentation never delays the next recording. If the presenter falls
+    behind, the oldest waiting result is dropped.
+
+    Every call is its own session on the service. Results are tagged with
+    the pipeline_id, so the results of one run can be told apart from those
+    of other runs once published.
+
+    Attributes:
+        pipeline_id: Identifier added to every result as 'pipeline_id'
+        coverage: The CoverageMeter of the session, counting successful recordings
+        presented: Number of results presented
+        dropped: Number of results dropped because the presenter fell behind
+    """
+
+    def __init__(self, client, present: Callable[[Optional[Dict]], None], duration: int = 5,
+                 depth: int = 2, retry_delay: float = 1.0, coverage: Optional[CoverageMeter] = None,
+                 pipeline_id: Optional[str] = None):
+        """
+        Args:
+            client: The AudioServiceClient to record with
+            present: Called on the presenting thread with every result, None for a failed call
+            duration: Recording duration of each call in seconds
+            depth: Number of results that may wait for the presenter
+            retry_delay: Seconds to wait after a failed call before the next one
+            coverage: Meter to count recordings in, a new one if not provided
+            pipeline_id: Identifier to tag results with, a new UUID if not provided
+        """
+        self.client = client
+        self.present = present
+        self.duration = duration
+        self.retry_delay = retry_delay
+        self.coverage = coverage or CoverageMeter()
+        self.pipeline_id = pipeline_id or str(uuid.uuid4())
+        self.presented = 0
+        self.dropped = 0
+        self.logger = logging.getLogger(__name__)
+        self._results = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+
+    def stop(self):
+        """Stop after the call in flight, from any thread"""
+        self._stopped.set()
+
+    def run(self, keep_running: Callable[[], bool] = lambda: True, session_id: Optional[str] = None):
+        """
+        Record on the calling thread until stop() is called or keep_running returns False
+
+        Returns once the results already recorded have been presented. A
+        pipeline runs once. The coverage meter is started and stopped here
+        unless the caller started it, to cover a longer session.
+
+        Args:
+            keep_running: Checked before every call
+            session_id: Session ID to send with every call, the client generates
+                one per call if not provided
+        """
+        owns_coverage = self.coverage.started is None
+        if owns_coverage:
+            self.coverage.start()
+        presenter = threading.Thread(target=self._present_loop, name="audio-presenter", daemon=True)
+        presenter.start()
+        try:
+            while not self._stopped.is_set() and keep_running():
+                result = self.client.start_audio_processing(duration=self.duration, session_id=session_id)
+                if result and result.get('success'):
+                    self.coverage.add(self.duration)
+                if result:
+                    result = dict(result, pipeline_id=self.pipeline_id)
+                self._push(result)
+                if not (result and result.get('success')):
+                    # Avoid hammering a failing service
+                    self._stopped.wait(self.retry_delay)
+        finally:
+            if owns_coverage:
+                self.coverage.stop()
+            self._stopped.set()
+            self._results.put(self._stopped)
+            presenter.join()
+
+    def _push(self, item):
+        while True:
+            try:
+                self._results.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._results.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _present_loop(self):
+        while True:
+            item = self._results.get()
+            if item is self._stopped:
+                return
+            try:
+                self.present(item)
+                self.presented += 1
+            except Exception as e:
+                self.logger.error(f"Failed to present audio result: {e}")
@@ -0,0 +1,119 @@
+import grpc
+import itertools
+import threading
+import time
+from concurrent import futures
+from typing import Optional, Tuple
+
+from src.grpc_generated import audio_service_pb2
+from src.grpc_generated import audio_service_pb2_grpc
+
+
+DEFAULT_CLASSES = ("speech", "music", "dog", "silence")
+
+
+class FakeAudioService(audio_service_pb2_grpc.AudioServiceServicer):
+    """
+    Local stand-in for the audio service, for tests, benchmarks and the simulator.
+
+    Nothing is recorded: every request is answered with a prediction cycling
+    through a fixed list of classes. Recording takes time_scale seconds per
+    second of audio requested, 0 answers immediately and 1 runs in real time.
+    """
+
+    def __init__(self, classes=DEFAULT_CLASSES, time_scale: float = 0.0, processing_delay: float = 0.0):
+        self.classes = tuple(classes)
+        self.time_scale = time_scale
+        self.processing_delay = processing_delay
+        self.sessions = {}
+        self.requests = 0
+        self.windows_streamed = 0
+        self.active_streams = 0
+        self._next_class = itertools.count()
+        self._lock = threading.Lock()
+
+    def _prediction(self, session_id: str) -> audio_service_pb2.AudioResponse:
+        """Build the next prediction, cycling through the classes"""
+        with self._lock:
+            index = next(self._next_class) % len(self.classes)
+        predicted = self.classes[index]
+        others = [name for name in self.classes if name != predicted]
+        top_predictions = [audio_service_pb2.ClassProbability(class_name=predicted, probability=0.8)]
+        for name, probability in zip(others, (0.15, 0.05)):
+            top_predictions.append(audio_service_pb2.ClassProbability(class_name=name, probability=probability))
+        return audio_service_pb2.AudioResponse(
+            session_id=session_id,
+            success=True,
+            predicted_class=predicted,
+            confidence=0.8,
+            top_predictions=top_predictions
+        )
+
+    def HealthCheck(self, request, context):
+        return audio_service_pb2.HealthCheckResponse(status="SERVING", message="Fake audio service")
+
+    def StartAudioProcessing(self, request, context):
+        with self._lock:
+            self.requests += 1
+            self.sessions[request.session_id] = {'status': 'recording', 'current_operation': 'recording'}
+        time.sleep(request.recording_duration * self.time_scale + self.processing_delay)
+        with self._lock:
+            self.sessions[request.session_id] = {'status': 'completed', 'current_operation': 'analysis_complete'}
+        return self._prediction(request.session_id)
+
+    def GetProcessingStatus(self, request, context):
+        with self._lock:
+            session = self.sessions.get(request.session_id, {'status': 'not_found', 'current_operation': 'none'})
+        return audio_service_pb2.StatusResponse(
+            session_id=request.session_id,
+            status=session['status'],
+            current_operation=session['current_operation']
+        )
+
+    def StreamClassifications(self, request, context):
+        # Windows are scheduled back to back from the start of the stream, so none is lost
+        cancelled = threading.Event()
+        context.add_callback(cancelled.set)
+        window = request.window_duration or 5
+        start = time.monotonic()
+        with self._lock:
+            self.active_streams += 1
+            self.sessions[request.session_id] = {'status': 'recording', 'current_operation': 'streaming'}
+        try:
+            for index in itertools.count():
+                if request.max_windows and index >= request.max_windows:
+                    break
+                due = start + (index + 1) * window * self.time_scale + self.processing_delay
+                if cancelled.wait(max(0.0, due - time.monotonic())):
+                    break
+                response = self._prediction(request.session_id)
+                response.window_start = index * window
+                response.window_end = (index + 1) * window
+                with self._lock:
+                    self.windows_streamed += 1
+                yield response
+        finally:
+            with self._lock:
+                self.active_streams -= 1
+                self.sessions[request.session_id] = {'status': 'completed', 'current_operation': 'analysis_complete'}
+
+
+def start_fake_server(service: Optional[FakeAudioService] = None, address: str = "localhost:0",
+                      max_workers: int = 10) -> Tuple[grpc.Server, str]:
+    """
+    Start a gRPC server for a FakeAudioService
+
+    Args:
+        service: The service to serve, a FakeAudioService answering immediately if not provided
+        address: Address to listen on, port 0 picks a free port
+        max_workers: Number of server threads, each streaming call holds one
+
+    Returns:
+        The started server, to stop when done, and the address it listens on
+    """
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    audio_service_pb2_grpc.add_AudioServiceServicer_to_server(service or FakeAudioService(), server)
+    host = address.rsplit(':', 1)[0]
+    port = server.add_insecure_port(address)
+    server.start()
+    return server, f"{host}:{port}"
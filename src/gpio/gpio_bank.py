@@ -0,0 +1,91 @@
+class GPIOBank:
+  """
+  Applies changes to several GPIOControllers in one call.
+
+  Pins that already have the requested level are skipped, using the level
+  cached by each controller. The remaining pins of controllers sharing a
+  GPIO module are written with a single output() call taking lists of pins
+  and levels, as RPi.GPIO allows.
+
+  Attributes:
+    controllers (list): The controllers of the bank.
+    writes (int): Number of output() calls made.
+    pin_writes (int): Number of pins written.
+    skipped_writes (int): Number of pin changes skipped because the pin already had that level.
+  """
+  def __init__(self, controllers=()):
+    """
+    Initializes the GPIOBank.
+
+    Args:
+      controllers: The GPIOControllers of the bank, more can be added with add().
+    """
+    self.controllers = list(controllers)
+    self.writes = 0
+    self.pin_writes = 0
+    self.skipped_writes = 0
+
+  def add(self, controller):
+    """
+    Adds a controller to the bank and returns it.
+    """
+    self.controllers.append(controller)
+    return controller
+
+  def apply(self, changes):
+    """
+    Drives several pins at once.
+
+    Args:
+      changes (dict): Maps each GPIOController to True for HIGH or False for LOW.
+
+    Returns:
+      int: Number of pins written.
+    """
+    groups = {}
+    for controller, on in changes.items():
+      if controller.gpio is None:
+        continue
+      if controller.state == on:
+        controller.skipped_writes += 1
+        self.skipped_writes += 1
+        continue
+      groups.setdefault(id(controller.gpio), []).append((controller, on))
+
+    written = 0
+    for group in groups.values():
+      gpio = group[0][0].gpio
+      levels = [gpio.HIGH if on else gpio.LOW for _, on in group]
+      if len(group) == 1:
+        gpio.output(group[0][0].pin, levels[0])
+      else:
+        gpio.output([controller.pin for controller, _ in group], levels)
+      for controller, on in group:
+        controller.state = on
+        controller.writes += 1
+      self.writes += 1
+      written += len(group)
+    self.pin_writes += written
+    return written
+
+  def all_off(self):
+    """
+    Turns every controller of the bank off.
+
+    Returns:
+      int: Number of pins written.
+    """
+    return self.apply({controller: False for controller in self.controllers})
+
+  def stats(self):
+    """
+    Returns the write counters of the bank.
+
+    Returns:
+      dict: 'writes', 'pin_writes' and 'skipped_writes'.
+    """
+    return {
+      'writes': self.writes,
+      'pin_writes': self.pin_writes,
+      'skipped_writes': self.skipped_writes,
+    }
@@ -2,8 +2,19 @@ class GPIOController:
   """
   A class to control GPIO pins for various output components.
   This class is designed to handle components like LEDs and buzzers
+
+  The level last written to the pin is cached, so writing the level the
+  pin already has is skipped and toggle() does not read the pin back.
+
+  Deleting a controller does no hardware work; turning the pins off at
+  exit is left to GPIORegistry.shutdown().
+
+  Attributes:
+    state (bool): The cached pin level, True for HIGH, None until first written or read.
+    writes (int): Number of writes sent to the pin.
+    skipped_writes (int): Number of writes skipped because the pin already had that level.
   """
-  def __init__(self, gpio=None, pin=18, component_type="LED"):
+  def __init__(self, gpio=None, pin=18, component_type="LED", configure=True):
     """
     Initializes the GPIOController for handling various output components.
 
@@ -11,34 +22,25 @@ class GPIOController:
       gpio: An optional GPIO controller instance, used for Raspberry Pi.
       pin: The GPIO pin number to which the component is connected (default is 18).
       component_type: Type of component connected (e.g., "LED", "BUZZER"). For logging/identification.
+      configure: Whether to set the GPIO mode and the pin up, False when a GPIORegistry has done it.
     """
     self.gpio = gpio
     self.pin = pin
     self.component_type = component_type
-    if self.gpio is not None:
+    self.state = None
+    self.writes = 0
+    self.skipped_writes = 0
+    if self.gpio is not None and configure:
       self.gpio.setmode(self.gpio.BCM)  # Set the GPIO mode to BCM
       self.gpio.setup(self.pin, self.gpio.OUT)
 
-  def __del__(self):
-    """
-    Cleans up the GPIO settings when the GPIOController instance is deleted.
-
-    This method is called when the GPIOController instance is about to be destroyed.
-    It ensures that the GPIO pin is cleaned up properly to avoid resource leaks.
-    """
-    if self.gpio is not None:
-      self.gpio.setmode(self.gpio.BCM)  # Set the GPIO mode to BCM
-      self.gpio.setup(self.pin, self.gpio.OUT)
-      self.turn_off()
-
   def turn_on(self):
     """
     Turns on the component by setting the GPIO pin to HIGH.
 
     This method activates the component connected to the specified GPIO pin.
     """
-    if self.gpio is not None:
-      self.gpio.output(self.pin, self.gpio.HIGH)
+    self.set(True)
 
   def turn_off(self):
     """
@@ -46,15 +48,40 @@ class GPIOController:
 
     This method deactivates the component connected to the specified GPIO pin.
     """
-    if self.gpio is not None:
-      self.gpio.output(self.pin, self.gpio.LOW)
+    self.set(False)
+
+  def set(self, on: bool):
+    """
+    Drives the pin HIGH or LOW, skipping the write if it already has that level.
+
+    Args:
+      on (bool): True for HIGH, False for LOW.
+
+    Returns:
+      bool: True if the pin was written.
+    """
+    if self.gpio is None:
+      return False
+    if self.state == on:
+      self.skipped_writes += 1
+      return False
+    self.gpio.output(self.pin, self.gpio.HIGH if on else self.gpio.LOW)
+    self.state = on
+    self.writes += 1
+    return True
 
   def toggle(self):
     """
     Toggles the state of the component (ON to OFF or OFF to ON).
     
-    This method is useful for blinking or alternating states.
+    This method is useful for blinking or alternating states. The pin is
+    only read back while its level is unknown.
     """
     if self.gpio is not None:
-      current_state = self.gpio.input(self.pin)
-      self.gpio.output(self.pin, not current_state)
\ No newline at end of file
+      if self.state is None:
+        current_state = self.gpio.input(self.pin)
+        self.gpio.output(self.pin, not current_state)
+        self.state = not current_state
+        self.writes += 1
+      else:
+        self.set(not self.state)
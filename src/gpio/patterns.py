@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+import heapq
+import itertools
+import threading
+import time
+
+@dataclass(frozen=True)
+class Pattern:
+  """
+  A timed sequence of pin levels.
+
+  Attributes:
+    steps (tuple): (on, seconds) pairs, the pin is driven to each level in turn and held for its time.
+    repeat (int): Number of times the steps are played, None repeats until cancelled.
+  """
+  steps: tuple
+  repeat: int = 1
+
+
+def beep(duration: float = 0.1):
+  """
+  Returns a pattern turning the pin on once for duration seconds.
+  """
+  return Pattern(((True, duration), (False, 0.0)))
+
+
+def double_beep(duration: float = 0.08, gap: float = 0.08):
+  """
+  Returns a pattern turning the pin on twice, gap seconds apart.
+  """
+  return Pattern(((True, duration), (False, gap), (True, duration), (False, 0.0)))
+
+
+def blink(times: int = None, on: float = 0.2, off: float = 0.2):
+  """
+  Returns a pattern blinking the pin, times times or until cancelled for None.
+  """
+  return Pattern(((True, on), (False, off)), repeat=times)
+
+
+class PatternRun:
+  """
+  A pattern submitted to a PatternEngine for one controller.
+
+  Attributes:
+    controller: The GPIOController driven by the pattern.
+    pattern (Pattern): The pattern played.
+    cancelled (bool): Whether the run was cancelled or replaced before it ended.
+  """
+  def __init__(self, controller, pattern):
+    self.controller = controller
+    self.pattern = pattern
+    self.cancelled = False
+    self._step = 0
+    self._cycle = 0
+    self._done = threading.Event()
+
+  @property
+  def done(self):
+    """
+    bool: Whether the run has ended, played to completion or cancelled.
+    """
+    return self._done.is_set()
+
+  def wait(self, timeout: float = None):
+    """
+    Waits until the run has ended.
+
+    Returns:
+      bool: True if the run has ended, False on timeout.
+    """
+    return self._done.wait(timeout)
+
+
+class PatternEngine:
+  """
+  Plays timed pin patterns, such as beeps and blinks, on a single thread.
+
+  Callers submit a pattern and return immediately. The engine keeps the
+  next step of every running pattern in a heap ordered by its due time on
+  the monotonic clock, and its thread sleeps until the earliest one is due.
+  Steps are scheduled from the due time of the previous step, not from when
+  it actually ran, so patterns do not drift.
+
+  One pattern runs per pin: submitting a pattern for a pin that is already
+  playing one replaces it. Cancelled steps stay in the heap and are skipped
+  when they come up.
+
+  Attributes:
+    played (int): Number of steps driven to a pin.
+    late (float): Largest delay of a step behind its due time, in seconds.
+  """
+  def __init__(self):
+    self.played = 0
+    self.late = 0.0
+    self._heap = []
+    self._runs = {}
+    self._sequence = itertools.count()
+    self._condition = threading.Condition()
+    self._running = False
+    self._thread = None
+
+  def start(self):
+    with self._condition:
+      if self._running:
+        return
+      self._running = True
+    self._thread = threading.Thread(target=self._run, name="gpio-patterns", daemon=True)
+    self._thread.start()
+
+  def close(self, timeout: float = 1.0):
+    """
+    Cancels every running pattern, turning its pin off, and stops the thread.
+    """
+    with self._condition:
+      runs = list(self._runs.values())
+    for run in runs:
+      self.cancel(run.controller)
+    with self._condition:
+      self._running = False
+      self._condition.notify_all()
+    if self._thread is not None:
+      self._thread.join(timeout)
+      self._thread = None
+
+  def play(self, controller, pattern: Pattern):
+    """
+    Starts playing a pattern on a controller's pin, replacing the pattern
+    already running on that pin.
+
+    Args:
+      controller: The GPIOController to drive.
+      pattern (Pattern): The pattern to play.
+
+    Returns:
+      PatternRun: The run, to wait for or cancel.
+    """
+    self.start()
+    run = PatternRun(controller, pattern)
+    with self._condition:
+      previous = self._runs.get(controller.pin)
+      if previous is not None:
+        self._end(previous, cancelled=True)
+      self._runs[controller.pin] = run
+      self._push(time.monotonic(), run)
+    return run
+
+  def cancel(self, controller, turn_off: bool = True):
+    """
+    Cancels the pattern running on a controller's pin.
+
+    Args:
+      controller: The GPIOController whose pattern is cancelled.
+      turn_off (bool): Whether to turn the pin off, otherwise it keeps its level.
+
+    Returns:
+      bool: True if a pattern was running.
+    """
+    with self._condition:
+      run = self._runs.pop(controller.pin, None)
+      if run is None:
+        return False
+      self._end(run, cancelled=True)
+      if turn_off:
+        controller.turn_off()
+    return True
+
+  def running(self, controller):
+    """
+    Returns the PatternRun playing on a controller's pin, None if there is none.
+    """
+    with self._condition:
+      return self._runs.get(controller.pin)
+
+  def _push(self, due, run):
+    heapq.heappush(self._heap, (due, next(self._sequence), run))
+    self._condition.notify_all()
+
+  def _end(self, run, cancelled=False):
+    run.cancelled = cancelled
+    run._done.set()
+
+  def _run(self):
+    while True:
+      with self._condition:
+        while self._running and (not self._heap or self._heap[0][0] > time.monotonic()):
+          timeout = None if not self._heap else self._heap[0][0] - time.monotonic()
+          self._condition.wait(timeout)
+        if not self._running:
+          return
+        due, _, run = heapq.heappop(self._heap)
+        if run.done:
+          continue
+        on, duration = run.pattern.steps[run._step]
+        run._step += 1
+        if run._step == len(run.pattern.steps):
+          run._step = 0
+          run._cycle += 1
+        finished = run.pattern.repeat is not None and run._cycle >= run.pattern.repeat
+        if finished:
+          self._runs.pop(run.controller.pin, None)
+        else:
+          self._push(due + duration, run)
+        # Drive the pin under the lock so a replacing pattern cannot be overtaken
+        self.late = max(self.late, time.monotonic() - due)
+        if on:
+          run.controller.turn_on()
+        else:
+          run.controller.turn_off()
+        self.played += 1
+        if finished:
+          self._end(run)
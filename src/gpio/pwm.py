@@ -0,0 +1,296 @@
+import math
+import os
+import threading
+import time
+
+# BCM pins routed to the PWM peripheral, mapped to their channel
+HARDWARE_PWM_CHANNELS = {12: 0, 18: 0, 13: 1, 19: 1}
+SYSFS_PWM_CHIP = "/sys/class/pwm/pwmchip0"
+
+
+def breathing(period: float = 2.0, low: float = 0.0, high: float = 1.0):
+  """
+  Returns a brightness function of time rising and falling smoothly between
+  low and high once per period seconds.
+  """
+  def level(now):
+    phase = (now % period) / period
+    return low + (high - low) * (1 - math.cos(2 * math.pi * phase)) / 2
+  return level
+
+
+class HardwarePWM:
+  """
+  A channel of the PWM peripheral driven through the Linux sysfs interface.
+
+  The peripheral generates the waveform, so holding a brightness costs no
+  CPU. It needs the pwm or pwm-2chan device tree overlay.
+
+  Attributes:
+    pin: The BCM pin number.
+    channel (int): The PWM channel of the pin.
+  """
+  def __init__(self, pin, frequency: float = 1000.0, chip: str = SYSFS_PWM_CHIP):
+    self.pin = pin
+    self.channel = HARDWARE_PWM_CHANNELS[pin]
+    self.period_ns = int(1e9 / frequency)
+    self._path = os.path.join(chip, f"pwm{self.channel}")
+    if not os.path.isdir(self._path):
+      self._write(os.path.join(chip, "export"), self.channel)
+    self._write(os.path.join(self._path, "duty_cycle"), 0)
+    self._write(os.path.join(self._path, "period"), self.period_ns)
+    self._write(os.path.join(self._path, "enable"), 1)
+
+  @classmethod
+  def available(cls, pin, chip: str = SYSFS_PWM_CHIP):
+    """
+    Returns whether pin can be driven by the PWM peripheral on this system.
+    """
+    return pin in HARDWARE_PWM_CHANNELS and os.path.isdir(chip)
+
+  def set_duty(self, duty: float):
+    self._write(os.path.join(self._path, "duty_cycle"), int(self.period_ns * duty))
+
+  def close(self):
+    self.set_duty(0.0)
+    self._write(os.path.join(self._path, "enable"), 0)
+
+  def _write(self, path, value):
+    with open(path, "w") as file:
+      file.write(str(value))
+
+
+class SoftPWM:
+  """
+  Software PWM for any number of pins, driven by a single thread.
+
+  Each cycle the thread turns on every pin with a duty between 0 and 1,
+  then turns them off in order of their duty, sleeping in between. Pins
+  fully on or off are written once when their brightness is set and left
+  alone, and the thread sleeps until told otherwise while no pin needs
+  modulating, so steady levels cost no CPU. Brightness functions such as
+  breathing() are evaluated once per cycle, which also updates the duty of
+  hardware PWM outputs that breathe.
+
+  Attributes:
+    frequency (float): PWM frequency in Hz.
+    cycles (int): Number of PWM cycles run.
+  """
+  def __init__(self, frequency: float = 100.0):
+    self.frequency = frequency
+    self.period = 1.0 / frequency
+    self.cycles = 0
+    self._outputs = {}
+    self._condition = threading.Condition()
+    self._running = False
+    self._thread = None
+
+  def start(self):
+    with self._condition:
+      if self._running:
+        return
+      self._running = True
+    self._thread = threading.Thread(target=self._run, name="soft-pwm", daemon=True)
+    self._thread.start()
+
+  def close(self, timeout: float = 1.0):
+    """
+    Stops the thread and turns every soft PWM pin off.
+    """
+    with self._condition:
+      self._running = False
+      self._condition.notify_all()
+      outputs = list(self._outputs.values())
+      self._outputs = {}
+    if self._thread is not None:
+      self._thread.join(timeout)
+      self._thread = None
+    for output in outputs:
+      output._drive(0.0)
+
+  def update(self, output):
+    """
+    Applies the brightness of an output, modulating it on the thread if needed.
+    """
+    modulated = output.modulated
+    with self._condition:
+      if modulated:
+        self._outputs[output.pin] = output
+        self._condition.notify_all()
+      else:
+        self._outputs.pop(output.pin, None)
+        output._drive(output.level(time.monotonic()))
+    if modulated:
+      self.start()
+
+  def _run(self):
+    next_cycle = time.monotonic()
+    while True:
+      with self._condition:
+        while self._running and not self._outputs:
+          self._condition.wait()
+          next_cycle = time.monotonic()
+        if not self._running:
+          return
+        now = time.monotonic()
+        soft = []
+        for output in self._outputs.values():
+          duty = output.level(now)
+          if output.hardware is not None:
+            output._drive(duty)
+          elif duty > 0:
+            output._drive(1.0)
+            if duty < 1:
+              soft.append((duty, output))
+          else:
+            output._drive(0.0)
+      soft.sort(key=lambda item: item[0])
+      for duty, output in soft:
+        self._sleep_until(next_cycle + duty * self.period)
+        with self._condition:
+          # Leave pins alone whose brightness changed during the cycle
+          if self._outputs.get(output.pin) is output and output.modulated:
+            output._drive(0.0)
+      self.cycles += 1
+      next_cycle += self.period
+      if next_cycle < time.monotonic():
+        # Overran a whole cycle, start the next one from now
+        next_cycle = time.monotonic()
+      self._sleep_until(next_cycle)
+
+  def _sleep_until(self, deadline):
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+      time.sleep(remaining)
+
+
+class PWMOutput:
+  """
+  An output pin with a brightness level, such as a status LED.
+
+  The PWM peripheral is used when the pin is routed to it and the system
+  exposes it, otherwise the pin is modulated by a SoftPWM shared by every
+  output. Brightness is gamma corrected so that levels look evenly spaced.
+
+  Attributes:
+    controller (GPIOController): The controller of the pin.
+    hardware (HardwarePWM): The PWM channel, None when using soft PWM.
+    soft_pwm (SoftPWM): The shared soft PWM driving the pin.
+    gamma (float): Exponent applied to brightness levels.
+  """
+  def __init__(self, controller, soft_pwm: SoftPWM = None, hardware=None, gamma: float = 2.2):
+    """
+    Initializes the PWMOutput.
+
+    Args:
+      controller (GPIOController): The controller of the pin.
+      soft_pwm (SoftPWM): The shared soft PWM, also used to make hardware outputs breathe.
+      hardware: A HardwarePWM for the pin, None to use one if available, False to never use one.
+      gamma (float): Exponent applied to brightness levels, 1 for none.
+    """
+    self.controller = controller
+    self.soft_pwm = soft_pwm or SoftPWM()
+    self.gamma = gamma
+    if hardware is None and controller.gpio is not None and HardwarePWM.available(controller.pin):
+      try:
+        hardware = HardwarePWM(controller.pin)
+      except OSError:
+        hardware = None
+    self.hardware = hardware or None
+    self._level = lambda now: 0.0
+    self._constant = True
+
+  @property
+  def pin(self):
+    return self.controller.pin
+
+  @property
+  def modulated(self):
+    """
+    bool: Whether the thread has to drive this output.
+    """
+    if not self._constant:
+      return True
+    level = self._level(0.0)
+    return self.hardware is None and 0 < level < 1
+
+  def level(self, now):
+    """
+    Returns the duty cycle of the output at time now.
+    """
+    return min(max(self._level(now), 0.0), 1.0) ** self.gamma
+
+  def set_brightness(self, brightness: float):
+    """
+    Sets a steady brightness between 0 (off) and 1 (fully on).
+    """
+    self._level = lambda now: brightness
+    self._constant = True
+    self.soft_pwm.update(self)
+
+  def breathe(self, period: float = 2.0, low: float = 0.0, high: float = 1.0):
+    """
+    Makes the brightness rise and fall between low and high once per period seconds.
+    """
+    self._level = breathing(period, low, high)
+    self._constant = False
+    self.soft_pwm.update(self)
+
+  def off(self):
+    self.set_brightness(0.0)
+
+  def close(self):
+    """
+    Turns the output off and releases the PWM channel.
+    """
+    self.off()
+    if self.hardware is not None:
+      self.hardware.close()
+
+  def _drive(self, duty):
+    if self.hardware is not None:
+      self.hardware.set_duty(duty)
+    else:
+      self.controller.set(duty > 0)
+
+
+class StatusLED:
+  """
+  Shows the state of the application on a PWMOutput as a brightness or a
+  breathing rhythm. It is not thread-safe, set it from a single thread.
+
+  Attributes:
+    output (PWMOutput): The LED.
+    state (str): The state shown.
+  """
+  # State name: steady brightness, or (period, low, high) to breathe
+  STATES = {
+    "off": 0.0,
+    "idle": 0.1,
+    "connecting": (1.5, 0.05, 0.8),
+    "recording": 1.0,
+    "rpc": (0.6, 0.3, 1.0),
+  }
+
+  def __init__(self, output: PWMOutput, states: dict = None):
+    self.output = output
+    self.states = dict(states or self.STATES)
+    self.state = None
+
+  def set(self, state: str):
+    """
+    Shows a state, doing nothing if it is already shown.
+
+    Raises:
+      ValueError: If the state is unknown.
+    """
+    if state not in self.states:
+      raise ValueError(f"Unknown LED state: {state}")
+    if state == self.state:
+      return
+    self.state = state
+    level = self.states[state]
+    if isinstance(level, tuple):
+      self.output.breathe(*level)
+    else:
+      self.output.set_brightness(level)
@@ -0,0 +1,155 @@
+from .gpio_bank import GPIOBank
+from .gpio_controller import GPIOController
+from .pwm import HardwarePWM, PWMOutput, SoftPWM
+import threading
+import time
+
+class GPIORegistry:
+  """
+  Owns the GPIO mode and the output pins of the application.
+
+  The registry sets the BCM mode once and sets each pin up once, when its
+  controller is first requested; asking for the same pin again returns the
+  same controller. pwm() hands out dimmable outputs, all soft PWM ones
+  driven by one shared SoftPWM thread. shutdown() runs the registered hooks, such as stopping
+  threads that drive pins, then drives every output to its safe level in
+  one batched pass and releases every channel with GPIO.cleanup(), so the
+  state the hardware is left in no longer depends on the garbage collector.
+
+  Attributes:
+    gpio: The GPIO module, None when running without hardware.
+    bank (GPIOBank): The controllers handed out, for batched changes.
+    soft_pwm (SoftPWM): The soft PWM shared by the PWM outputs, None until one is requested.
+    shutdown_seconds (float): How long shutdown() took, None before it ran.
+  """
+  def __init__(self, gpio=None):
+    """
+    Initializes the GPIORegistry and sets the GPIO mode to BCM.
+
+    Args:
+      gpio: An optional GPIO module, used for Raspberry Pi.
+    """
+    self.gpio = gpio
+    self.bank = GPIOBank()
+    self.shutdown_seconds = None
+    self.soft_pwm = None
+    self._pwm_outputs = {}
+    self._safe_states = {}
+    self._controllers = {}
+    self._hooks = []
+    self._lock = threading.Lock()
+    if self.gpio is not None:
+      self.gpio.setmode(self.gpio.BCM)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.shutdown()
+
+  def __len__(self):
+    return len(self._controllers)
+
+  def controller(self, pin, component_type="LED", initial=None, safe_state=False):
+    """
+    Returns the controller of an output pin, setting the pin up on first use.
+
+    Args:
+      pin: The GPIO pin number.
+      component_type: Type of component connected (e.g., "LED", "BUZZER").
+      initial (bool): Level the pin starts at, None leaves it as it is.
+      safe_state (bool): Level the pin is driven to at shutdown.
+
+    Returns:
+      GPIOController: The controller of the pin.
+    """
+    with self._lock:
+      controller = self._controllers.get(pin)
+      if controller is not None:
+        return controller
+      controller = GPIOController(gpio=self.gpio, pin=pin, component_type=component_type, configure=False)
+      if self.gpio is not None:
+        if initial is None:
+          self.gpio.setup(pin, self.gpio.OUT)
+        else:
+          self.gpio.setup(pin, self.gpio.OUT, initial=self.gpio.HIGH if initial else self.gpio.LOW)
+          controller.state = initial
+      self._controllers[pin] = controller
+      self._safe_states[pin] = safe_state
+      self.bank.add(controller)
+      return controller
+
+  def pwm(self, pin, component_type="LED", gamma: float = 2.2):
+    """
+    Returns a PWMOutput for a pin, created on first use.
+
+    Pins routed to the PWM peripheral use it when the system exposes it and
+    are left out of the GPIO setup, which would take them from the
+    peripheral. Other pins are set up as outputs starting LOW and modulated
+    by the shared soft PWM. Every PWM output is turned off at shutdown.
+
+    Args:
+      pin: The GPIO pin number.
+      component_type: Type of component connected (e.g., "LED").
+      gamma (float): Exponent applied to brightness levels, 1 for none.
+
+    Returns:
+      PWMOutput: The output of the pin.
+    """
+    with self._lock:
+      output = self._pwm_outputs.get(pin)
+      if output is not None:
+        return output
+      if self.soft_pwm is None:
+        self.soft_pwm = SoftPWM()
+        self._hooks.append(self.soft_pwm.close)
+    hardware = None
+    if self.gpio is not None and HardwarePWM.available(pin):
+      try:
+        hardware = HardwarePWM(pin)
+      except OSError as e:
+        print(f"Hardware PWM unavailable on pin {pin}, using soft PWM: {e}")
+    if hardware is not None:
+      controller = GPIOController(gpio=self.gpio, pin=pin, component_type=component_type, configure=False)
+    else:
+      controller = self.controller(pin, component_type, initial=False)
+    output = PWMOutput(controller, self.soft_pwm, hardware=hardware or False, gamma=gamma)
+    with self._lock:
+      self._pwm_outputs[pin] = output
+      if hardware is not None:
+        self._hooks.append(output.close)
+    return output
+
+  def on_shutdown(self, callback):
+    """
+    Registers a callback run by shutdown() before the pins are made safe.
+
+    Callbacks run in the reverse order of registration.
+    """
+    self._hooks.append(callback)
+    return callback
+
+  def shutdown(self):
+    """
+    Runs the shutdown hooks, drives every output to its safe level in one
+    batched pass and releases the pins. Only the first call has an effect.
+
+    Returns:
+      float: How long the shutdown took in seconds.
+    """
+    with self._lock:
+      if self.shutdown_seconds is not None:
+        return self.shutdown_seconds
+      start = time.perf_counter()
+      for callback in reversed(self._hooks):
+        try:
+          callback()
+        except Exception as e:
+          print(f"Error during GPIO shutdown: {e}")
+      self.bank.apply({
+        controller: self._safe_states[pin] for pin, controller in self._controllers.items()
+      })
+      if self.gpio is not None:
+        self.gpio.cleanup()
+      self.shutdown_seconds = time.perf_counter() - start
+      return self.shutdown_seconds
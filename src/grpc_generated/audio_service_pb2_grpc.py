@@ -30,6 +30,11 @@ class AudioServiceStub(object):
                 request_serializer=audio__service__pb2.HealthCheckRequest.SerializeToString,
                 response_deserializer=audio__service__pb2.HealthCheckResponse.FromString,
                 )
+        self.StreamClassifications = channel.unary_stream(
+                '/audio_service.AudioService/StreamClassifications',
+                request_serializer=audio__service__pb2.SessionRequest.SerializeToString,
+                response_deserializer=audio__service__pb2.AudioResponse.FromString,
+                )
 
 
 class AudioServiceServicer(object):
@@ -57,6 +62,13 @@ class AudioServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamClassifications(self, request, context):
+        """Record continuously and stream a prediction for every window until cancelled
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AudioServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -75,6 +87,11 @@ def add_AudioServiceServicer_to_server(servicer, server):
                     request_deserializer=audio__service__pb2.HealthCheckRequest.FromString,
                     response_serializer=audio__service__pb2.HealthCheckResponse.SerializeToString,
             ),
+            'StreamClassifications': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamClassifications,
+                    request_deserializer=audio__service__pb2.SessionRequest.FromString,
+                    response_serializer=audio__service__pb2.AudioResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'audio_service.AudioService', rpc_method_handlers)
@@ -136,3 +153,20 @@ class AudioService(object):
             audio__service__pb2.HealthCheckResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamClassifications(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/audio_service.AudioService/StreamClassifications',
+            audio__service__pb2.SessionRequest.SerializeToString,
+            audio__service__pb2.AudioResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
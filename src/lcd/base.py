@@ -54,6 +54,21 @@ class Writer(ABC):
         """
         pass
 
+    def write_lines(self, lines):
+        """
+        Replace the display content with one string per row.
+
+        The default implementation joins the lines with newlines and passes
+        them to write(). Writers that keep a frame buffer should override it.
+
+        Args:
+            lines (list): The text of each row, from the top.
+
+        Raises:
+            Exception: If there's an error writing to the display.
+        """
+        self.write("\n".join(lines))
+
     @abstractmethod
     def clear(self):
         """
@@ -0,0 +1,114 @@
+"""
+Helpers for treating a character display as a frame of rows × cols cells.
+"""
+
+from functools import lru_cache
+import textwrap
+
+
+def blank_frame(cols, rows):
+    """
+    Returns a frame of rows strings of cols spaces.
+    """
+    return [" " * cols for _ in range(rows)]
+
+
+def layout(text, cols, rows):
+    """
+    Lay text out on a display the way write_string() would on a fresh screen.
+
+    Text starts at the top left corner and continues on the next row when a
+    row is full. A newline starts a new row, carriage returns are ignored.
+    Text that does not fit is cut off.
+
+    Args:
+        text (str): The text to lay out.
+        cols (int): Number of columns of the display.
+        rows (int): Number of rows of the display.
+
+    Returns:
+        list: The frame as rows strings of exactly cols characters.
+    """
+    lines = []
+    for line in text.replace("\r", "").split("\n"):
+        if not line:
+            lines.append("")
+        while line:
+            lines.append(line[:cols])
+            line = line[cols:]
+    return fit(lines, cols, rows)
+
+
+def fit(lines, cols, rows):
+    """
+    Pad or cut a list of lines to exactly rows lines of cols characters.
+    """
+    lines = [line[:cols].ljust(cols) for line in list(lines)[:rows]]
+    return lines + [" " * cols] * (rows - len(lines))
+
+
+def diff(old, new, merge_gap=1):
+    """
+    Find the runs of cells that differ between two frames.
+
+    Runs on the same row separated by at most merge_gap unchanged cells are
+    merged, since rewriting a cell costs the same as moving the cursor past it.
+
+    Args:
+        old (list): The frame currently displayed.
+        new (list): The frame to display, with the same geometry.
+        merge_gap (int): Largest number of unchanged cells merged into a run.
+
+    Returns:
+        list: (row, col, text) tuples, in display order.
+    """
+    runs = []
+    for row, (old_line, new_line) in enumerate(zip(old, new)):
+        if old_line == new_line:
+            continue
+        start = None
+        end = None
+        for col, (a, b) in enumerate(zip(old_line, new_line)):
+            if a == b:
+                continue
+            if start is not None and col - end - 1 > merge_gap:
+                runs.append((row, start, new_line[start:end + 1]))
+                start = None
+            if start is None:
+                start = col
+            end = col
+        if start is not None:
+            runs.append((row, start, new_line[start:end + 1]))
+    return runs
+
+
+@lru_cache(maxsize=128)
+def message_frames(text, cols, rows, gap=4):
+    """
+    Compute the frames that display a message, cached by their arguments.
+
+    Text that fits once word-wrapped is a single frame. Longer text becomes
+    a marquee on the top row: one frame per scroll step, with the text
+    followed by gap spaces so that the last frame leads back to the first.
+
+    Args:
+        text (str): The message.
+        cols (int): Number of columns of the display.
+        rows (int): Number of rows of the display.
+        gap (int): Spaces between the end of the text and its next pass.
+
+    Returns:
+        tuple: The frames, each a tuple of rows strings of cols characters.
+    """
+    lines = []
+    for paragraph in text.replace("\r", "").split("\n"):
+        lines.extend(textwrap.wrap(paragraph, cols, break_long_words=False) or [""])
+    if len(lines) <= rows and all(len(line) <= cols for line in lines):
+        return (tuple(fit(lines, cols, rows)),)
+
+    loop = " ".join(text.split()) + " " * gap
+    doubled = loop * (cols // len(loop) + 2)
+    return tuple(
+        tuple(fit([doubled[step:step + cols]], cols, rows))
+        for step in range(len(loop))
+    )
@@ -0,0 +1,68 @@
+"""
+Custom characters for the HD44780 CGRAM and the bar graphs drawn with them.
+
+A character cell is 5 pixels wide, so a bar is drawn with full cells and
+one partial cell lighting 1 to 4 pixel columns. Each of them is written as
+the Unicode block character closest to its width and turned into a CGRAM
+glyph by the writer, so bar text can be scheduled, wrapped and diffed like
+any other text.
+"""
+
+CELL_COLUMNS = 5
+
+# Block characters lighting 0 to 5 pixel columns of a cell, from the left
+BAR_CHARS = " ▎▍▋▊█"
+
+
+def column_bitmap(columns):
+    """
+    Returns the 5x8 bitmap of a cell with its left columns lit.
+
+    The bottom row is left blank, as it is the cursor line, which keeps bars
+    on neighbouring rows apart.
+    """
+    row = (0b11111 << (CELL_COLUMNS - columns)) & 0b11111
+    return (row,) * 7 + (0,)
+
+
+# Maps each bar character to its bitmap
+BAR_GLYPHS = {char: column_bitmap(columns) for columns, char in enumerate(BAR_CHARS) if columns}
+
+
+def bar(value, width):
+    """
+    Returns the text of a horizontal bar.
+
+    Args:
+        value (float): Filled fraction of the bar, clamped to 0..1.
+        width (int): Width of the bar in cells.
+
+    Returns:
+        str: width characters, full cells, one partial cell and padding.
+    """
+    value = min(max(value, 0.0), 1.0)
+    columns = round(value * width * CELL_COLUMNS)
+    full, partial = divmod(columns, CELL_COLUMNS)
+    text = BAR_CHARS[-1] * full
+    if partial:
+        text += BAR_CHARS[partial]
+    return text.ljust(width)
+
+
+def bar_chart(bars, cols):
+    """
+    Returns one row per bar: the label, the bar and the value as a percentage.
+
+    Args:
+        bars (list): (label, value) pairs with values between 0 and 1.
+        cols (int): Number of columns of the display.
+
+    Returns:
+        str: The rows joined with newlines.
+    """
+    label_width = (cols - 5) // 2
+    bar_width = cols - 5 - label_width
+    return "\n".join(
+        f"{label[:label_width - 1]:<{label_width}}{bar(value, bar_width)}{min(max(value, 0.0), 1.0):>5.0%}"
+        for label, value in bars
+    )
@@ -1,10 +1,44 @@
 from ..base import Writer
+from ..frame import blank_frame, diff, fit, layout
+from ..glyphs import BAR_GLYPHS
+from collections import OrderedDict
 from RPLCD.i2c import CharLCD
 
 class CharLCDWriter(Writer):
     """
     Concrete implementation of the Writer interface for character LCD displays.
+
+    The writer keeps a shadow copy of the frame on the display. An update
+    only moves the cursor to, and rewrites, the cells that changed, and a
+    clear of an already blank display is skipped. When most of the display
+    changes, clearing it and writing the non-blank cells is used instead if
+    that needs fewer I2C bytes.
+
+    Every LCD byte (a character or a command) is sent by RPLCD as two
+    nibbles, each followed by an enable pulse, so it costs a fixed number of
+    I2C writes to the expander. These are counted per update.
+
+    Characters registered in glyphs (the bar graph blocks by default) are
+    drawn as custom characters. They are uploaded to one of the 8 CGRAM
+    slots the first time they are displayed and stay resident; when every
+    slot is taken the least recently used glyph that is not on the display
+    is evicted, since redefining a slot changes every cell showing it.
+
+    Attributes:
+        lcd: The RPLCD CharLCD driver.
+        glyphs (dict): Maps each custom character to its 5x8 bitmap.
+        glyph_uploads (int): Number of glyphs written to CGRAM.
+        glyph_hits (int): Number of glyph lookups served by a resident glyph.
+        glyph_evictions (int): Number of glyphs evicted to free a slot.
+        i2c_bytes (int): Total I2C bytes sent to the expander by this writer.
+        last_update_bytes (int): I2C bytes sent by the last write or clear.
+        update_count (int): Number of writes and clears that reached the display.
+        skipped_updates (int): Number of writes and clears skipped as unchanged.
     """
+    # I2C bytes sent per LCD byte: 2 nibbles x (data write + 3 enable pulse
+    # writes) for the PCF8574, 2 nibbles x 3 register writes of 2 bytes for MCP230xx
+    I2C_BYTES_PER_LCD_BYTE = {"PCF8574": 8, "MCP23008": 12, "MCP23017": 12}
+    CGRAM_SLOTS = 8
 
     def __init__(
             self,
@@ -23,19 +57,49 @@ class CharLCDWriter(Writer):
             rows=rows,
             dotsize=dotsize,
         )
-        self.lcd = CharLCD(
-            i2c_expander=i2c_expander,
-            address=address,
-            port=port,
-            cols=cols,
-            rows=rows,
-            dotsize=dotsize,
+        self.i2c_bytes = 0
+        self.last_update_bytes = 0
+        self.update_count = 0
+        self.skipped_updates = 0
+        self.glyphs = dict(BAR_GLYPHS)
+        self.glyph_uploads = 0
+        self.glyph_hits = 0
+        self.glyph_evictions = 0
+        # Resident glyphs in least recently used order, mapped to their slot
+        self._slots = OrderedDict()
+        self._bytes_per_lcd_byte = self.I2C_BYTES_PER_LCD_BYTE.get(i2c_expander, 8)
+        # RPLCD clears the display and homes the cursor when it initialises
+        self._frame = blank_frame(cols, rows)
+        self._cursor = (0, 0)
+        self.lcd = self._open()
+
+    def _open(self):
+        """
+        Returns the driver of the display, an RPLCD CharLCD.
+        """
+        return CharLCD(
+            i2c_expander=self.i2c_expander,
+            address=self.address,
+            port=self.port,
+            cols=self.cols,
+            rows=self.rows,
+            dotsize=self.dotsize,
         )
 
+    @property
+    def frame(self):
+        """
+        list: The rows currently on the display, None if unknown after an error.
+        """
+        return None if self._frame is None else list(self._frame)
+
     def write(self, text: str):
         """
         Write text to the LCD display.
 
+        The text replaces the whole display content, starting at the top
+        left corner and wrapping at the end of each row.
+
         Args:
             text (str): The text to display on the LCD.
 
@@ -43,18 +107,185 @@ class CharLCDWriter(Writer):
             Exception: If there's an error writing to the display.
         """
         try:
-            self.lcd.write_string(text)
+            self._show(layout(text, self.cols, self.rows))
+        except Exception as e:
+            raise Exception(f"Error writing to LCD: {e}")
+
+    def write_lines(self, lines):
+        """
+        Replace the display content with one string per row.
+
+        Args:
+            lines (list): The text of each row, from the top. Missing rows are
+                blanked and text beyond the last column is cut off.
+
+        Raises:
+            Exception: If there's an error writing to the display.
+        """
+        try:
+            self._show(fit(lines, self.cols, self.rows))
         except Exception as e:
             raise Exception(f"Error writing to LCD: {e}")
 
+    def define_glyph(self, char, bitmap):
+        """
+        Register a custom character drawn from a bitmap.
+
+        Args:
+            char (str): The character used for the glyph in text.
+            bitmap (tuple): 8 rows of 5 pixels, one integer per row.
+        """
+        if len(bitmap) != 8:
+            raise ValueError("A glyph bitmap needs exactly 8 rows")
+        bitmap = tuple(bitmap)
+        if char in self._slots and self.glyphs.get(char) != bitmap:
+            # The resident copy is stale, upload it again on next use
+            del self._slots[char]
+        self.glyphs[char] = bitmap
+
     def clear(self):
         """
         Clear the LCD display.
 
+        Nothing is sent if the display is already blank.
+
         Raises:
             Exception: If there's an error clearing the display.
         """
+        if self._frame == blank_frame(self.cols, self.rows):
+            self.skipped_updates += 1
+            self.last_update_bytes = 0
+            return
+        sent = self.i2c_bytes
         try:
-            self.lcd.clear()
+            self._clear()
         except Exception as e:
-            raise Exception(f"Error clearing LCD: {e}")
\ No newline at end of file
+            self._frame = None
+            raise Exception(f"Error clearing LCD: {e}")
+        finally:
+            self.last_update_bytes = self.i2c_bytes - sent
+        self.update_count += 1
+
+    def _resolve(self, frame):
+        """
+        Replaces the custom characters of a frame with their CGRAM slots,
+        uploading the glyphs that are not resident.
+        """
+        used = {char for line in frame for char in line if char in self.glyphs}
+        if not used:
+            return frame
+        if len(used) > self.CGRAM_SLOTS:
+            raise Exception(f"{len(used)} custom characters do not fit in {self.CGRAM_SLOTS} CGRAM slots")
+        # The frame replaces every cell, so only the slots it shows must keep
+        # their glyph: those of its resident glyphs and any raw slot codes
+        pinned = {chr(self._slots[char]) for char in used if char in self._slots}
+        pinned |= {char for line in frame for char in line if ord(char) < self.CGRAM_SLOTS}
+        codes = {}
+        for char in sorted(used):
+            codes[char] = chr(self._slot(char, pinned))
+            pinned.add(codes[char])
+        return ["".join(codes.get(char, char) for char in line) for line in frame]
+
+    def _slot(self, char, pinned):
+        """
+        Returns the CGRAM slot holding a glyph, uploading it if needed.
+        """
+        slot = self._slots.get(char)
+        if slot is not None:
+            self._slots.move_to_end(char)
+            self.glyph_hits += 1
+            return slot
+        taken = set(self._slots.values())
+        free = [slot for slot in range(self.CGRAM_SLOTS) if slot not in taken]
+        if free:
+            slot = free[0]
+        else:
+            victim = next((resident for resident, slot in self._slots.items() if chr(slot) not in pinned), None)
+            if victim is None:
+                raise Exception("No free CGRAM slot, every glyph is on the display")
+            slot = self._slots.pop(victim)
+            self.glyph_evictions += 1
+        try:
+            self.lcd.create_char(slot, self.glyphs[char])
+        except Exception:
+            # The cursor may have been left in CGRAM
+            self._frame = None
+            raise
+        # Set CGRAM address, 8 rows, then the cursor is moved back
+        self._sent(10)
+        self.glyph_uploads += 1
+        self._slots[char] = slot
+        return slot
+
+    def _show(self, frame):
+        sent = self.i2c_bytes
+        frame = self._resolve(frame)
+        if frame == self._frame:
+            # Glyphs redefined since the last update may have been uploaded
+            self.skipped_updates += 1
+            self.last_update_bytes = self.i2c_bytes - sent
+            return
+        try:
+            blank = blank_frame(self.cols, self.rows)
+            redraw = diff(blank, frame)
+            if self._frame is None:
+                self._clear()
+                self._draw(redraw)
+            else:
+                runs = diff(self._frame, frame)
+                # A clear costs one command but blanks every cell at once
+                if 1 + self._cost(redraw, (0, 0)) < self._cost(runs, self._cursor):
+                    self._clear()
+                    self._draw(redraw)
+                else:
+                    self._draw(runs)
+            self._frame = frame
+        except Exception:
+            # The display content is unknown after a partial update
+            self._frame = None
+            raise
+        finally:
+            self.last_update_bytes = self.i2c_bytes - sent
+        self.update_count += 1
+
+    def _cost(self, runs, cursor):
+        """
+        Returns the number of LCD bytes needed to write runs from cursor.
+        """
+        cost = 0
+        for row, col, text in runs:
+            if (row, col) != cursor:
+                cost += 1
+            cost += len(text)
+            cursor, wrapped = self._advance(row, col, len(text))
+            cost += wrapped
+        return cost
+
+    def _advance(self, row, col, length):
+        """
+        Returns the cursor after writing length characters at (row, col), and
+        whether RPLCD moved it to the next row with an extra command.
+        """
+        col += length
+        if col >= self.cols:
+            return ((row + 1) % self.rows, 0), 1
+        return (row, col), 0
+
+    def _draw(self, runs):
+        for row, col, text in runs:
+            if (row, col) != self._cursor:
+                self.lcd.cursor_pos = (row, col)
+                self._sent(1)
+            self.lcd.write_string(text)
+            self._sent(len(text))
+            self._cursor, wrapped = self._advance(row, col, len(text))
+            self._sent(wrapped)
+
+    def _clear(self):
+        self.lcd.clear()
+        self._sent(1)
+        self._frame = blank_frame(self.cols, self.rows)
+        self._cursor = (0, 0)
+
+    def _sent(self, lcd_bytes):
+        self.i2c_bytes += lcd_bytes * self._bytes_per_lcd_byte
@@ -0,0 +1,242 @@
+from .charlcd_writer import CharLCDWriter
+from collections import deque
+from dataclasses import dataclass
+import time
+
+class VirtualHD44780:
+    """
+    In-memory HD44780 controller behind a PCF8574 expander, driven through
+    the subset of the RPLCD CharLCD API used by CharLCDWriter.
+
+    The controller keeps the display data RAM, the 8 CGRAM
+    glyphs and the address counter, and moves the cursor the way RPLCD does,
+    continuing on the next row after the last column. Every LCD byte is
+    counted with the I2C bytes it costs, and a simulated clock advances by
+    the time it takes on the bus plus the waits RPLCD makes after each
+    nibble, cursor move and clear.
+
+    A clear keeps the controller busy for CLEAR_TIME. An instruction sent
+    before that is lost on real hardware and counted in busy_violations.
+
+    Attributes:
+        ddram (bytearray): Display data RAM, row n starts at row_offsets[n].
+        cgram (list): The bitmap of each of the 8 custom characters.
+        address (int): The DDRAM address counter.
+        commands (int): Instructions sent.
+        data_bytes (int): Data bytes sent, to DDRAM or CGRAM.
+        clears (int): Clear display instructions sent.
+        i2c_bytes (int): I2C bytes sent to the expander.
+        elapsed (float): Simulated time spent on the bus in seconds.
+        busy_violations (int): Instructions sent while a clear was running.
+    """
+    CLEAR_TIME = 1.52e-3
+    # RPLCD waits 2 x 102 us for the enable pulses of each byte, 50 us after
+    # moving the cursor and 2 ms after a clear
+    BYTE_DELAY = 204e-6
+    CURSOR_DELAY = 50e-6
+    CLEAR_DELAY = 2e-3
+    # Each I2C write to the expander is an address and a data byte with acks
+    BITS_PER_I2C_WRITE = 18
+
+    def __init__(self, cols=16, rows=2, i2c_bytes_per_lcd_byte=8, bus_hz=100000, clear_delay=CLEAR_DELAY):
+        self.cols = cols
+        self.rows = rows
+        self.i2c_bytes_per_lcd_byte = i2c_bytes_per_lcd_byte
+        self.bus_hz = bus_hz
+        self.clear_delay = clear_delay
+        self.row_offsets = (0x00, 0x40, cols, 0x40 + cols)
+        self.ddram = bytearray(b" " * 0x80)
+        self.cgram = [(0,) * 8 for _ in range(8)]
+        self.address = 0
+        self.commands = 0
+        self.data_bytes = 0
+        self.clears = 0
+        self.i2c_bytes = 0
+        self.elapsed = 0.0
+        self.busy_violations = 0
+        self._busy_until = 0.0
+        self._cursor = (0, 0)
+
+    @property
+    def cursor_pos(self):
+        return self._cursor
+
+    @cursor_pos.setter
+    def cursor_pos(self, value):
+        row, col = value
+        if row not in range(self.rows) or col not in range(self.cols):
+            raise ValueError(f"Cursor position {value!r} invalid on a {self.rows}x{self.cols} LCD.")
+        self._cursor = (row, col)
+        self._command()
+        self.address = self.row_offsets[row] + col
+        self.elapsed += self.CURSOR_DELAY
+
+    def write_string(self, value):
+        for char in value:
+            row, col = self._cursor
+            if char == "\n":
+                self.cursor_pos = ((row + 1) % self.rows, col)
+            elif char == "\r":
+                self.cursor_pos = (row, 0)
+            else:
+                self._data()
+                self.ddram[self.address] = ord(char) if ord(char) < 0x100 else 0x20
+                self.address += 1
+                if col + 1 < self.cols:
+                    self._cursor = (row, col + 1)
+                else:
+                    self.cursor_pos = ((row + 1) % self.rows, 0)
+
+    def clear(self):
+        self._command()
+        self.clears += 1
+        self.ddram[:] = b" " * len(self.ddram)
+        self.address = 0
+        self._cursor = (0, 0)
+        self._busy_until = self.elapsed + self.CLEAR_TIME
+        self.elapsed += self.clear_delay
+
+    def create_char(self, location, bitmap):
+        if not 0 <= location <= 7:
+            raise ValueError("Only locations 0-7 are valid.")
+        if len(bitmap) != 8:
+            raise ValueError("Bitmap should have exactly 8 rows.")
+        self._command()
+        for _ in bitmap:
+            self._data()
+        self.cgram[location] = tuple(bitmap)
+        # RPLCD moves the cursor back to DDRAM afterwards
+        self.cursor_pos = self._cursor
+
+    def close(self, clear=False):
+        if clear:
+            self.clear()
+
+    def row(self, row):
+        """
+        Returns the codes shown on a row.
+        """
+        start = self.row_offsets[row]
+        return bytes(self.ddram[start:start + self.cols])
+
+    def _command(self):
+        self.commands += 1
+        self._transfer()
+
+    def _data(self):
+        self.data_bytes += 1
+        self._transfer()
+
+    def _transfer(self):
+        if self.elapsed < self._busy_until:
+            self.busy_violations += 1
+        self.i2c_bytes += self.i2c_bytes_per_lcd_byte
+        self.elapsed += self.i2c_bytes_per_lcd_byte * self.BITS_PER_I2C_WRITE / self.bus_hz + self.BYTE_DELAY
+
+
+@dataclass
+class LCDUpdate:
+    """
+    One write or clear of a VirtualLCDWriter.
+
+    Attributes:
+        timestamp (float): time.monotonic() when the update was made.
+        operation (str): "write", "write_lines" or "clear".
+        text (str): The text written, or the rows joined with newlines.
+        lines (list): The rows on the display after the update.
+        i2c_bytes (int): I2C bytes sent by the update, 0 if it was skipped.
+        duration (float): Simulated time the update took on the bus in seconds.
+    """
+    timestamp: float
+    operation: str
+    text: str
+    lines: list
+    i2c_bytes: int
+    duration: float
+
+
+class VirtualLCDWriter(CharLCDWriter):
+    """
+    Writer drawing on an emulated HD44780 instead of a display on I2C.
+
+    The updates take the same path as with CharLCDWriter, frame buffer and
+    glyph cache included, down to a VirtualHD44780. Each write and clear is
+    recorded with its timestamp, I2C bytes and simulated bus time, so LCD
+    code paths can be asserted and benchmarked without hardware.
+
+    Attributes:
+        lcd (VirtualHD44780): The emulated controller.
+        updates (deque): The recorded LCDUpdates, oldest first.
+        on_update: Optional callback called with each LCDUpdate.
+    """
+    def __init__(
+            self,
+            i2c_expander="PCF8574",
+            address=0x27,
+            port=1,
+            cols=16,
+            rows=2,
+            dotsize=8,
+            bus_hz=100000,
+            max_updates=1000,
+            on_update=None,
+        ):
+        self.bus_hz = bus_hz
+        self.updates = deque(maxlen=max_updates)
+        self.on_update = on_update
+        super().__init__(
+            i2c_expander=i2c_expander,
+            address=address,
+            port=port,
+            cols=cols,
+            rows=rows,
+            dotsize=dotsize,
+        )
+
+    @property
+    def lines(self):
+        """
+        list: The rows shown by the controller, custom characters included.
+        """
+        glyphs = {slot: char for char, slot in self._slots.items()}
+        return [
+            "".join(glyphs.get(code, "?") if code < 8 else chr(code) for code in self.lcd.row(row))
+            for row in range(self.rows)
+        ]
+
+    def write(self, text: str):
+        self._record("write", text, super().write, text)
+
+    def write_lines(self, lines):
+        lines = list(lines)
+        self._record("write_lines", "\n".join(lines), super().write_lines, lines)
+
+    def clear(self):
+        self._record("clear", "", super().clear)
+
+    def _open(self):
+        return VirtualHD44780(
+            cols=self.cols,
+            rows=self.rows,
+            i2c_bytes_per_lcd_byte=self._bytes_per_lcd_byte,
+            bus_hz=self.bus_hz,
+        )
+
+    def _record(self, operation, text, update, *args):
+        timestamp = time.monotonic()
+        sent = self.lcd.i2c_bytes
+        start = self.lcd.elapsed
+        try:
+            update(*args)
+        finally:
+            record = LCDUpdate(
+                timestamp=timestamp,
+                operation=operation,
+                text=text,
+                lines=self.lines,
+                i2c_bytes=self.lcd.i2c_bytes - sent,
+                duration=self.lcd.elapsed - start,
+            )
+            self.updates.append(record)
+            if self.on_update is not None:
+                self.on_update(record)
@@ -1,20 +1,134 @@
 from .base import Writer
+from .frame import blank_frame, fit, message_frames
+from .glyphs import bar_chart
+from .scheduler import Message, MessageScheduler
+import threading
 
 class LCDService:
   """
   A service class for managing LCD operations.
 
+  By default every call writes to the display before returning. In
+  asynchronous mode a single render thread owns the display: write() and
+  clear() only queue the request and return immediately, so a slow I2C bus
+  never stalls the caller. Each request replaces the whole display, so when
+  several are pending the render thread draws only the newest one and
+  counts the others as dropped.
+
+  Text longer than the display is word-wrapped over the rows, and text that
+  still does not fit scrolls as a marquee on the top row. The frames of a
+  message are computed once and cached, and the render thread plays them
+  every scroll_interval seconds until the next request; with a frame buffer
+  writer only the cells that changed are rewritten. Without the render
+  thread the first frame stays on the display.
+
+  Every update runs under one lock, so threads sharing the service never
+  interleave their output, and show() replaces all rows in one transaction.
+  An update requesting exactly the content already on the display is
+  skipped. Updates that had to wait for another thread are counted in
+  contentions.
+
+  post() hands messages with a priority, a minimum display time, a duration
+  and an expiry to a MessageScheduler, which takes care of the timed
+  transitions so callers never sleep to keep text on screen. write(),
+  show() and clear() draw straight away and replace the scheduled message
+  on the display.
+
   Attributes:
     writer: An instance of a Writer class that handles LCD writing operations.
+    asynchronous (bool): Whether requests are drawn by the render thread.
+    rendered_frames (int): Number of requests drawn by the render thread.
+    dropped_frames (int): Number of requests superseded before being drawn.
+    max_queue_depth (int): Largest number of requests seen pending at once.
+    scroll_interval (float): Seconds between two marquee frames.
+    scroll_steps (int): Number of marquee frames drawn after the first one.
+    skipped_updates (int): Number of updates skipped because the content was already displayed.
+    contentions (int): Number of updates that waited for another thread.
+    scheduler (MessageScheduler): Scheduler used by post(), created on first use.
   """
-  def __init__(self, writer: Writer):
+  def __init__(self, writer: Writer, asynchronous: bool = False, scroll_interval: float = 0.4):
     """
     Initializes the LCDService with a specific Writer instance.
 
     Args:
       writer (Writer): An instance of a Writer class that implements the LCD writing functionality.
+      asynchronous (bool): Whether to draw on a background render thread.
+      scroll_interval (float): Seconds between two marquee frames.
     """
     self.writer = writer
+    self.asynchronous = asynchronous
+    self.rendered_frames = 0
+    self.dropped_frames = 0
+    self.max_queue_depth = 0
+    self.scroll_interval = scroll_interval
+    self.scroll_steps = 0
+    self.skipped_updates = 0
+    self.contentions = 0
+    self.scheduler = None
+    self._animation = None
+    # The content last drawn, as a tuple of frames, None if unknown
+    self._content = None
+    self._lock = threading.Lock()
+    self._pending = []
+    self._busy = False
+    self._running = False
+    self._condition = threading.Condition()
+    self._thread = None
+    if asynchronous:
+      self.start()
+
+  @property
+  def queue_depth(self):
+    """
+    int: Number of requests waiting for the render thread.
+    """
+    with self._condition:
+      return len(self._pending)
+
+  def start(self):
+    """
+    Starts the render thread and switches to asynchronous mode.
+    """
+    with self._condition:
+      if self._running:
+        return
+      self._running = True
+      self.asynchronous = True
+    self._thread = threading.Thread(target=self._render_loop, name="lcd-render", daemon=True)
+    self._thread.start()
+
+  def close(self, timeout: float = 1.0):
+    """
+    Stops the message scheduler, draws the newest pending request, then
+    stops the render thread.
+
+    Args:
+      timeout (float): Maximum time to wait for the render thread in seconds.
+    """
+    if self.scheduler is not None:
+      self.scheduler.close()
+      self.scheduler = None
+    with self._condition:
+      if not self._running:
+        return
+      self._running = False
+      self._condition.notify_all()
+    self._thread.join(timeout)
+    self._thread = None
+    self.asynchronous = False
+
+  def flush(self, timeout: float = None):
+    """
+    Waits until the render thread has drawn every pending request.
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+
+    Returns:
+      bool: True if the display is up to date, False on timeout.
+    """
+    with self._condition:
+      return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
 
   def write(self, text: str):
     """
@@ -23,18 +137,218 @@ class LCDService:
     Args:
       text (str): The text to be displayed on the LCD.
     """
-    try:
-      self.writer.write(text)
-    except Exception as e:
-      print(f"Error writing to LCD: {e}")
+    self._release_scheduled()
+    self._submit_text(text)
+
+  def show(self, lines):
+    """
+    Replaces the whole LCD display with one string per row, atomically.
+
+    Args:
+      lines (list): The text of each row, from the top. Missing rows are
+        blanked and text beyond the last column is cut off.
+    """
+    cols = getattr(self.writer, 'cols', 16)
+    rows = getattr(self.writer, 'rows', 2)
+    lines = fit(lines, cols, rows)
+    self._release_scheduled()
+    self._submit((tuple(lines),), self._write_lines, lines)
 
   def clear(self):
     """
     Clears the LCD display.
-    
+
     This method calls the clear method of the Writer instance to clear any text currently displayed.
     """
+    self._release_scheduled()
+    self._submit_clear()
+
+  def write_bar(self, bars):
+    """
+    Writes probability bars to the LCD display, one row per bar.
+
+    Bars are drawn with custom characters on writers that support them,
+    such as CharLCDWriter.
+
+    Args:
+      bars (list): (label, value) pairs with values between 0 and 1, extra bars are left out.
+    """
+    self.write(self.bar_text(bars))
+
+  def bar_text(self, bars):
+    """
+    Returns the text drawing bars on this display, e.g. for post().
+
+    Args:
+      bars (list): (label, value) pairs with values between 0 and 1, extra bars are left out.
+    """
+    cols = getattr(self.writer, 'cols', 16)
+    rows = getattr(self.writer, 'rows', 2)
+    return bar_chart(list(bars)[:rows], cols)
+
+  def post(
+      self,
+      text: str,
+      priority: int = 0,
+      min_display: float = 0.0,
+      duration: float = None,
+      expiry: float = None,
+    ):
+    """
+    Schedules a message for the display.
+
+    The message is shown straight away if the display is free, if it has a
+    higher priority than the current message or once the current message's
+    minimum display time has passed. Otherwise it waits its turn, and is
+    dropped if it is still waiting after expiry seconds.
+
+    Args:
+      text (str): The text to be displayed on the LCD.
+      priority (int): Higher priorities replace lower ones straight away.
+      min_display (float): Seconds the message stays before a message of the same or lower priority replaces it.
+      duration (float): Seconds after which the message is taken down, None keeps it until replaced.
+      expiry (float): Seconds the message may wait to be shown, None waits forever.
+
+    Returns:
+      Message: The scheduled message.
+    """
+    if self.scheduler is None:
+      self.scheduler = MessageScheduler(self._show_message)
+    return self.scheduler.post(Message(
+      text=text,
+      priority=priority,
+      min_display=min_display,
+      duration=duration,
+      expiry=expiry,
+    ))
+
+  def _show_message(self, message):
+    if message is None:
+      self._submit_clear()
+    else:
+      self._submit_text(message.text)
+
+  def _release_scheduled(self):
+    scheduler = self.scheduler
+    if scheduler is not None:
+      scheduler.release()
+
+  def _submit_text(self, text):
+    self._submit(self._frames(text)[1], self._write, text)
+
+  def _submit_clear(self):
+    cols = getattr(self.writer, 'cols', 16)
+    rows = getattr(self.writer, 'rows', 2)
+    self._submit((tuple(blank_frame(cols, rows)),), self._clear)
+
+  def _frames(self, text):
+    cols = getattr(self.writer, 'cols', 16)
+    rows = getattr(self.writer, 'rows', 2)
+    return cols, message_frames(text, cols, rows)
+
+  def _write(self, text):
+    self._animation = None
+    cols, frames = self._frames(text)
+    try:
+      if len(frames) == 1 and "\n" not in text and len(text) <= cols:
+        self.writer.write(text)
+      else:
+        self.writer.write_lines(list(frames[0]))
+        if len(frames) > 1:
+          self._animation = [frames, 1]
+    except Exception as e:
+      self._content = None
+      print(f"Error writing to LCD: {e}")
+
+  def _write_lines(self, lines):
+    self._animation = None
+    try:
+      self.writer.write_lines(lines)
+    except Exception as e:
+      self._content = None
+      print(f"Error writing to LCD: {e}")
+
+  def _scroll(self):
+    frames, index = self._animation
+    self._animation[1] = (index + 1) % len(frames)
+    self.scroll_steps += 1
+    try:
+      self.writer.write_lines(list(frames[index]))
+    except Exception as e:
+      print(f"Error writing to LCD: {e}")
+
+  def _clear(self):
+    self._animation = None
     try:
       self.writer.clear()
     except Exception as e:
+      self._content = None
       print(f"Error clearing LCD: {e}")
+
+  def _submit(self, content, render, *args):
+    """
+    Draws a request now, or queues it for the render thread.
+    """
+    if not self.asynchronous:
+      self._acquire(self._lock)
+      try:
+        self._render(content, render, args)
+      finally:
+        self._lock.release()
+      return
+    self._acquire(self._condition)
+    try:
+      self._pending.append((content, render, args))
+      self.max_queue_depth = max(self.max_queue_depth, len(self._pending))
+      self._condition.notify_all()
+    finally:
+      self._condition.release()
+
+  def _acquire(self, lock):
+    """
+    Acquires lock, counting a contention if another thread holds it.
+    """
+    if lock.acquire(blocking=False):
+      return
+    lock.acquire()
+    self.contentions += 1
+
+  def _render(self, content, render, args):
+    """
+    Draws a request unless its content is already on the display, with the lock held.
+    """
+    if content == self._content:
+      self.skipped_updates += 1
+      return
+    self._content = content
+    render(*args)
+
+  def _render_loop(self):
+    while True:
+      with self._condition:
+        # While a marquee plays, wake up for its next frame
+        timeout = None if self._animation is None else self.scroll_interval
+        self._condition.wait_for(lambda: self._pending or not self._running, timeout)
+        if self._pending:
+          # Latest wins: every request replaces the whole display
+          content, render, args = self._pending[-1]
+          self.dropped_frames += len(self._pending) - 1
+          self._pending = []
+          requested = True
+        elif not self._running:
+          return
+        else:
+          requested = False
+        self._busy = True
+      try:
+        with self._lock:
+          if requested:
+            self._render(content, render, args)
+          else:
+            self._scroll()
+      finally:
+        with self._condition:
+          self._busy = False
+          if requested:
+            self.rendered_frames += 1
+          self._condition.notify_all()
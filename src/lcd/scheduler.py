@@ -0,0 +1,279 @@
+from dataclasses import dataclass, field
+import itertools
+import math
+import threading
+import time
+
+class TimerWheel:
+  """
+  Hashed timing wheel driven by its own thread.
+
+  Timers are placed in one of a fixed number of slots according to their
+  due tick, so scheduling and cancelling are O(1) and each tick only looks
+  at one slot. The thread sleeps until the next tick while timers are
+  pending and indefinitely when there are none.
+
+  Attributes:
+    tick (float): Resolution of the wheel in seconds.
+    slots (int): Number of slots, timers further away wrap around in rounds.
+  """
+  def __init__(self, tick: float = 0.05, slots: int = 128):
+    self.tick = tick
+    self.slots = slots
+    self._wheel = [[] for _ in range(slots)]
+    self._cursor = 0
+    self._count = 0
+    self._last_tick = time.monotonic()
+    self._condition = threading.Condition()
+    self._running = False
+    self._thread = None
+
+  def __len__(self):
+    with self._condition:
+      return self._count
+
+  def start(self):
+    with self._condition:
+      if self._running:
+        return
+      self._running = True
+      self._last_tick = time.monotonic()
+    self._thread = threading.Thread(target=self._run, name="lcd-timer-wheel", daemon=True)
+    self._thread.start()
+
+  def stop(self):
+    with self._condition:
+      self._running = False
+      self._condition.notify_all()
+    if self._thread is not None:
+      self._thread.join()
+      self._thread = None
+
+  def schedule(self, delay: float, callback):
+    """
+    Calls callback on the wheel thread after delay seconds, rounded up to a tick.
+
+    Returns:
+      list: A handle for cancel().
+    """
+    with self._condition:
+      now = time.monotonic()
+      if not self._count:
+        self._last_tick = now
+      # Count ticks from the last tick boundary so the timer never fires early
+      ticks = max(1, math.ceil((now - self._last_tick + delay) / self.tick))
+      slot = (self._cursor + ticks) % self.slots
+      # [remaining rounds, callback, cancelled]
+      timer = [(ticks - 1) // self.slots, callback, False]
+      self._wheel[slot].append(timer)
+      self._count += 1
+      self._condition.notify_all()
+      return timer
+
+  def cancel(self, timer):
+    """
+    Cancels a timer returned by schedule(), a no-op if it already fired.
+    """
+    with self._condition:
+      timer[2] = True
+
+  def advance(self):
+    """
+    Moves the wheel forward by the ticks elapsed since the last advance and
+    runs the timers that fell due.
+    """
+    due = []
+    with self._condition:
+      now = time.monotonic()
+      ticks = int((now - self._last_tick) / self.tick)
+      self._last_tick += ticks * self.tick
+      for _ in range(ticks):
+        self._cursor = (self._cursor + 1) % self.slots
+        bucket = self._wheel[self._cursor]
+        kept = []
+        for timer in bucket:
+          if timer[2]:
+            self._count -= 1
+          elif timer[0] == 0:
+            self._count -= 1
+            due.append(timer[1])
+          else:
+            timer[0] -= 1
+            kept.append(timer)
+        self._wheel[self._cursor] = kept
+        if not self._count:
+          self._last_tick = now
+          break
+    for callback in due:
+      callback()
+
+  def _run(self):
+    while True:
+      with self._condition:
+        if not self._running:
+          return
+        if not self._count:
+          self._condition.wait()
+          continue
+        self._condition.wait(max(0.0, self._last_tick + self.tick - time.monotonic()))
+        if not self._running:
+          return
+      self.advance()
+
+
+@dataclass
+class Message:
+  """
+  A message for the display with its timing constraints.
+
+  Attributes:
+    text (str): The text to display.
+    priority (int): Higher priorities replace lower ones straight away.
+    min_display (float): Seconds the message stays before another of the same or lower priority may replace it.
+    duration (float): Seconds after which the message is taken down, None keeps it until replaced.
+    expiry (float): Seconds the message may wait to be shown before it is dropped, None waits forever.
+  """
+  text: str
+  priority: int = 0
+  min_display: float = 0.0
+  duration: float = None
+  expiry: float = None
+  posted_at: float = field(default=0.0, compare=False)
+  shown_at: float = field(default=None, compare=False)
+  sequence: int = field(default=0, compare=False)
+
+
+class MessageScheduler:
+  """
+  Decides which message is on the display and when it changes.
+
+  A posted message is shown at once if nothing is displayed, if it has a
+  higher priority than the current message, or once the current message's
+  minimum display time has passed. Otherwise it waits, highest priority
+  first and in posting order within a priority, and is dropped if its
+  expiry passes first. A message with a duration is taken down when the
+  duration ends, and the display shows the next waiting message or is
+  cleared. All timed transitions run on a TimerWheel, so callers never sleep.
+
+  The show callback is called with a Message, or None to clear the display,
+  while the scheduler's lock is held, so it should return quickly, as
+  LCDService does in asynchronous mode.
+
+  Attributes:
+    show: Callback drawing a message, or clearing the display for None.
+    wheel (TimerWheel): The wheel driving the transitions.
+    current (Message): The message on the display, None if nothing.
+    shown_messages (int): Number of messages displayed.
+    dropped_messages (int): Number of messages dropped because they expired while waiting.
+    preempted_messages (int): Number of messages replaced by a higher priority one before their minimum display time.
+  """
+  def __init__(self, show, wheel: TimerWheel = None):
+    self.show = show
+    self.wheel = wheel or TimerWheel()
+    self.current = None
+    self.shown_messages = 0
+    self.dropped_messages = 0
+    self.preempted_messages = 0
+    self._waiting = []
+    self._sequence = itertools.count()
+    self._lock = threading.RLock()
+    self._timers = []
+    self.wheel.start()
+
+  @property
+  def waiting(self):
+    """
+    list: The messages waiting to be shown, in the order they would be.
+    """
+    with self._lock:
+      return sorted(self._waiting, key=self._order)
+
+  def post(self, message: Message):
+    """
+    Shows a message now or queues it according to its priority.
+
+    Returns:
+      Message: The posted message.
+    """
+    with self._lock:
+      now = time.monotonic()
+      message.posted_at = now
+      message.sequence = next(self._sequence)
+      if self.current is not None and message.priority > self.current.priority:
+        if now < self.current.shown_at + self.current.min_display:
+          self.preempted_messages += 1
+        self._display(message, now)
+        return message
+      self._waiting.append(message)
+      if message.expiry is not None:
+        self._timers.append(self.wheel.schedule(message.expiry, self._advance))
+      self._advance()
+      return message
+
+  def release(self):
+    """
+    Forgets the current message after the display was drawn over directly,
+    so its duration no longer clears the display and the next message is
+    not held back by its minimum display time.
+    """
+    with self._lock:
+      self.current = None
+
+  def close(self):
+    """
+    Stops the timer wheel and forgets the waiting messages.
+    """
+    with self._lock:
+      self._waiting = []
+    self.wheel.stop()
+
+  def _order(self, message):
+    return (-message.priority, message.sequence)
+
+  def _advance(self):
+    """
+    Drops expired messages and moves on to the next message when allowed.
+    """
+    with self._lock:
+      now = time.monotonic()
+      kept = []
+      for message in self._waiting:
+        if message.expiry is not None and now >= message.posted_at + message.expiry:
+          self.dropped_messages += 1
+        else:
+          kept.append(message)
+      self._waiting = kept
+
+      current = self.current
+      if current is not None and current.duration is not None and now >= current.shown_at + current.duration:
+        self.current = current = None
+        if not self._waiting:
+          self.show(None)
+      if current is not None and now < current.shown_at + current.min_display:
+        if self._waiting:
+          remaining = current.shown_at + current.min_display - now
+          self._timers.append(self.wheel.schedule(remaining, self._advance))
+        return
+      if self._waiting:
+        message = min(self._waiting, key=self._order)
+        self._waiting.remove(message)
+        self._display(message, now)
+
+  def _display(self, message, now):
+    for timer in self._timers:
+      self.wheel.cancel(timer)
+    self._timers = []
+    message.shown_at = now
+    self.current = message
+    self.shown_messages += 1
+    self.show(message)
+    if self._waiting and message.min_display:
+      self._timers.append(self.wheel.schedule(message.min_display, self._advance))
+    elif self._waiting:
+      self._timers.append(self.wheel.schedule(0, self._advance))
+    if message.duration is not None:
+      self._timers.append(self.wheel.schedule(message.duration, self._advance))
+    for waiting in self._waiting:
+      if waiting.expiry is not None:
+        remaining = waiting.posted_at + waiting.expiry - now
+        self._timers.append(self.wheel.schedule(remaining, self._advance))
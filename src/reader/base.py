@@ -1,4 +1,14 @@
+from .instrumentation import timed_sleep
 from abc import ABC, abstractmethod
+import time
+
+class NoTagDetected(Exception):
+    """
+    Raised by a reader when no tag answered in the antenna field.
+
+    This is the normal outcome of a poll and does not indicate a fault.
+    """
+    pass
 
 class Reader(ABC):
     """
@@ -6,7 +16,11 @@ class Reader(ABC):
     
     This class defines the interface that all concrete RFID reader 
     implementations must follow.
+
+    Attributes:
+        metrics: Optional ReadPathMetrics recording the time spent per stage.
     """
+    metrics = None
     
     @abstractmethod
     def read(self):
@@ -29,4 +43,95 @@ class Reader(ABC):
         This method should be called when the reader is no longer needed
         to free up any system resources.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def open(self):
+        """
+        Prepare the reader for a session of reads.
+
+        The default implementation does nothing. Readers that release their
+        hardware in cleanup() should re-acquire it here.
+        """
+        pass
+
+    def reset(self):
+        """
+        Recover the reader after it stopped responding.
+
+        The default implementation releases and re-acquires the reader.
+        """
+        self.cleanup()
+        self.open()
+
+    def wait_for_tag(self, timeout=None, poll_interval=0.1):
+        """
+        Block until a tag is read or the timeout expires.
+
+        The default implementation polls read() every poll_interval seconds.
+        Readers with a hardware card-detect signal should override it.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds, None waits forever.
+            poll_interval (float): Delay between two read attempts in seconds.
+
+        Returns:
+            tuple: A tuple containing (id, text) from the RFID tag
+
+        Raises:
+            NoTagDetected: If no tag was read before the timeout
+            Exception: If there's an error reading the tag
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.read()
+            except NoTagDetected:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise
+            timed_sleep(poll_interval if remaining is None else min(poll_interval, remaining), self.metrics)
+
+    def inventory(self):
+        """
+        Read every tag currently in the field.
+
+        The default implementation can only see one tag per read. Readers
+        that can enumerate several tags in one cycle should override it.
+
+        Returns:
+            list: The ids of the tags found, empty if none answered
+
+        Raises:
+            Exception: If there's an error reading the tags
+        """
+        try:
+            id, text = self.read()
+            return [id]
+        except NoTagDetected:
+            return []
+
+    def wait_for_inventory(self, timeout=None, poll_interval=0.1):
+        """
+        Block until at least one tag is found, then return all tags in the field.
+
+        The default implementation polls inventory() every poll_interval seconds.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds, None waits forever.
+            poll_interval (float): Delay between two inventories in seconds.
+
+        Returns:
+            list: The ids of the tags found, empty if none before the timeout
+
+        Raises:
+            Exception: If there's an error reading the tags
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            ids = self.inventory()
+            if ids:
+                return ids
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return []
+            timed_sleep(poll_interval if remaining is None else min(poll_interval, remaining), self.metrics)
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from .events import TagEvent, TagEventType
+import time
+
+class _Presence:
+  __slots__ = ("last_seen", "last_arrival", "present", "announced")
+
+  def __init__(self, now):
+    self.last_seen = now
+    self.last_arrival = now
+    self.present = True
+    self.announced = True
+
+
+class TagDebouncer:
+  """
+  Turns repeated reads of the same tag into "arrived" and "left" edges.
+
+  A tag held over the antenna is read on every poll. The debouncer keeps a
+  time-windowed LRU cache keyed on the compact integer UID and only reports
+  an ARRIVED event the first time a tag is seen, and a LEFT event once it has
+  not been seen for presence_timeout seconds.
+
+  A tag that comes back within its hold-off window after its last ARRIVED
+  event is absorbed silently, so a quick re-swipe does not count twice. The
+  hold-off defaults to hold_off and can be overridden per UID.
+
+  Attributes:
+    presence_timeout (float): Seconds without a read after which a tag has left.
+    hold_off (float): Default seconds between two ARRIVED events of one UID.
+    hold_offs (dict): Per-UID hold-off overrides, keyed on the compact UID.
+    max_entries (int): Maximum number of UIDs tracked, least recently seen are evicted.
+    suppressed (int): Number of reads that did not produce an event.
+  """
+  def __init__(self, presence_timeout=0.5, hold_off=3.0, hold_offs=None, max_entries=256):
+    self.presence_timeout = presence_timeout
+    self.hold_off = hold_off
+    self.hold_offs = dict(hold_offs or {})
+    self.max_entries = max_entries
+    self.suppressed = 0
+    self._entries = OrderedDict()
+
+  def __len__(self):
+    return len(self._entries)
+
+  def hold_off_for(self, uid):
+    """
+    Returns the hold-off window in seconds that applies to a UID.
+    """
+    return self.hold_offs.get(uid, self.hold_off)
+
+  def observe(self, uid, reader_id, now=None):
+    """
+    Records a read of a tag.
+
+    Args:
+      uid (int): The compact UID that was read.
+      reader_id (str): Identifier of the reader that read the tag.
+      now (float): Monotonic time of the read, defaults to time.monotonic().
+
+    Returns:
+      list: The TagEvents caused by the read, empty for a repeat.
+    """
+    now = time.monotonic() if now is None else now
+    entry = self._entries.get(uid)
+    if entry is None:
+      events = self._evict(reader_id)
+      self._entries[uid] = _Presence(now)
+      events.append(self._event(uid, reader_id, TagEventType.ARRIVED))
+      return events
+
+    self._entries.move_to_end(uid)
+    entry.last_seen = now
+    if entry.present:
+      self.suppressed += 1
+      return []
+    entry.present = True
+    if now - entry.last_arrival < self.hold_off_for(uid):
+      entry.announced = False
+      self.suppressed += 1
+      return []
+    entry.last_arrival = now
+    entry.announced = True
+    return [self._event(uid, reader_id, TagEventType.ARRIVED)]
+
+  def expire(self, reader_id, now=None):
+    """
+    Reports tags that have not been read for presence_timeout seconds.
+
+    Entries whose tag has left and whose hold-off has elapsed are dropped
+    from the cache.
+
+    Args:
+      reader_id (str): Identifier attached to the LEFT events.
+      now (float): Monotonic time, defaults to time.monotonic().
+
+    Returns:
+      list: A LEFT TagEvent for each announced tag that has left.
+    """
+    now = time.monotonic() if now is None else now
+    events = []
+    for uid, entry in list(self._entries.items()):
+      if entry.present and now - entry.last_seen >= self.presence_timeout:
+        entry.present = False
+        if entry.announced:
+          events.append(self._event(uid, reader_id, TagEventType.LEFT))
+      if not entry.present and now - entry.last_arrival >= self.hold_off_for(uid):
+        del self._entries[uid]
+    return events
+
+  def _evict(self, reader_id):
+    events = []
+    while len(self._entries) >= self.max_entries:
+      uid, entry = self._entries.popitem(last=False)
+      if entry.present and entry.announced:
+        events.append(self._event(uid, reader_id, TagEventType.LEFT))
+    return events
+
+  def _event(self, uid, reader_id, kind):
+    return TagEvent(uid=uid, timestamp=time.time(), reader_id=reader_id, kind=kind)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from enum import Enum
+
+class TagEventType(Enum):
+  """
+  Kind of change reported by a TagEvent.
+  """
+  ARRIVED = "arrived"
+  LEFT = "left"
+
+
+@dataclass(frozen=True)
+class TagEvent:
+  """
+  A tag arriving at or leaving a reader.
+
+  Attributes:
+    uid (int): The tag's UID in compact form, see uid_to_num().
+    timestamp (float): Wall-clock time of the change, as returned by time.time().
+    reader_id (str): Identifier of the reader that saw the tag.
+    kind (TagEventType): Whether the tag arrived or left.
+  """
+  uid: int
+  timestamp: float
+  reader_id: str
+  kind: TagEventType = TagEventType.ARRIVED
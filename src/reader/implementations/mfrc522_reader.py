@@ -1,14 +1,91 @@
-from ..base import Reader
-from mfrc522 import MFRC522
-import RPi.GPIO as GPIO
+from ..base import Reader, NoTagDetected
+import logging
+import time
+
+try:
+  from mfrc522 import MFRC522
+  import RPi.GPIO as GPIO
+except (ImportError, RuntimeError):
+  # The driver only imports on a Raspberry Pi. Elsewhere a chip instance,
+  # such as SimulatedMFRC522, has to be passed in explicitly.
+  MFRC522 = None
+  GPIO = None
 
 class MFRC522Reader(Reader):
   """
   Concrete implementation of the reader interface for MFRC522 RFID readers.
   Implementation extracted from https://github.com/pimylifeup/MFRC522-python/issues/31#issuecomment-730123689
+
+  When an IRQ backend is given, wait_for_tag() arms the chip so that its IRQ
+  pin fires when a card answers a request, instead of busy-polling with full
+  request/anticollision transactions. Without one it falls back to polling.
+  In IRQ mode a full read is still made every poll_every re-arms without an
+  interrupt, so a station whose IRQ line is not wired keeps detecting tags,
+  only more slowly, and logs a warning.
+
+  Several modules can share one Pi by giving each its own SPI chip select
+  (bus and device) and reset pin.
+
+  inventory() enumerates every tag in the field in one cycle by selecting
+  and halting each tag that wins anticollision, so the next request is
+  answered by the remaining ones.
+
+  Attributes:
+    reader: The underlying MFRC522 chip driver.
+    irq: Optional IRQBackend signalling the chip's IRQ pin.
+    rearm_interval: Seconds between two request broadcasts while armed.
+    poll_every: Re-arms without an interrupt before a full read checks the field, 0 never.
+    missed_irqs (int): Tags found by those full reads that the IRQ line did not signal.
+    bus: SPI bus the module is connected to.
+    device: SPI chip select of the module on that bus.
+    pin_rst: Reset pin of the module, -1 for the driver default.
+    max_tags: Upper bound on the tags enumerated in one inventory cycle.
+    max_collisions: Failed anticollision rounds tolerated per inventory cycle.
+    collision_count (int): Failed anticollision rounds seen by inventory().
+    metrics: Optional ReadPathMetrics timing the request, anticollision and IRQ wait stages.
   """
-  def __init__(self):
-    self.reader = MFRC522()
+  # VersionReg values reported by MFRC522 and compatible chips
+  KNOWN_VERSIONS = (0x88, 0x90, 0x91, 0x92, 0xB2)
+  # Timer reload programmed by MFRC522_Init, and a shorter one for HALT,
+  # which is never answered and would otherwise wait out the full timeout
+  DEFAULT_TIMER_RELOAD = 30
+  HALT_TIMER_RELOAD = 3
+
+  def __init__(
+      self,
+      chip=None,
+      irq=None,
+      rearm_interval=0.02,
+      poll_every=50,
+      bus=0,
+      device=0,
+      pin_rst=-1,
+      max_tags=8,
+      max_collisions=3,
+      metrics=None,
+    ):
+    self.bus = bus
+    self.device = device
+    self.pin_rst = pin_rst
+    self.max_tags = max_tags
+    self.max_collisions = max_collisions
+    self.collision_count = 0
+    self.metrics = metrics
+    self._owns_chip = chip is None
+    if chip is None:
+      chip = self._create_chip()
+    self.reader = chip
+    self.irq = irq
+    self.rearm_interval = rearm_interval
+    self.poll_every = poll_every
+    self.missed_irqs = 0
+    self.is_open = True
+    self.logger = logging.getLogger(__name__)
+
+  def _create_chip(self):
+    if MFRC522 is None:
+      raise RuntimeError("mfrc522 driver is not available, pass a chip instance")
+    return MFRC522(bus=self.bus, device=self.device, pin_rst=self.pin_rst)
 
   def read(self):
     """
@@ -18,11 +95,12 @@ class MFRC522Reader(Reader):
       tuple: A tuple containing (id, text) from the RFID tag.
 
     Raises:
+      NoTagDetected: If no tag answered the request
       Exception: If there's an error reading the tag
     """
-    (status, tagType) = self.reader.MFRC522_Request(self.reader.PICC_REQIDL)
+    (status, tagType) = self._request(self.reader.PICC_REQIDL)
     if status == self.reader.MI_OK:
-      (status, uid) = self.reader.MFRC522_Anticoll()
+      (status, uid) = self._anticoll()
 
       if status == self.reader.MI_OK:
         return uid, "Sample Text"
@@ -30,7 +108,271 @@ class MFRC522Reader(Reader):
         raise Exception("Failed to read UID from tag")
   
     else:
-      raise Exception("No tag detected")
+      raise NoTagDetected("No tag detected")
     
+  def wait_for_tag(self, timeout=None, poll_interval=0.1):
+    """
+    Block until a tag is read or the timeout expires.
+
+    In IRQ mode the chip broadcasts a request every rearm_interval seconds
+    with its receive interrupt routed to the IRQ pin, and the calling thread
+    sleeps on the IRQ backend until a card answers. Without an IRQ backend
+    this falls back to polling read() every poll_interval seconds.
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+      poll_interval (float): Delay between two reads in polling mode.
+
+    Returns:
+      tuple: A tuple containing (id, text) from the RFID tag.
+
+    Raises:
+      NoTagDetected: If no tag was read before the timeout
+      Exception: If there's an error reading the tag
+    """
+    if self.irq is None:
+      return super().wait_for_tag(timeout=timeout, poll_interval=poll_interval)
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    rearms = 0
+    while True:
+      remaining = None if deadline is None else deadline - time.monotonic()
+      if remaining is not None and remaining <= 0:
+        raise NoTagDetected("No tag detected")
+      self._arm_irq()
+      window = self.rearm_interval if remaining is None else min(self.rearm_interval, remaining)
+      if self._wait_irq(window):
+        try:
+          return self._read_after_irq()
+        except NoTagDetected:
+          continue
+      rearms += 1
+      if self._poll_due(rearms):
+        try:
+          result = self.read()
+        except NoTagDetected:
+          continue
+        self._missed_irq()
+        return result
+
+  def inventory(self):
+    """
+    Enumerate every tag in the field in one cycle.
+
+    The cycle starts with a WUPA so that tags halted by the previous cycle
+    take part again, then repeats anticollision, SELECT and HALT, with a REQA
+    after each HALT, until no tag answers.
+
+    Returns:
+      list: The UIDs of the tags found, in the order they were enumerated.
+    """
+    return self._inventory(request_first=True)
+
+  def wait_for_inventory(self, timeout=None, poll_interval=0.1):
+    """
+    Block until at least one tag is in the field, then enumerate all of them.
+
+    In IRQ mode the armed broadcast is a WUPA, so tags still held over the
+    antenna after being halted keep waking the reader.
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+      poll_interval (float): Delay between two inventories in polling mode.
+
+    Returns:
+      list: The UIDs of the tags found, empty if none before the timeout.
+    """
+    if self.irq is None:
+      return super().wait_for_inventory(timeout=timeout, poll_interval=poll_interval)
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    rearms = 0
+    while True:
+      remaining = None if deadline is None else deadline - time.monotonic()
+      if remaining is not None and remaining <= 0:
+        return []
+      self._arm_irq(self.reader.PICC_REQALL)
+      window = self.rearm_interval if remaining is None else min(self.rearm_interval, remaining)
+      if self._wait_irq(window):
+        uids = self._inventory(request_first=False)
+        if uids:
+          return uids
+        continue
+      rearms += 1
+      if self._poll_due(rearms):
+        uids = self._inventory(request_first=True)
+        if uids:
+          self._missed_irq()
+          return uids
+
+  def _inventory(self, request_first):
+    chip = self.reader
+    uids = []
+    collisions = 0
+    # WUPA until a tag of this cycle is halted, REQA afterwards so it stays out
+    mode = chip.PICC_REQALL
+    need_request = request_first
+    attempts = 1
+    while len(uids) < self.max_tags:
+      if need_request:
+        for _ in range(attempts):
+          (status, tagType) = self._request(mode)
+          if status == chip.MI_OK:
+            break
+        if status != chip.MI_OK:
+          break
+      need_request = True
+      attempts = 1
+
+      (status, uid) = self._anticoll()
+      if status != chip.MI_OK:
+        # Colliding answers from several tags fail the BCC check. The
+        # driver does not expose the collision position, so restart the
+        # round. The tags are still READY and the next request sends them
+        # back to IDLE without an answer, so it is sent a second time.
+        collisions += 1
+        self.collision_count += 1
+        if collisions > self.max_collisions:
+          break
+        attempts = 2
+        continue
+      if chip.MFRC522_SelectTag(uid):
+        self._halt()
+        mode = chip.PICC_REQIDL
+      if uid not in uids:
+        uids.append(uid)
+    return uids
+
+  def _halt(self):
+    """
+    Send HLTA to the selected tag so it stops answering REQA.
+
+    The tag never answers a HALT, so the chip timer is shortened for the
+    transaction instead of waiting out the default timeout.
+    """
+    chip = self.reader
+    frame = [chip.PICC_HALT, 0x00]
+    frame += chip.CalulateCRC(frame)
+    chip.Write_MFRC522(chip.TReloadRegL, self.HALT_TIMER_RELOAD)
+    try:
+      chip.MFRC522_ToCard(chip.PCD_TRANSCEIVE, frame)
+    finally:
+      chip.Write_MFRC522(chip.TReloadRegL, self.DEFAULT_TIMER_RELOAD)
+
+  def _poll_due(self, rearms):
+    return self.poll_every > 0 and rearms % self.poll_every == 0
+
+  def _missed_irq(self):
+    self.missed_irqs += 1
+    if self.missed_irqs == 1:
+      self.logger.warning(
+        f"Tag found by polling but no interrupt fired on SPI {self.bus}.{self.device}, check the IRQ wiring"
+      )
+
+  def _arm_irq(self, mode=None):
+    """
+    Route the receive interrupt to the IRQ pin and broadcast one request.
+
+    This costs a handful of register writes, compared with the register
+    polling loop that MFRC522_Request runs until the chip timer expires.
+
+    Args:
+      mode: PICC_REQIDL (default) or PICC_REQALL to also wake halted tags.
+    """
+    chip = self.reader
+    self.irq.clear()
+    chip.Write_MFRC522(chip.CommIEnReg, 0xA0)  # IRQ pin active low, RxIRq only
+    chip.Write_MFRC522(chip.CommIrqReg, 0x7F)  # Clear all pending interrupt flags
+    chip.Write_MFRC522(chip.FIFODataReg, chip.PICC_REQIDL if mode is None else mode)
+    chip.Write_MFRC522(chip.CommandReg, chip.PCD_TRANSCEIVE)
+    chip.Write_MFRC522(chip.BitFramingReg, 0x87)  # StartSend, 7-bit short frame
+
+  def _read_after_irq(self):
+    """
+    Finish reading a card that has already answered the armed request.
+
+    The card is in the READY state after answering, so anticollision can run
+    straight away. A second request would send it back to IDLE.
+    """
+    (status, uid) = self._anticoll()
+    if status == self.reader.MI_OK:
+      return uid, "Sample Text"
+    return self.read()
+
+  def _request(self, mode):
+    """
+    Run MFRC522_Request, timing it and counting unanswered requests.
+    """
+    if self.metrics is None:
+      return self.reader.MFRC522_Request(mode)
+    start = time.perf_counter()
+    result = self.reader.MFRC522_Request(mode)
+    self.metrics.record("request", time.perf_counter() - start)
+    if result[0] != self.reader.MI_OK:
+      self.metrics.count("no_tag")
+    return result
+
+  def _anticoll(self):
+    """
+    Run MFRC522_Anticoll, timing it and counting failures.
+    """
+    if self.metrics is None:
+      return self.reader.MFRC522_Anticoll()
+    start = time.perf_counter()
+    result = self.reader.MFRC522_Anticoll()
+    self.metrics.record("anticoll", time.perf_counter() - start)
+    if result[0] != self.reader.MI_OK:
+      self.metrics.count("anticoll_failure")
+    return result
+
+  def _wait_irq(self, window):
+    if self.metrics is None:
+      return self.irq.wait(window)
+    start = time.perf_counter()
+    fired = self.irq.wait(window)
+    self.metrics.record("irq_wait", time.perf_counter() - start)
+    return fired
+
+  def open(self):
+    """
+    Re-acquire the chip after cleanup().
+
+    A driver created by this reader is constructed again, which reopens SPI
+    and re-runs the chip initialisation. An injected chip is re-initialised.
+    """
+    if self.is_open:
+      return
+    if self._owns_chip:
+      self.reader = self._create_chip()
+    else:
+      self.reader.MFRC522_Init()
+    self.is_open = True
+
+  def reset(self):
+    """
+    Soft-reset and re-initialise the chip, then check that it answers.
+
+    Raises:
+      Exception: If the chip does not report a known version after the reset
+    """
+    self.reader.MFRC522_Init()
+    version = self.reader.Read_MFRC522(self.reader.VersionReg)
+    if version not in self.KNOWN_VERSIONS:
+      raise Exception(f"Reader not responding (version 0x{version:02X})")
+
   def cleanup(self):
-    pass
\ No newline at end of file
+    """
+    Switch the antenna off and release SPI.
+
+    Close_MFRC522() is not used because it calls GPIO.cleanup(), which would
+    also release pins owned by other components.
+    """
+    if not self.is_open:
+      return
+    self.is_open = False
+    try:
+      self.reader.AntennaOff()
+    finally:
+      # Release SPI even if the chip no longer answers
+      if self._owns_chip:
+        self.reader.spi.close()
@@ -0,0 +1,80 @@
+from ..base import Reader, NoTagDetected
+from .replay_reader import load_trace
+import json
+import os
+import threading
+import time
+
+class RecordingReader(Reader):
+  """
+  Reader decorator that records the reads of another reader to a trace.
+
+  Every successful read and every read error of the wrapped reader is
+  appended to the trace with its time since the recording started, in the
+  format read by ReplayReader. Empty polls are not recorded. Each entry is
+  flushed as it is written, so a trace survives the process being killed.
+  Recording to an existing trace appends to it, with times continuing
+  from its last entry so the two recordings play back one after the other.
+
+  Attributes:
+    reader (Reader): The wrapped reader.
+    path (str): Path of the JSON-lines trace file, or None to record in memory only.
+    entries (list): The entries recorded so far.
+  """
+  def __init__(self, reader, path=None):
+    self.reader = reader
+    self.path = path
+    self.entries = []
+    self._offset = 0.0
+    if path is not None and os.path.exists(path):
+      previous = load_trace(path)
+      if previous:
+        self._offset = previous[-1]["t"]
+    self._file = open(path, "a") if path is not None else None
+    self._started_at = time.monotonic()
+    self._lock = threading.Lock()
+
+  def open(self):
+    self.reader.open()
+
+  def reset(self):
+    self.reader.reset()
+
+  def read(self):
+    return self._record(self.reader.read)
+
+  def wait_for_tag(self, timeout=None, poll_interval=0.1):
+    return self._record(lambda: self.reader.wait_for_tag(timeout=timeout, poll_interval=poll_interval))
+
+  def cleanup(self):
+    self.reader.cleanup()
+
+  def close(self):
+    """
+    Closes the trace file.
+    """
+    with self._lock:
+      if self._file is not None:
+        self._file.close()
+        self._file = None
+
+  def _record(self, operation):
+    try:
+      uid, text = operation()
+    except NoTagDetected:
+      raise
+    except Exception as e:
+      self._write({"t": self._elapsed(), "error": str(e)})
+      raise
+    self._write({"t": self._elapsed(), "uid": list(uid) if not isinstance(uid, int) else uid, "text": text})
+    return uid, text
+
+  def _elapsed(self):
+    return round(self._offset + time.monotonic() - self._started_at, 6)
+
+  def _write(self, entry):
+    with self._lock:
+      self.entries.append(entry)
+      if self._file is not None:
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
@@ -0,0 +1,137 @@
+from ..base import Reader, NoTagDetected
+import json
+import threading
+import time
+
+def load_trace(path):
+  """
+  Loads a trace recorded by RecordingReader.
+
+  A trace is a JSON-lines file with one read per line: the time "t" in
+  seconds since the recording started, and either the "uid" and "text"
+  that were read or the "error" message of a failed read.
+
+  Args:
+    path (str): Path of the trace file.
+
+  Returns:
+    list: The entries as dicts, ordered by time.
+  """
+  entries = []
+  with open(path) as f:
+    for line in f:
+      line = line.strip()
+      if line:
+        entries.append(json.loads(line))
+  entries.sort(key=lambda entry: entry["t"])
+  return entries
+
+
+class ReplayReader(Reader):
+  """
+  Reader that plays back a recorded trace of tag reads.
+
+  Each entry of the trace is returned by read() once its time has come,
+  relative to the moment the reader was first opened and scaled by speed.
+  Between entries the reader behaves like an empty field and raises
+  NoTagDetected. Error entries raise an Exception with the recorded message,
+  so failures replay deterministically too.
+
+  With speed=None entries are returned back to back without waiting, which
+  is what load benchmarks want. wait_for_tag() sleeps until the next entry
+  is due instead of polling. A trace looped in real or scaled time must
+  end after 0 seconds, otherwise every pass would be due at once.
+
+  Attributes:
+    entries (list): The trace entries, see load_trace().
+    speed (float): Playback speed, 1.0 is real time and None as fast as possible.
+    loop (bool): Whether playback starts over when the trace is exhausted.
+    position (int): Index of the next entry to play.
+    finished (bool): Whether every entry has been played.
+  """
+  def __init__(self, trace, speed=1.0, loop=False):
+    if speed is not None and speed <= 0:
+      raise ValueError("speed must be positive or None")
+    self.entries = load_trace(trace) if isinstance(trace, str) else sorted(trace, key=lambda entry: entry["t"])
+    if loop and speed is not None and self.entries and self.entries[-1]["t"] <= 0:
+      raise ValueError("A looped trace must last longer than 0 seconds unless speed is None")
+    self.speed = speed
+    self.loop = loop
+    self.position = 0
+    self._started_at = None
+    self._offset = 0.0
+    self._closed = threading.Event()
+
+  @property
+  def finished(self):
+    return self.position >= len(self.entries) and not self.loop
+
+  def open(self):
+    """
+    Starts the playback clock on the first open.
+
+    Reopening after cleanup() resumes where playback left off.
+    """
+    self._closed.clear()
+    if self._started_at is None:
+      self._started_at = time.monotonic()
+
+  def rewind(self):
+    """
+    Restarts playback from the first entry.
+    """
+    self.position = 0
+    self._offset = 0.0
+    self._started_at = time.monotonic()
+
+  def read(self):
+    if self._started_at is None:
+      self.open()
+    self._wrap()
+    if self.position >= len(self.entries) or self._delay() > 0:
+      raise NoTagDetected("No tag detected")
+    return self._play()
+
+  def wait_for_tag(self, timeout=None, poll_interval=0.1):
+    if self._started_at is None:
+      self.open()
+    self._wrap()
+    if self.position >= len(self.entries):
+      # An exhausted trace is an empty field: wait out the timeout
+      self._closed.wait(timeout)
+      raise NoTagDetected("No tag detected")
+    delay = self._delay()
+    if timeout is not None and delay > timeout:
+      self._closed.wait(timeout)
+      raise NoTagDetected("No tag detected")
+    if delay > 0 and self._closed.wait(delay):
+      raise NoTagDetected("No tag detected")
+    return self._play()
+
+  def cleanup(self):
+    """
+    Wakes any pending wait_for_tag(), playback position is kept.
+    """
+    self._closed.set()
+
+  def _wrap(self):
+    if self.loop and self.entries and self.position >= len(self.entries):
+      # Shift the clock by the trace length so the next pass keeps its pacing
+      self._offset += self.entries[-1]["t"]
+      self.position = 0
+
+  def _delay(self):
+    """
+    Returns the seconds until the next entry is due, in wall-clock time.
+    """
+    if self.speed is None:
+      return 0.0
+    due = (self._offset + self.entries[self.position]["t"]) / self.speed
+    return due - (time.monotonic() - self._started_at)
+
+  def _play(self):
+    entry = self.entries[self.position]
+    self.position += 1
+    if "error" in entry:
+      raise Exception(entry["error"])
+    return entry["uid"], entry.get("text", "")
@@ -0,0 +1,164 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+import threading
+import time
+
+# Bucket upper bounds in seconds, 1-2-5 steps from 10 us to 5 s
+DEFAULT_BOUNDS = tuple(step * 10.0 ** exponent for exponent in range(-5, 1) for step in (1, 2, 5))
+
+
+def timed_sleep(seconds, metrics=None):
+  """
+  Sleeps between two polls, recording the time under the "sleep" stage of
+  metrics when given.
+  """
+  if metrics is None:
+    time.sleep(seconds)
+    return
+  start = time.perf_counter()
+  time.sleep(seconds)
+  metrics.record("sleep", time.perf_counter() - start)
+
+
+class LatencyHistogram:
+  """
+  Fixed-bucket latency histogram.
+
+  Recording a sample is a binary search over the bucket bounds and one
+  counter increment, so it is cheap enough for the read path. Percentiles
+  are reported as the upper bound of the bucket they fall in, and samples
+  above the last bound are reported as the largest sample seen.
+
+  Attributes:
+    bounds (tuple): Upper bounds of the buckets in seconds, ascending.
+    counts (list): Samples per bucket, with one extra overflow bucket.
+    count (int): Number of samples recorded.
+    total (float): Sum of the samples in seconds.
+    max (float): Largest sample in seconds.
+  """
+  def __init__(self, bounds=DEFAULT_BOUNDS):
+    self.bounds = tuple(bounds)
+    self.counts = [0] * (len(self.bounds) + 1)
+    self.count = 0
+    self.total = 0.0
+    self.max = 0.0
+
+  def record(self, seconds):
+    self.counts[bisect_left(self.bounds, seconds)] += 1
+    self.count += 1
+    self.total += seconds
+    if seconds > self.max:
+      self.max = seconds
+
+  def percentile(self, p):
+    """
+    Returns the latency below which a fraction p of the samples fall.
+
+    Args:
+      p (float): The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+      float: The bucket upper bound in seconds, 0.0 if there are no samples.
+    """
+    if self.count == 0:
+      return 0.0
+    rank = p * self.count
+    seen = 0
+    for index, bucket in enumerate(self.counts):
+      seen += bucket
+      if seen >= rank and bucket:
+        if index == len(self.bounds):
+          return self.max
+        return min(self.bounds[index], self.max)
+    return self.max
+
+  def summary(self):
+    """
+    Returns the count, mean, p50, p95, p99 and max latency in seconds.
+    """
+    return {
+      'count': self.count,
+      'mean': self.total / self.count if self.count else 0.0,
+      'p50': self.percentile(0.50),
+      'p95': self.percentile(0.95),
+      'p99': self.percentile(0.99),
+      'max': self.max,
+    }
+
+
+class ReadPathMetrics:
+  """
+  Per-stage latency histograms and outcome counters for one reader.
+
+  The reader and its ReaderService record into the same instance. Stages
+  used by this package are "request" and "anticoll" (chip transactions),
+  "irq_wait" (sleeping on the IRQ line), "sleep" (delay between polls),
+  "read" (one read through ReaderService, error handling included) and
+  "recovery" (reset after a read error). Counters are "no_tag",
+  "anticoll_failure" and "error".
+
+  Attributes:
+    histograms (dict): Maps each stage name to its LatencyHistogram.
+    counters (dict): Maps each counter name to its count.
+  """
+  def __init__(self, bounds=DEFAULT_BOUNDS):
+    self.bounds = tuple(bounds)
+    self.histograms = {}
+    self.counters = {}
+    self._lock = threading.Lock()
+
+  def record(self, stage, seconds):
+    """
+    Records the duration of one run of a stage.
+    """
+    with self._lock:
+      histogram = self.histograms.get(stage)
+      if histogram is None:
+        histogram = self.histograms[stage] = LatencyHistogram(self.bounds)
+      histogram.record(seconds)
+
+  def count(self, name, n=1):
+    """
+    Increments an outcome counter.
+    """
+    with self._lock:
+      self.counters[name] = self.counters.get(name, 0) + n
+
+  @contextmanager
+  def timed(self, stage):
+    """
+    Context manager recording the time spent in its block under stage.
+    """
+    start = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.record(stage, time.perf_counter() - start)
+
+  def snapshot(self):
+    """
+    Returns the current metrics.
+
+    Returns:
+      dict: 'stages' maps each stage to its summary(), 'counters' holds the counters.
+    """
+    with self._lock:
+      return {
+        'stages': {stage: histogram.summary() for stage, histogram in self.histograms.items()},
+        'counters': dict(self.counters),
+      }
+
+  def format(self):
+    """
+    Returns the metrics as a text table in milliseconds, for logs.
+    """
+    snapshot = self.snapshot()
+    lines = [f"{'stage':<10}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"]
+    for stage, summary in sorted(snapshot['stages'].items()):
+      lines.append(
+        f"{stage:<10}{summary['count']:>8}"
+        + "".join(f"{summary[key] * 1000:>10.3f}" for key in ('p50', 'p95', 'p99', 'max'))
+      )
+    counters = ", ".join(f"{name}={value}" for name, value in sorted(snapshot['counters'].items()))
+    lines.append(f"counters: {counters or 'none'}")
+    return "\n".join(lines)
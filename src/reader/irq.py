@@ -0,0 +1,106 @@
+from abc import ABC, abstractmethod
+import threading
+import time
+
+class IRQBackend(ABC):
+  """
+  Abstract source of card-detect interrupts for a reader.
+
+  A backend latches interrupt edges so that a reader thread can block in
+  wait() instead of busy-polling the chip over SPI.
+  """
+
+  @abstractmethod
+  def wait(self, timeout=None):
+    """
+    Block until an interrupt edge has been latched or the timeout expires.
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+
+    Returns:
+      bool: True if an interrupt fired, False on timeout.
+    """
+    pass
+
+  @abstractmethod
+  def clear(self):
+    """
+    Discard any latched interrupt edge.
+    """
+    pass
+
+  def close(self):
+    """
+    Release the resources held by the backend.
+    """
+    pass
+
+
+class GPIOIRQBackend(IRQBackend):
+  """
+  Interrupt backend driven by a Raspberry Pi GPIO edge on the reader's IRQ pin.
+
+  The MFRC522 IRQ output is open-drain and active low, so the pin is pulled
+  up and a falling edge is treated as a card-detect interrupt.
+
+  Attributes:
+    gpio: GPIO module instance, typically RPi.GPIO.
+    pin: The BCM pin number connected to the reader's IRQ output.
+  """
+  def __init__(self, gpio, pin, bouncetime=None):
+    self.gpio = gpio
+    self.pin = pin
+    self._event = threading.Event()
+    self.gpio.setup(self.pin, self.gpio.IN, pull_up_down=self.gpio.PUD_UP)
+    if bouncetime is None:
+      self.gpio.add_event_detect(self.pin, self.gpio.FALLING, callback=self._on_edge)
+    else:
+      self.gpio.add_event_detect(self.pin, self.gpio.FALLING, callback=self._on_edge, bouncetime=bouncetime)
+
+  def _on_edge(self, channel):
+    self._event.set()
+
+  def wait(self, timeout=None):
+    fired = self._event.wait(timeout)
+    self._event.clear()
+    return fired
+
+  def clear(self):
+    self._event.clear()
+
+  def close(self):
+    self.gpio.remove_event_detect(self.pin)
+
+
+class FakeIRQBackend(IRQBackend):
+  """
+  In-memory interrupt backend for tests and benchmarks without hardware.
+
+  Calling trigger() behaves like a falling edge on the IRQ pin. The time of
+  the last trigger is kept so callers can measure wake-up latency.
+
+  Attributes:
+    trigger_count (int): Number of times trigger() has been called.
+    last_trigger (float): time.perf_counter() value of the last trigger.
+  """
+  def __init__(self):
+    self._event = threading.Event()
+    self.trigger_count = 0
+    self.last_trigger = None
+
+  def trigger(self):
+    """
+    Latch an interrupt edge and wake any waiter.
+    """
+    self.trigger_count += 1
+    self.last_trigger = time.perf_counter()
+    self._event.set()
+
+  def wait(self, timeout=None):
+    fired = self._event.wait(timeout)
+    self._event.clear()
+    return fired
+
+  def clear(self):
+    self._event.clear()
@@ -0,0 +1,161 @@
+from .reader_service import ReaderService
+import itertools
+import queue
+import threading
+import time
+
+class MultiReaderService:
+  """
+  Drives several reader services concurrently and merges their events.
+
+  Each ReaderService gets its own worker thread that blocks in
+  poll_events(), so a slow or idle reader never delays the others and the
+  detection latency does not grow with the number of readers. All events go
+  into one bounded queue ordered by timestamp, and carry the reader_id of
+  the reader that produced them.
+
+  Attributes:
+    services (list): The ReaderService instances, one per reader.
+    poll_timeout (float): Maximum time in seconds one worker poll may block.
+    dropped_events (int): Number of events dropped because the queue was full.
+  """
+  def __init__(self, services, poll_timeout: float = 0.5, max_queue: int = 256):
+    ids = [service.reader_id for service in services]
+    if len(set(ids)) != len(ids):
+      raise ValueError(f"Reader ids must be unique, got {ids}")
+    self.services = list(services)
+    self.poll_timeout = poll_timeout
+    self.dropped_events = 0
+    self._queue = queue.PriorityQueue(maxsize=max_queue)
+    self._sequence = itertools.count()
+    self._stop = threading.Event()
+    self._threads = []
+    self._started_at = None
+
+  def __enter__(self):
+    self.start()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.stop()
+    return False
+
+  def start(self):
+    """
+    Opens every reader and starts one worker thread per reader.
+    """
+    if self._threads:
+      return
+    self._stop.clear()
+    self._started_at = time.monotonic()
+    for service in self.services:
+      service.open()
+      thread = threading.Thread(
+        target=self._worker,
+        args=(service,),
+        name=f"reader-{service.reader_id}",
+        daemon=True,
+      )
+      thread.start()
+      self._threads.append(thread)
+
+  def stop(self, timeout: float = None):
+    """
+    Stops the workers and closes every reader.
+
+    Args:
+      timeout (float): Maximum time to wait for each worker, defaults to poll_timeout plus one second.
+    """
+    self._stop.set()
+    join_timeout = self.poll_timeout + 1 if timeout is None else timeout
+    for thread in self._threads:
+      thread.join(join_timeout)
+    self._threads = []
+    for service in self.services:
+      service.close()
+
+  def get(self, timeout: float = None):
+    """
+    Returns the oldest pending event.
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+
+    Returns:
+      TagEvent: The event, or None if none arrived before the timeout.
+    """
+    try:
+      timestamp, sequence, event = self._queue.get(timeout=timeout)
+      return event
+    except queue.Empty:
+      return None
+
+  def get_events(self, timeout: float = None):
+    """
+    Waits for at least one event and returns all pending events.
+
+    Args:
+      timeout (float): Maximum time to wait for the first event.
+
+    Returns:
+      list: The pending events in timestamp order, empty on timeout.
+    """
+    event = self.get(timeout)
+    if event is None:
+      return []
+    events = [event]
+    while True:
+      event = self.get(timeout=0)
+      if event is None:
+        return events
+      events.append(event)
+
+  def set_active(self, active: bool):
+    """
+    Tells every reader's scheduler whether a session is active.
+    """
+    for service in self.services:
+      service.set_active(active)
+
+  def stats(self):
+    """
+    Returns per-reader polling statistics.
+
+    Returns:
+      dict: Maps each reader_id to a dict with the poll count, the poll rate
+      in polls per second since start(), and the event, error and reset counts.
+      Readers with a scheduler also report its metrics under 'scheduler',
+      and readers with ReadPathMetrics their latency snapshot under 'latency'.
+    """
+    elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0
+    stats = {}
+    for service in self.services:
+      stats[service.reader_id] = {
+        'polls': service.poll_count,
+        'poll_rate': service.poll_count / elapsed if elapsed > 0 else 0.0,
+        'events': service.event_count,
+        'errors': service.error_count,
+        'resets': service.reset_count,
+      }
+      if service.scheduler is not None:
+        stats[service.reader_id]['scheduler'] = service.scheduler.stats()
+      if service.metrics is not None:
+        stats[service.reader_id]['latency'] = service.metrics.snapshot()
+    return stats
+
+  def _worker(self, service: ReaderService):
+    while not self._stop.is_set():
+      try:
+        events = service.poll_events(timeout=self.poll_timeout)
+      except Exception as e:
+        service.record_error()
+        self._stop.wait(self.poll_timeout)
+        continue
+      for event in events:
+        self._publish(event)
+
+  def _publish(self, event):
+    try:
+      self._queue.put_nowait((event.timestamp, next(self._sequence), event))
+    except queue.Full:
+      self.dropped_events += 1
@@ -1,21 +1,117 @@
-from .base import Reader
+from .base import Reader, NoTagDetected
+from .events import TagEvent
+from .instrumentation import timed_sleep
+from .uid import uid_to_num
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import logging
+import time
 
 class ReaderService:
   """
   A service class to handle RFID reader operations.
 
-  This class provides functionality to interact with an RFID reader device, 
+  This class provides functionality to interact with an RFID reader device,
   including reading tags and handling GPIO cleanup on Raspberry Pi.
 
+  The reader is kept open for a whole session of reads. It is opened on the
+  first read or explicitly with open(), and only cleaned up by close() or
+  after an error that a reset could not recover from. The service can be
+  used as a context manager to bound the session.
+
+  In inventory mode poll_events() enumerates every tag in the field on each
+  poll instead of reading a single one.
+
+  With a scheduler, the service polls the reader itself and lets the
+  scheduler pick the delay between polls, instead of delegating the wait to
+  the reader at a fixed poll_interval. This is meant for readers without an
+  interrupt line.
+
   Attributes:
     reader: The RFID reader device instance.
+    reader_id: Identifier attached to the TagEvents of this reader.
+    debouncer: Optional TagDebouncer turning repeated reads into arrive/leave edges.
+    inventory (bool): Whether poll_events() reads every tag in the field.
+    scheduler: Optional AdaptivePollScheduler choosing the delay between polls.
+    metrics: Optional ReadPathMetrics timing reads, waits, recoveries and poll sleeps.
     gpio: GPIO controller instance, used for Raspberry Pi.
+    poll_interval: Seconds between reads when the reader has to be polled.
+    max_retries: Number of reset-and-retry attempts after a read error.
+    is_open (bool): Whether a reader session is currently open.
+    poll_count (int): Number of polls made through poll_events().
+    event_count (int): Number of events produced by poll_events().
+    error_count (int): Number of read errors, not counting empty polls.
+    reset_count (int): Number of times the reader was reset after an error.
+    dropped_events (int): Number of events dropped because a stream's buffer was full.
   """
   def __init__(
       self,
       reader: Reader = None,
+      poll_interval: float = 0.1,
+      max_retries: int = 1,
+      reader_id: str = "default",
+      debouncer=None,
+      inventory: bool = False,
+      scheduler=None,
+      metrics=None,
     ):
     self.reader = reader
+    self.reader_id = reader_id
+    self.debouncer = debouncer
+    self.inventory = inventory
+    self.scheduler = scheduler
+    self.metrics = metrics
+    self.poll_interval = poll_interval
+    self.max_retries = max_retries
+    self.is_open = False
+    self.poll_count = 0
+    self.event_count = 0
+    self.error_count = 0
+    self.reset_count = 0
+    self.dropped_events = 0
+    self.logger = logging.getLogger(__name__)
+
+  def __enter__(self):
+    self.open()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+    return False
+
+  def open(self):
+    """
+    Opens a reader session if none is open.
+    """
+    if not self.is_open:
+      self.reader.open()
+      self.is_open = True
+
+  def close(self):
+    """
+    Closes the reader session and cleans up the reader's resources.
+    """
+    if self.is_open:
+      self.is_open = False
+      self.reader.cleanup()
+
+  def set_active(self, active: bool):
+    """
+    Tells the scheduler whether a session is active, if there is one.
+    """
+    if self.scheduler is not None:
+      self.scheduler.set_active(active)
+
+  def record_error(self):
+    """
+    Counts a read error, in error_count and in the metrics if any.
+
+    The service counts its own read errors. This is for callers driving it,
+    such as MultiReaderService, to count an error that escaped a poll.
+    """
+    self.error_count += 1
+    if self.metrics is not None:
+      self.metrics.count("error")
 
   def read(self):
     """
@@ -23,16 +119,230 @@ class ReaderService:
 
     This method attempts to read the RFID tag's ID and text content.
     If successful, it returns the ID and text.
-    On Raspberry Pi devices, GPIO cleanup is performed in the finally block
-    to ensure proper resource management regardless of success or failure.
+    An empty poll leaves the session open. On a read error the reader is
+    reset and the read retried, and if the error persists the session is
+    closed so that the next read starts from a clean reader.
 
     Returns:
       tuple: A tuple containing the ID and text read from the RFID tag. Returns none if no tag is detected or if an error occurs.
     """
+    return self._call(self.reader.read)
+
+  def wait_for_tag(self, timeout: float = None):
+    """
+    Blocks until a tag is read or the timeout expires.
+
+    Interrupt-capable readers sleep until the card-detect signal fires,
+    other readers are polled every poll_interval seconds, or at the rate
+    chosen by the scheduler. Errors are handled as in read().
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+
+    Returns:
+      tuple: A tuple containing the ID and text read from the RFID tag. Returns none if no tag is read before the timeout or if an error occurs.
+    """
+    if self.scheduler is not None:
+      return self._poll_scheduled(self.reader.read, timeout, (None, None))
+    return self._call(
+      lambda: self.reader.wait_for_tag(timeout=timeout, poll_interval=self.poll_interval),
+      stage="wait",
+    )
+
+  def read_inventory(self, timeout: float = None):
+    """
+    Blocks until at least one tag is in the field and reads all of them.
+
+    Errors are handled as in read().
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+
+    Returns:
+      list: The IDs of the tags in the field, empty if none before the timeout or if an error occurs.
+    """
+    if self.scheduler is not None:
+      return self._poll_scheduled(self.reader.inventory, timeout, [])
+    return self._call(
+      lambda: self.reader.wait_for_inventory(timeout=timeout, poll_interval=self.poll_interval),
+      empty=[],
+      stage="wait",
+    )
+
+  def poll_events(self, timeout: float = None):
+    """
+    Waits for one tag read and converts it into TagEvents.
+
+    Without a debouncer every read becomes an ARRIVED event. With one,
+    repeated reads of a held tag are suppressed and LEFT events are
+    reported for tags that are no longer read. In inventory mode every tag
+    in the field counts as read.
+
+    Args:
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+
+    Returns:
+      list: The TagEvents produced by this poll, possibly empty.
+    """
+    self.poll_count += 1
+    if self.inventory:
+      ids = self.read_inventory(timeout)
+    else:
+      id, text = self.wait_for_tag(timeout)
+      ids = [] if id is None else [id]
+    events = []
+    if self.debouncer is None:
+      for id in ids:
+        events.append(TagEvent(uid=uid_to_num(id), timestamp=time.time(), reader_id=self.reader_id))
+    else:
+      for id in ids:
+        events.extend(self.debouncer.observe(uid_to_num(id), self.reader_id))
+      events.extend(self.debouncer.expire(self.reader_id))
+    self.event_count += len(events)
+    return events
+
+  async def events(self, max_buffer: int = 16, poll_timeout: float = 0.5):
+    """
+    Streams tag events for use with `async for`.
+
+    The blocking reader calls run on a dedicated single-thread executor, so
+    the event loop never blocks on SPI. Reads are buffered in a bounded
+    queue; when the consumer falls behind the oldest buffered event is
+    dropped and counted in dropped_events.
+
+    The executor is shut down when the stream is closed. A read that is in
+    progress at that moment finishes within poll_timeout seconds. If
+    poll_events() raises, the events already buffered are yielded and the
+    exception is then raised to the consumer.
+
+    Args:
+      max_buffer (int): Maximum number of events buffered for the consumer.
+      poll_timeout (float): Maximum time in seconds one blocking wait may take.
+
+    Yields:
+      TagEvent: The events produced by poll_events().
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=max_buffer)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"reader-{self.reader_id}")
+
+    async def produce():
+      try:
+        while True:
+          events = await loop.run_in_executor(executor, self.poll_events, poll_timeout)
+          for event in events:
+            self._publish(queue, event)
+      except Exception as e:
+        # Handed to the consumer, which would otherwise wait forever
+        self._publish(queue, e)
+
+    producer = asyncio.ensure_future(produce())
     try:
-      id, text = self.reader.read()
-      return id, text
-    except Exception as e:
-      return None, None
+      while True:
+        event = await queue.get()
+        if isinstance(event, Exception):
+          raise event
+        yield event
+    finally:
+      producer.cancel()
+      executor.shutdown(wait=False)
+
+  def _publish(self, queue, event):
+    """
+    Puts an event in a bounded queue, dropping the oldest one when full.
+    """
+    if queue.full():
+      queue.get_nowait()
+      self.dropped_events += 1
+    queue.put_nowait(event)
+
+  def _poll_scheduled(self, operation, timeout, empty):
+    """
+    Polls the reader until a tag is found, sleeping as the scheduler says.
+
+    Each poll is timed and reported to the scheduler, and gets the error
+    handling of _call().
+
+    Args:
+      operation (callable): Performs a single poll.
+      timeout (float): Maximum time to wait in seconds, None waits forever.
+      empty: Result of a poll that found nothing.
+
+    Returns:
+      The first non-empty poll result, or empty on timeout.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+      start = time.monotonic()
+      result = self._call(operation, empty)
+      now = time.monotonic()
+      detected = result != empty
+      self.scheduler.record(detected, busy=now - start, now=now)
+      if detected:
+        return result
+      remaining = None if deadline is None else deadline - now
+      if remaining is not None and remaining <= 0:
+        return empty
+      delay = self.scheduler.next_interval()
+      timed_sleep(delay if remaining is None else min(delay, remaining), self.metrics)
+
+  def _call(self, operation, empty=(None, None), stage="read"):
+    """
+    Runs a read operation inside the session with reset-and-retry.
+
+    Args:
+      operation (callable): Returns the read result, typically an (id, text) tuple, or raises.
+      empty: Result returned when no tag is detected or on an error.
+      stage (str): Metrics stage the whole call, error handling included, is timed under.
+
+    Returns:
+      The operation's result, or empty if no tag or an error.
+    """
+    if self.metrics is None:
+      return self._attempt(operation, empty)
+    start = time.perf_counter()
+    try:
+      return self._attempt(operation, empty)
     finally:
-      self.reader.cleanup()
\ No newline at end of file
+      self.metrics.record(stage, time.perf_counter() - start)
+
+  def _attempt(self, operation, empty):
+    try:
+      self.open()
+      for attempt in range(self.max_retries + 1):
+        try:
+          return operation()
+        except NoTagDetected:
+          return empty
+        except Exception as e:
+          self.record_error()
+          if attempt == self.max_retries:
+            break
+          self.reset_count += 1
+          try:
+            self._reset_reader()
+          except Exception as e:
+            # Already counted, the reader is released below
+            self.logger.warning(f"Reset of reader {self.reader_id} failed: {e}")
+            break
+    except Exception as e:
+      self.record_error()
+    self._close_after_error()
+    return empty
+
+  def _close_after_error(self):
+    """
+    Closes the session after an unrecovered error without raising, since
+    cleaning up a reader that stopped responding can fail too.
+    """
+    try:
+      self.close()
+    except Exception as e:
+      self.logger.warning(f"Cleanup of reader {self.reader_id} failed: {e}")
+
+  def _reset_reader(self):
+    if self.metrics is None:
+      self.reader.reset()
+      return
+    with self.metrics.timed("recovery"):
+      self.reader.reset()
@@ -0,0 +1,119 @@
+import threading
+import time
+
+class AdaptivePollScheduler:
+  """
+  Chooses the delay between two polls of a reader from recent activity.
+
+  While a session is active, or for idle_after seconds after the last
+  detection, the reader is polled every min_interval seconds. After that
+  each empty poll multiplies the interval by backoff, up to max_interval,
+  so an idle station overnight polls once every max_interval seconds, once
+  per second with the defaults. A detection drops the interval back to
+  min_interval immediately.
+
+  The scheduler only drives readers that are polled. A reader with an IRQ
+  line keeps re-arming at its own rearm_interval.
+
+  The scheduler also keeps the metrics needed to see the savings: the
+  number of polls and detections, and the duty cycle, the fraction of
+  wall-clock time spent inside polls rather than sleeping between them.
+
+  Attributes:
+    min_interval (float): Seconds between polls while active.
+    max_interval (float): Upper bound on the seconds between idle polls.
+    backoff (float): Factor applied to the interval after each idle empty poll.
+    idle_after (float): Seconds without a detection before backing off.
+    interval (float): The current delay between two polls.
+    poll_count (int): Number of polls recorded.
+    detection_count (int): Number of polls that found a tag.
+    busy_time (float): Total seconds spent inside polls.
+  """
+  def __init__(
+      self,
+      min_interval: float = 0.1,
+      max_interval: float = 1.0,
+      backoff: float = 2.0,
+      idle_after: float = 10.0,
+    ):
+    if min_interval <= 0 or max_interval < min_interval:
+      raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+    if backoff < 1:
+      raise ValueError("backoff must be at least 1")
+    self.min_interval = min_interval
+    self.max_interval = max_interval
+    self.backoff = backoff
+    self.idle_after = idle_after
+    self.interval = min_interval
+    self.poll_count = 0
+    self.detection_count = 0
+    self.busy_time = 0.0
+    self._active = False
+    self._last_detection = None
+    self._started_at = time.monotonic()
+    self._lock = threading.Lock()
+
+  @property
+  def active(self):
+    """
+    bool: Whether a session is active and the reader is kept at full rate.
+    """
+    return self._active
+
+  def set_active(self, active: bool):
+    """
+    Marks a session as started or stopped.
+
+    While active the reader is polled at min_interval regardless of
+    detections. When the session stops the idle_after grace period starts.
+    """
+    with self._lock:
+      self._active = active
+      self._last_detection = time.monotonic()
+      self.interval = self.min_interval
+
+  def record(self, detected: bool, busy: float = 0.0, now: float = None):
+    """
+    Records the outcome of one poll and updates the interval.
+
+    Args:
+      detected (bool): Whether the poll found a tag.
+      busy (float): Seconds the poll took.
+      now (float): Monotonic time of the poll, defaults to time.monotonic().
+    """
+    now = time.monotonic() if now is None else now
+    with self._lock:
+      self.poll_count += 1
+      self.busy_time += busy
+      if detected:
+        self.detection_count += 1
+        self._last_detection = now
+        self.interval = self.min_interval
+      elif self._active:
+        self.interval = self.min_interval
+      elif self._last_detection is None or now - self._last_detection >= self.idle_after:
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+
+  def next_interval(self):
+    """
+    Returns the delay in seconds before the next poll.
+    """
+    return self.interval
+
+  def stats(self):
+    """
+    Returns the polling metrics since the scheduler was created.
+
+    Returns:
+      dict: The poll and detection counts, the poll rate in polls per
+      second, the duty cycle between 0 and 1, and the current interval.
+    """
+    with self._lock:
+      elapsed = time.monotonic() - self._started_at
+      return {
+        'polls': self.poll_count,
+        'detections': self.detection_count,
+        'poll_rate': self.poll_count / elapsed if elapsed > 0 else 0.0,
+        'duty_cycle': min(self.busy_time / elapsed, 1.0) if elapsed > 0 else 0.0,
+        'interval': self.interval,
+      }
@@ -0,0 +1,254 @@
+import threading
+import time
+
+def _spin(seconds):
+  """
+  Busy-wait for the given number of seconds.
+
+  The real driver polls CommIrqReg over SPI until the chip timer expires,
+  which keeps a core busy rather than sleeping, so the simulation spins too.
+  """
+  end = time.perf_counter() + seconds
+  while time.perf_counter() < end:
+    pass
+
+
+# ISO 14443-3 type A card states
+IDLE = "idle"
+READY = "ready"
+ACTIVE = "active"
+HALT = "halt"
+
+
+class SimulatedMFRC522:
+  """
+  Software stand-in for the mfrc522.MFRC522 chip driver.
+
+  It implements the subset of the driver API used by MFRC522Reader, with a
+  configurable cost model, so the reader can be exercised and benchmarked on
+  machines without SPI hardware. Tags are placed in and removed from the
+  antenna field with present() and remove().
+
+  Each tag follows the ISO 14443-3 state machine: REQA wakes IDLE tags,
+  WUPA also wakes HALTed ones, anticollision returns the first READY tag in
+  field order (the strongest signal wins), SELECT activates it and sends the
+  other READY tags back to IDLE, and HALT parks the active tag until the
+  next WUPA or until it leaves the field.
+
+  When an IRQ backend is attached and the reader arms the chip for a request
+  broadcast, the backend is triggered if a tag answers, mimicking the chip's
+  IRQ pin. hang() makes the chip stop answering until it is re-initialised,
+  like a chip that lost its configuration after a brown-out. collide() makes
+  anticollision fail while several tags answer, leaving them READY.
+
+  Attributes:
+    irq: Optional FakeIRQBackend triggered when an armed request is answered.
+    request_timeout: Seconds a transceive spins when no tag answers, at the default timer reload.
+    transaction_time: Seconds a transceive takes when a tag answers.
+    init_time: Seconds MFRC522_Init takes (reset, register setup, antenna on).
+    register_writes (int): Number of Write_MFRC522 calls made.
+    transactions (int): Number of transceive transactions made.
+    init_count (int): Number of MFRC522_Init calls made.
+  """
+  MI_OK = 0
+  MI_NOTAGERR = 1
+  MI_ERR = 2
+
+  PCD_IDLE = 0x00
+  PCD_TRANSCEIVE = 0x0C
+  PICC_REQIDL = 0x26
+  PICC_REQALL = 0x52
+  PICC_HALT = 0x50
+
+  CommandReg = 0x01
+  CommIEnReg = 0x02
+  CommIrqReg = 0x04
+  FIFODataReg = 0x09
+  BitFramingReg = 0x0D
+  TReloadRegL = 0x2D
+  VersionReg = 0x37
+
+  VERSION = 0x92
+  DEFAULT_RELOAD = 30
+
+  def __init__(self, irq=None, request_timeout=0.015, transaction_time=0.001, init_time=0.0):
+    self.irq = irq
+    self.request_timeout = request_timeout
+    self.transaction_time = transaction_time
+    self.init_time = init_time
+    self.register_writes = 0
+    self.transactions = 0
+    self.init_count = 0
+    self.registers = {}
+    self.responding = True
+    self.antenna_on = True
+    self._collisions = 0
+    self._tags = {}
+    self._lock = threading.Lock()
+
+  @property
+  def tags(self):
+    """
+    list: The serial numbers of the tags currently in the field.
+    """
+    with self._lock:
+      return [list(uid) for uid in self._tags]
+
+  def tag_state(self, uid):
+    """
+    Returns the ISO 14443-3 state of a tag in the field, or None.
+    """
+    with self._lock:
+      return self._tags.get(tuple(uid))
+
+  def present(self, uid):
+    """
+    Place a tag in the antenna field.
+
+    Args:
+      uid (list): The 5-byte serial number, including the BCC check byte.
+    """
+    with self._lock:
+      self._tags.setdefault(tuple(uid), IDLE)
+
+  def remove(self, uid):
+    """
+    Take a tag out of the antenna field.
+    """
+    with self._lock:
+      self._tags.pop(tuple(uid), None)
+
+  def hang(self):
+    """
+    Stop answering SPI transactions until MFRC522_Init() is called.
+    """
+    self.responding = False
+
+  def collide(self, times=1):
+    """
+    Make the next anticollision rounds with several READY tags fail.
+
+    The colliding answers corrupt the UID, so the round returns an error
+    and the tags stay READY, as on a real chip that cannot resolve them.
+    """
+    self._collisions += times
+
+  def _check_responding(self):
+    if not self.responding:
+      raise OSError("SPI transfer failed")
+
+  def _timeout(self):
+    reload = self.registers.get(self.TReloadRegL, self.DEFAULT_RELOAD)
+    return self.request_timeout * reload / self.DEFAULT_RELOAD
+
+  def _reset_field(self):
+    with self._lock:
+      for uid in self._tags:
+        self._tags[uid] = IDLE
+
+  def _request(self, reqMode):
+    """
+    Apply a REQA or WUPA to the tags in the field and report whether any answered.
+    """
+    if not self.antenna_on:
+      return False
+    answered = False
+    with self._lock:
+      for uid, state in self._tags.items():
+        if state == IDLE or (state == HALT and reqMode == self.PICC_REQALL):
+          self._tags[uid] = READY
+          answered = True
+        elif state in (READY, ACTIVE):
+          # Any unexpected command sends a READY or ACTIVE tag back to IDLE
+          self._tags[uid] = IDLE
+    return answered
+
+  def Write_MFRC522(self, addr, val):
+    self._check_responding()
+    self.register_writes += 1
+    self.registers[addr] = val
+    armed = self.registers.get(self.CommIEnReg, 0) & 0x20
+    if addr == self.BitFramingReg and val & 0x80 and armed and self.irq is not None:
+      if self._request(self.registers.get(self.FIFODataReg)):
+        self.irq.trigger()
+
+  def Read_MFRC522(self, addr):
+    if not self.responding:
+      return 0x00
+    if addr == self.VersionReg:
+      return self.VERSION
+    return self.registers.get(addr, 0)
+
+  def MFRC522_Init(self):
+    self.init_count += 1
+    _spin(self.init_time)
+    self.registers = {}
+    self.responding = True
+    self.antenna_on = True
+    self._reset_field()
+
+  def AntennaOff(self):
+    self._check_responding()
+    self.antenna_on = False
+    self._reset_field()
+
+  def CalulateCRC(self, pIndata):
+    self._check_responding()
+    return [0x00, 0x00]
+
+  def MFRC522_Request(self, reqMode):
+    self._check_responding()
+    self.transactions += 1
+    if not self._request(reqMode):
+      _spin(self._timeout())
+      return self.MI_ERR, None
+    _spin(self.transaction_time)
+    return self.MI_OK, 0x10
+
+  def MFRC522_Anticoll(self):
+    self._check_responding()
+    self.transactions += 1
+    with self._lock:
+      ready = [uid for uid, state in self._tags.items() if state == READY]
+    if not ready:
+      _spin(self._timeout())
+      return self.MI_ERR, []
+    _spin(self.transaction_time)
+    if self._collisions and len(ready) > 1:
+      self._collisions -= 1
+      return self.MI_ERR, []
+    return self.MI_OK, list(ready[0])
+
+  def MFRC522_SelectTag(self, serNum):
+    self._check_responding()
+    self.transactions += 1
+    selected = None
+    with self._lock:
+      for uid, state in self._tags.items():
+        if state != READY:
+          continue
+        if list(uid) == list(serNum):
+          self._tags[uid] = ACTIVE
+          selected = uid
+        else:
+          self._tags[uid] = IDLE
+    if selected is None:
+      _spin(self._timeout())
+      return 0
+    _spin(self.transaction_time)
+    return 0x08
+
+  def MFRC522_ToCard(self, command, sendData):
+    """
+    Only the HALT command is modelled. A halted tag does not answer, so the
+    transceive always ends with the chip timer expiring.
+    """
+    self._check_responding()
+    self.transactions += 1
+    if sendData and sendData[0] == self.PICC_HALT:
+      with self._lock:
+        for uid, state in self._tags.items():
+          if state == ACTIVE:
+            self._tags[uid] = HALT
+    _spin(self._timeout())
+    return self.MI_ERR, [], 0
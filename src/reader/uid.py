@@ -0,0 +1,72 @@
+def uid_to_num(uid):
+  """
+  Converts a tag UID to a compact integer.
+
+  The MFRC522 driver returns the serial number as a list of 5 bytes (4 UID
+  bytes plus the BCC check byte). Packing them into one integer, the same
+  way mfrc522.SimpleMFRC522 does, gives a cheap hashable key.
+
+  Args:
+    uid: The UID as a list, tuple, bytes or an integer.
+
+  Returns:
+    int: The UID packed big-endian into an integer.
+  """
+  if isinstance(uid, int):
+    return uid
+  n = 0
+  for byte in uid:
+    n = n * 256 + byte
+  return n
+
+
+def num_to_uid(n, length=5):
+  """
+  Converts a compact integer UID back to the list of bytes read from the tag.
+
+  This is the inverse of uid_to_num() for UIDs of the given length. The
+  integer does not record leading zero bytes, so the length has to be known.
+
+  Args:
+    n (int): The UID in compact form.
+    length (int): Number of bytes, 5 for an MFRC522 serial number with its BCC.
+
+  Returns:
+    list: The UID bytes, big-endian.
+  """
+  return list(n.to_bytes(length, "big"))
+
+
+def parse_uid(value):
+  """
+  Normalises a UID from a configuration file to its compact integer form.
+
+  Args:
+    value: An integer, a list of bytes, or a hexadecimal string with an
+      optional 0x prefix and optional ':', '-' or ' ' separators, such as
+      "12:34:56:78:08" or "0x1234567808".
+
+  Returns:
+    int: The UID packed big-endian into an integer, see uid_to_num().
+
+  Raises:
+    ValueError: If the value is not a valid UID.
+  """
+  if isinstance(value, bool):
+    raise ValueError(f"Invalid UID: {value!r}")
+  if isinstance(value, str):
+    text = value.strip().lower()
+    if text.startswith("0x"):
+      text = text[2:]
+    for separator in (":", "-", " "):
+      text = text.replace(separator, "")
+    if not text:
+      raise ValueError(f"Invalid UID: {value!r}")
+    return int(text, 16)
+  if isinstance(value, (list, tuple, bytes)):
+    if any(not isinstance(byte, int) or not 0 <= byte <= 255 for byte in value):
+      raise ValueError(f"Invalid UID: {value!r}")
+    return uid_to_num(value)
+  if isinstance(value, int):
+    return value
+  raise ValueError(f"Invalid UID: {value!r}")
@@ -0,0 +1,53 @@
+from unittest.mock import Mock
+from src.gpio.gpio_bank import GPIOBank
+from src.gpio.gpio_controller import GPIOController
+
+class TestGPIOBank:
+  """
+  Tests for GPIOBank: several pin changes in one output() call, with the
+  pins that already have the requested level skipped.
+  """
+  def setup_method(self):
+    self.mock_gpio = Mock()
+    self.red = GPIOController(gpio=self.mock_gpio, pin=5)
+    self.green = GPIOController(gpio=self.mock_gpio, pin=6)
+    self.bank = GPIOBank([self.red, self.green])
+
+  def test_changes_are_written_in_one_call(self):
+    written = self.bank.apply({self.red: False, self.green: True})
+
+    assert written == 2
+    self.mock_gpio.output.assert_called_once_with([5, 6], [self.mock_gpio.LOW, self.mock_gpio.HIGH])
+    assert self.red.state is False
+    assert self.green.state is True
+
+  def test_unchanged_pins_are_skipped(self):
+    self.red.turn_on()
+    self.mock_gpio.reset_mock()
+
+    self.bank.apply({self.red: True, self.green: True})
+
+    self.mock_gpio.output.assert_called_once_with(6, self.mock_gpio.HIGH)
+    assert self.bank.skipped_writes == 1
+    assert self.red.skipped_writes == 1
+
+  def test_no_change_makes_no_call(self):
+    self.bank.apply({self.red: True, self.green: False})
+    self.mock_gpio.reset_mock()
+
+    assert self.bank.apply({self.red: True, self.green: False}) == 0
+    self.mock_gpio.output.assert_not_called()
+    assert self.bank.stats() == {'writes': 1, 'pin_writes': 2, 'skipped_writes': 2}
+
+  def test_all_off(self):
+    self.bank.apply({self.red: True, self.green: True})
+
+    self.bank.all_off()
+
+    self.mock_gpio.output.assert_called_with([5, 6], [self.mock_gpio.LOW, self.mock_gpio.LOW])
+
+  def test_controllers_without_gpio_are_ignored(self):
+    bank = GPIOBank()
+    controller = bank.add(GPIOController(gpio=None))
+
+    assert bank.apply({controller: True}) == 0
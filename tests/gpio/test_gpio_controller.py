@@ -1,3 +1,4 @@
+import gc
 from unittest.mock import Mock, patch
 from src.gpio.gpio_controller import GPIOController
 
@@ -101,17 +102,55 @@ class TestGPIOController:
   
   def test_del(self):
     """
-    Test the __del__ method of GPIOController.
-    This method should clean up the GPIO settings when the controller is deleted.
+    Test that deleting a GPIOController does no hardware work.
+    Pins are turned off by GPIORegistry.shutdown() instead.
     """
     controller = GPIOController(gpio=self.mock_gpio)
+    controller.turn_on()
     
     # Reset mock to clear previous setup calls
     self.mock_gpio.reset_mock()
     
-    # Call __del__ explicitly (normally Python would do this)
-    controller.__del__()
+    del controller
+    gc.collect()
     
-    self.mock_gpio.setmode.assert_called_once_with(self.mock_gpio.BCM)
-    self.mock_gpio.setup.assert_called_once_with(18, self.mock_gpio.OUT)
-    self.mock_gpio.output.assert_called_once_with(18, self.mock_gpio.LOW)
\ No newline at end of file
+    assert self.mock_gpio.mock_calls == []
+
+  def test_init_without_configure(self):
+    """
+    Test that a controller created for a registry leaves mode and pin setup alone.
+    """
+    GPIOController(gpio=self.mock_gpio, pin=5, configure=False)
+
+    self.mock_gpio.setmode.assert_not_called()
+    self.mock_gpio.setup.assert_not_called()
+
+  def test_same_level_is_not_written_again(self):
+    """
+    Test that writing the level the pin already has is skipped and counted.
+    """
+    controller = GPIOController(gpio=self.mock_gpio)
+    controller.turn_on()
+    controller.turn_on()
+    controller.turn_off()
+    controller.turn_off()
+
+    assert self.mock_gpio.output.call_count == 2
+    assert controller.writes == 2
+    assert controller.skipped_writes == 2
+
+  def test_toggle_uses_cached_state(self):
+    """
+    Test that toggle() does not read the pin back once its level is known.
+    """
+    controller = GPIOController(gpio=self.mock_gpio)
+    controller.turn_on()
+    controller.toggle()
+    controller.toggle()
+
+    self.mock_gpio.input.assert_not_called()
+    assert [c.args for c in self.mock_gpio.output.call_args_list] == [
+      (18, self.mock_gpio.HIGH),
+      (18, self.mock_gpio.LOW),
+      (18, self.mock_gpio.HIGH),
+    ]
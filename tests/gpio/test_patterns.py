@@ -0,0 +1,96 @@
+import time
+from unittest.mock import Mock
+from src.gpio.gpio_controller import GPIOController
+from src.gpio.patterns import Pattern, PatternEngine, beep, blink, double_beep
+
+class RecordingController:
+  """
+  Controller recording the levels it is driven to with their times.
+  """
+  def __init__(self, pin=16):
+    self.pin = pin
+    self.levels = []
+
+  def turn_on(self):
+    self.levels.append((True, time.monotonic()))
+
+  def turn_off(self):
+    self.levels.append((False, time.monotonic()))
+
+class TestPatternEngine:
+  """
+  Tests for PatternEngine: patterns play in the background with their
+  timing, and a pattern can be cancelled or replaced on the same pin.
+  """
+  def setup_method(self):
+    self.engine = PatternEngine()
+
+  def teardown_method(self):
+    self.engine.close()
+
+  def test_play_returns_immediately(self):
+    controller = RecordingController()
+    start = time.monotonic()
+    run = self.engine.play(controller, beep(0.05))
+
+    assert time.monotonic() - start < 0.02
+    assert run.wait(1)
+    assert [on for on, _ in controller.levels] == [True, False]
+
+  def test_step_timing(self):
+    controller = RecordingController()
+    start = time.monotonic()
+    self.engine.play(controller, double_beep(duration=0.03, gap=0.02)).wait(1)
+
+    levels = [on for on, _ in controller.levels]
+    times = [t - start for _, t in controller.levels]
+    assert levels == [True, False, True, False]
+    # Steps are due at 0, 0.03, 0.05 and 0.08 s from the start, never early
+    assert times[1] >= 0.03
+    assert times[2] >= 0.05
+    assert times[3] >= 0.08
+
+  def test_blink_times(self):
+    controller = RecordingController()
+    self.engine.play(controller, blink(3, on=0.005, off=0.005)).wait(1)
+
+    assert [on for on, _ in controller.levels] == [True, False] * 3
+    assert self.engine.played == 6
+
+  def test_replace_running_pattern(self):
+    controller = RecordingController()
+    first = self.engine.play(controller, blink(None, on=0.01, off=0.01))
+    time.sleep(0.03)
+    second = self.engine.play(controller, beep(0.01))
+
+    assert first.done and first.cancelled
+    assert second.wait(1)
+    assert not second.cancelled
+    assert self.engine.running(controller) is None
+
+  def test_cancel_turns_pin_off(self):
+    controller = RecordingController()
+    run = self.engine.play(controller, Pattern(((True, 10.0), (False, 0.0))))
+    time.sleep(0.02)
+
+    assert self.engine.cancel(controller)
+    assert run.cancelled
+    assert controller.levels[-1][0] is False
+    assert not self.engine.cancel(controller)
+
+  def test_patterns_on_different_pins_run_together(self):
+    buzzer = RecordingController(pin=16)
+    led = RecordingController(pin=6)
+    beep_run = self.engine.play(buzzer, beep(0.03))
+    blink_run = self.engine.play(led, blink(2, on=0.01, off=0.01))
+
+    assert beep_run.wait(1) and blink_run.wait(1)
+    assert len(buzzer.levels) == 2
+    assert len(led.levels) == 4
+
+  def test_drives_gpio_controller(self):
+    gpio = Mock()
+    controller = GPIOController(gpio=gpio, pin=16, component_type="BUZZER")
+    self.engine.play(controller, beep(0.01)).wait(1)
+
+    assert [c.args for c in gpio.output.call_args_list] == [(16, gpio.HIGH), (16, gpio.LOW)]
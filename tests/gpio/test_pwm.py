@@ -0,0 +1,229 @@
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from src.gpio.gpio_controller import GPIOController
+from src.gpio.pwm import HardwarePWM, PWMOutput, SoftPWM, StatusLED, breathing
+from src.gpio.registry import GPIORegistry
+
+class RecordingGPIO:
+  """
+  GPIO module recording the levels written to each pin with their times.
+  """
+  BCM = OUT = 0
+  HIGH = 1
+  LOW = 0
+
+  def __init__(self):
+    self.levels = []
+
+  def setmode(self, mode):
+    pass
+
+  def setup(self, pin, mode, initial=None):
+    pass
+
+  def output(self, pin, value):
+    self.levels.append((pin, value, time.monotonic()))
+
+  def cleanup(self):
+    pass
+
+  def duty(self, pin):
+    """
+    Returns the fraction of time the pin was HIGH between its first and last write.
+    """
+    levels = [(value, t) for p, value, t in self.levels if p == pin]
+    high = sum(t2 - t1 for (value, t1), (_, t2) in zip(levels, levels[1:]) if value)
+    return high / (levels[-1][1] - levels[0][1])
+
+
+def soft_pwm_threads():
+  return [thread for thread in threading.enumerate() if thread.name == "soft-pwm"]
+
+
+def make_chip(tmp_path):
+  """
+  Creates a fake sysfs PWM chip, exporting a channel creates its directory.
+  """
+  chip = tmp_path / "pwmchip0"
+  chip.mkdir()
+  (chip / "export").write_text("")
+  for channel in (0, 1):
+    (chip / f"pwm{channel}").mkdir()
+  return chip
+
+
+class TestBreathing:
+  def test_levels_follow_the_period(self):
+    level = breathing(period=2.0, low=0.2, high=0.8)
+
+    assert level(0.0) == pytest.approx(0.2)
+    assert level(1.0) == pytest.approx(0.8)
+    assert level(0.5) == pytest.approx(0.5)
+    assert level(2.0) == pytest.approx(0.2)
+
+
+class TestSoftPWM:
+  """
+  Tests for SoftPWM and soft PWM outputs: steady levels cost no thread
+  work, partial levels are modulated by one thread shared by every pin.
+  """
+  def setup_method(self):
+    self.gpio = RecordingGPIO()
+    self.soft_pwm = SoftPWM(frequency=200)
+
+  def teardown_method(self):
+    self.soft_pwm.close()
+
+  def output(self, pin=6, gamma=1.0):
+    return PWMOutput(GPIOController(self.gpio, pin), self.soft_pwm, hardware=False, gamma=gamma)
+
+  def test_steady_levels_are_written_once_without_thread(self):
+    led = self.output()
+    led.set_brightness(1.0)
+    led.set_brightness(1.0)
+    led.off()
+
+    assert [value for _, value, _ in self.gpio.levels] == [1, 0]
+    assert self.soft_pwm._thread is None
+
+  def test_partial_brightness_is_modulated(self):
+    led = self.output()
+    led.set_brightness(0.5)
+    time.sleep(0.3)
+    led.off()
+
+    assert self.soft_pwm.cycles > 20
+    assert 0.3 < self.gpio.duty(6) < 0.7
+
+  def test_gamma_dims_partial_levels(self):
+    led = self.output(gamma=2.0)
+    assert led.level(0) == 0.0
+    led.set_brightness(0.5)
+
+    assert led.level(0) == pytest.approx(0.25)
+
+  def test_one_thread_drives_every_pin(self):
+    leds = [self.output(pin) for pin in (5, 6, 16)]
+    for led in leds:
+      led.set_brightness(0.5)
+    time.sleep(0.05)
+
+    assert len(soft_pwm_threads()) == 1
+    assert {pin for pin, _, _ in self.gpio.levels} == {5, 6, 16}
+
+  def test_steady_level_stops_modulation(self):
+    led = self.output()
+    led.set_brightness(0.5)
+    time.sleep(0.05)
+    led.set_brightness(1.0)
+    time.sleep(0.02)
+    cycles = self.soft_pwm.cycles
+    time.sleep(0.05)
+
+    assert led.controller.state is True
+    assert self.soft_pwm.cycles == cycles
+
+  def test_close_turns_pins_off(self):
+    led = self.output()
+    led.breathe(period=0.1, low=0.5, high=1.0)
+    time.sleep(0.05)
+    self.soft_pwm.close()
+
+    assert led.controller.state is False
+    assert soft_pwm_threads() == []
+
+
+class TestHardwarePWM:
+  """
+  Tests for HardwarePWM and outputs using it, against a fake sysfs chip.
+  """
+  def test_channel_is_configured(self, tmp_path):
+    chip = make_chip(tmp_path)
+    pwm = HardwarePWM(13, frequency=1000, chip=str(chip))
+
+    assert pwm.channel == 1
+    assert (chip / "pwm1" / "period").read_text() == "1000000"
+    assert (chip / "pwm1" / "enable").read_text() == "1"
+
+    pwm.set_duty(0.25)
+    assert (chip / "pwm1" / "duty_cycle").read_text() == "250000"
+
+  def test_available_only_for_pwm_pins(self, tmp_path):
+    chip = make_chip(tmp_path)
+
+    assert HardwarePWM.available(18, chip=str(chip))
+    assert not HardwarePWM.available(6, chip=str(chip))
+    assert not HardwarePWM.available(18, chip=str(tmp_path / "missing"))
+
+  def test_steady_level_needs_no_thread(self, tmp_path):
+    chip = make_chip(tmp_path)
+    gpio = RecordingGPIO()
+    soft_pwm = SoftPWM()
+    led = PWMOutput(GPIOController(gpio, 18), soft_pwm, hardware=HardwarePWM(18, chip=str(chip)), gamma=1.0)
+    led.set_brightness(0.5)
+
+    assert (chip / "pwm0" / "duty_cycle").read_text() == "500000"
+    assert soft_pwm._thread is None
+    assert gpio.levels == []
+
+  def test_breathing_updates_duty(self, tmp_path):
+    chip = make_chip(tmp_path)
+    soft_pwm = SoftPWM(frequency=200)
+    led = PWMOutput(GPIOController(RecordingGPIO(), 18), soft_pwm, hardware=HardwarePWM(18, chip=str(chip)))
+    led.breathe(period=0.1)
+    time.sleep(0.05)
+    soft_pwm.close()
+
+    assert soft_pwm.cycles > 0
+    assert (chip / "pwm0" / "duty_cycle").read_text() == "0"
+
+
+class TestStatusLED:
+  def setup_method(self):
+    self.output = Mock()
+    self.status = StatusLED(self.output)
+
+  def test_states_map_to_levels(self):
+    self.status.set("recording")
+    self.output.set_brightness.assert_called_once_with(1.0)
+
+    self.status.set("connecting")
+    self.output.breathe.assert_called_once_with(*StatusLED.STATES["connecting"])
+
+  def test_same_state_is_not_reapplied(self):
+    self.status.set("idle")
+    self.status.set("idle")
+
+    self.output.set_brightness.assert_called_once()
+
+  def test_unknown_state_raises(self):
+    with pytest.raises(ValueError):
+      self.status.set("dancing")
+
+
+class TestRegistryPWM:
+  def setup_method(self):
+    self.gpio = RecordingGPIO()
+    self.registry = GPIORegistry(self.gpio)
+
+  def teardown_method(self):
+    self.registry.shutdown()
+
+  def test_outputs_share_one_soft_pwm(self):
+    red = self.registry.pwm(5)
+    green = self.registry.pwm(6)
+
+    assert self.registry.pwm(6) is green
+    assert red.soft_pwm is green.soft_pwm is self.registry.soft_pwm
+    assert red.hardware is None
+
+  def test_shutdown_stops_modulation_and_turns_off(self):
+    green = self.registry.pwm(6)
+    green.breathe(period=0.1)
+    time.sleep(0.05)
+    self.registry.shutdown()
+
+    assert green.controller.state is False
+    assert soft_pwm_threads() == []
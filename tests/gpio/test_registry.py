@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+from src.gpio.registry import GPIORegistry
+
+class TestGPIORegistry:
+  """
+  Tests for GPIORegistry: mode and pins set up once, and an ordered,
+  batched shutdown.
+  """
+  def setup_method(self):
+    self.mock_gpio = Mock()
+    self.registry = GPIORegistry(self.mock_gpio)
+
+  def test_mode_is_set_once(self):
+    self.registry.controller(5)
+    self.registry.controller(6)
+
+    self.mock_gpio.setmode.assert_called_once_with(self.mock_gpio.BCM)
+
+  def test_same_pin_returns_same_controller(self):
+    first = self.registry.controller(5)
+    second = self.registry.controller(5)
+
+    assert first is second
+    self.mock_gpio.setup.assert_called_once_with(5, self.mock_gpio.OUT)
+    assert len(self.registry) == 1
+
+  def test_initial_level_is_set_up_and_cached(self):
+    led = self.registry.controller(5, initial=True)
+    led.turn_on()
+
+    self.mock_gpio.setup.assert_called_once_with(5, self.mock_gpio.OUT, initial=self.mock_gpio.HIGH)
+    self.mock_gpio.output.assert_not_called()
+
+  def test_shutdown_drives_safe_levels_in_one_pass(self):
+    red = self.registry.controller(5)
+    green = self.registry.controller(6)
+    relay = self.registry.controller(12, safe_state=True)
+    red.turn_on()
+    green.turn_on()
+    self.mock_gpio.reset_mock()
+
+    seconds = self.registry.shutdown()
+
+    self.mock_gpio.output.assert_called_once_with([5, 6, 12], [self.mock_gpio.LOW, self.mock_gpio.LOW, self.mock_gpio.HIGH])
+    self.mock_gpio.cleanup.assert_called_once_with()
+    assert seconds == self.registry.shutdown_seconds
+    assert seconds >= 0
+
+  def test_hooks_run_before_pins_in_reverse_order(self):
+    calls = []
+    led = self.registry.controller(5)
+    self.registry.on_shutdown(lambda: calls.append("audio"))
+    self.registry.on_shutdown(lambda: calls.append("patterns"))
+    self.mock_gpio.output.side_effect = lambda *args: calls.append("pins")
+
+    self.registry.shutdown()
+
+    assert calls == ["patterns", "audio", "pins"]
+
+  def test_failing_hook_does_not_stop_shutdown(self):
+    self.registry.controller(5).turn_on()
+    self.registry.on_shutdown(Mock(side_effect=RuntimeError("stuck")))
+
+    self.registry.shutdown()
+
+    self.mock_gpio.output.assert_called_with(5, self.mock_gpio.LOW)
+
+  def test_shutdown_runs_once(self):
+    with self.registry:
+      self.registry.controller(5).turn_on()
+    self.registry.shutdown()
+
+    self.mock_gpio.cleanup.assert_called_once()
+
+  def test_without_gpio(self):
+    registry = GPIORegistry()
+    registry.controller(5).turn_on()
+
+    assert registry.shutdown() >= 0
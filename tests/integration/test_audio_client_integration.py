@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import grpc
 import threading
@@ -8,7 +9,8 @@ from unittest.mock import Mock
 
 from src.grpc_generated import audio_service_pb2
 from src.grpc_generated import audio_service_pb2_grpc
-from src.audio_client import AudioServiceClient
+from src.audio_client import AsyncAudioServiceClient, AudioServiceClient
+from src.fake_audio_service import FakeAudioService, start_fake_server
 
 
 class MockAudioServiceServer(audio_service_pb2_grpc.AudioServiceServicer):
@@ -328,3 +330,145 @@ class TestAudioClientIntegration:
         # All clients should succeed
         assert all(results)
         assert len(results) == 5
+
+
+class TestStreamClassificationsIntegration:
+    """Integration tests for the classification stream against FakeAudioService"""
+    
+    @pytest.fixture(autouse=True)
+    def setup_fake_server(self):
+        """Serve a FakeAudioService recording 100x faster than real time"""
+        self.service = FakeAudioService(time_scale=0.01)
+        self.server, self.server_address = start_fake_server(self.service)
+        self.client = AudioServiceClient(server_address=self.server_address)
+        
+        yield
+        
+        self.client.close()
+        self.server.stop(0)
+    
+    def test_windows_are_contiguous(self):
+        """Test that the stream covers the session without gaps"""
+        results = list(self.client.stream_classifications(window_duration=5, max_windows=4))
+        
+        assert len(results) == 4
+        assert all(result['success'] for result in results)
+        assert [result['window_start'] for result in results] == [0, 5, 10, 15]
+        assert [result['window_end'] for result in results] == [5, 10, 15, 20]
+        assert self.service.windows_streamed == 4
+    
+    def test_cancel_streams_ends_stream(self):
+        """Test that an open-ended stream stops when cancelled from another thread"""
+        results = []
+        
+        def consume():
+            for result in self.client.stream_classifications(window_duration=5):
+                results.append(result)
+        
+        thread = threading.Thread(target=consume)
+        thread.start()
+        time.sleep(0.2)
+        self.client.cancel_streams()
+        thread.join(timeout=2)
+        
+        assert not thread.is_alive()
+        assert len(results) >= 2
+        assert self.client.streaming_supported is True
+        
+        # The server notices the cancellation and ends the stream
+        deadline = time.monotonic() + 2
+        while self.service.active_streams and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.service.active_streams == 0
+    
+    def test_service_without_streaming(self):
+        """Test that a service without the streaming RPC is detected"""
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        audio_service_pb2_grpc.add_AudioServiceServicer_to_server(MockAudioServiceServer(), server)
+        port = server.add_insecure_port('localhost:0')
+        server.start()
+        client = AudioServiceClient(server_address=f'localhost:{port}')
+        
+        assert list(client.stream_classifications(max_windows=1)) == []
+        assert client.streaming_supported is False
+        
+        client.close()
+        server.stop(0)
+    
+    def test_unary_calls_served(self):
+        """Test that the fake also answers the unary calls"""
+        result = self.client.start_audio_processing(duration=5, session_id="fake-session")
+        
+        assert result['success'] is True
+        assert result['predicted_class'] in self.service.classes
+        assert self.client.get_processing_status("fake-session")['status'] == 'completed'
+
+
+class TestAsyncAudioClientIntegration:
+    """Integration tests for AsyncAudioServiceClient against FakeAudioService"""
+    
+    @pytest.fixture(autouse=True)
+    def setup_fake_server(self):
+        """Serve a FakeAudioService taking 0.1 s per call"""
+        self.service = FakeAudioService(processing_delay=0.1)
+        self.server, self.server_address = start_fake_server(self.service, max_workers=50)
+        
+        yield
+        
+        self.server.stop(0)
+    
+    def run(self, scenario):
+        """Run a coroutine taking a connected client on a new event loop"""
+        async def main():
+            async with AsyncAudioServiceClient(server_address=self.server_address) as client:
+                return await scenario(client)
+        return asyncio.run(main())
+    
+    def test_full_workflow(self):
+        """Test the calls of a session in turn"""
+        async def scenario(client):
+            assert await client.wait_for_service(max_retries=1, retry_delay=0.1) is True
+            result = await client.start_audio_processing(duration=5, session_id="async-session")
+            status = await client.get_processing_status("async-session")
+            return result, status
+        
+        result, status = self.run(scenario)
+        
+        assert result['success'] is True
+        assert result['session_id'] == "async-session"
+        assert status['status'] == 'completed'
+    
+    def test_concurrent_sessions_on_one_loop(self):
+        """Test that concurrent calls overlap on one event loop"""
+        async def scenario(client):
+            start = time.monotonic()
+            results = await asyncio.gather(*(client.start_audio_processing(duration=5) for _ in range(20)))
+            return results, time.monotonic() - start
+        
+        results, elapsed = self.run(scenario)
+        
+        assert all(result['success'] for result in results)
+        # 20 calls of 0.1 s each take 2 s one after the other
+        assert elapsed < 1.0
+    
+    def test_stream_classifications(self):
+        """Test streaming windows with the async generator"""
+        self.service.processing_delay = 0
+        self.service.time_scale = 0.01
+        
+        async def scenario(client):
+            return [result async for result in client.stream_classifications(window_duration=5, max_windows=3)]
+        
+        results = self.run(scenario)
+        
+        assert [result['window_start'] for result in results] == [0, 5, 10]
+    
+    def test_timeout_returns_none(self):
+        """Test that a call exceeding the timeout fails like the sync client"""
+        self.service.processing_delay = 2
+        
+        async def scenario(client):
+            client.timeout = 0.5
+            return await client.start_audio_processing(duration=1)
+        
+        assert self.run(scenario) is None
@@ -17,16 +17,16 @@ class TestReaderLCDIntegration:
         Test that a successful card read properly updates the LCD display
         """
         # Set up services
-        reader_service = ReaderService(reader=mock_reader)
         lcd_service = LCDService(writer=mock_writer)
         
-        # Simulate a read operation
-        uid, text = reader_service.read()
-        
-        # Update LCD with the result
-        if uid is not None:
-            lcd_service.clear()
-            lcd_service.write(f"Card: {text}")
+        with ReaderService(reader=mock_reader) as reader_service:
+            # Simulate a read operation
+            uid, text = reader_service.read()
+            
+            # Update LCD with the result
+            if uid is not None:
+                lcd_service.clear()
+                lcd_service.write(f"Card: {text}")
         
         # Verify interaction
         assert mock_reader.read_called
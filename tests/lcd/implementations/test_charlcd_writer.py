@@ -36,6 +36,7 @@ class TestCharLCDWriter:
 
   def test_release(self, writer, mock_charlcd):
     # Test the cleanup of CharLCDWriter
+    writer.write("Hello")
     writer.__del__()
     
     mock_charlcd.clear.assert_called_once()
@@ -57,14 +58,162 @@ class TestCharLCDWriter:
     
   def test_clear_success(self, writer, mock_charlcd):
     # Test successful clear operation
+    writer.write("Hello")
     writer.clear()
     
     mock_charlcd.clear.assert_called_once()
     
   def test_clear_exception(self, writer, mock_charlcd):
+    writer.write("Hello")
     mock_charlcd.clear.side_effect = Exception("Test error")
     
     with pytest.raises(Exception) as excinfo:
       writer.clear()
     
-    assert "Error clearing LCD: Test error" in str(excinfo.value)
\ No newline at end of file
+    assert "Error clearing LCD: Test error" in str(excinfo.value)
+
+
+class TestCharLCDWriterFrameBuffer:
+  """
+  Tests for the shadow frame buffer of CharLCDWriter: only changed cells are
+  rewritten, unchanged updates and clears of a blank display are skipped,
+  and the I2C bytes of each update are counted.
+  """
+  def test_clear_of_blank_display_is_skipped(self, writer, mock_charlcd):
+    writer.clear()
+
+    mock_charlcd.clear.assert_not_called()
+    assert writer.skipped_updates == 1
+
+  def test_same_text_is_not_rewritten(self, writer, mock_charlcd):
+    writer.write("Hello")
+    writer.write("Hello")
+
+    mock_charlcd.write_string.assert_called_once_with("Hello")
+    assert writer.last_update_bytes == 0
+
+  def test_only_changed_cells_are_written(self, writer, mock_charlcd):
+    writer.write("Audio: dog")
+    mock_charlcd.reset_mock()
+
+    writer.write("Audio: cat")
+
+    mock_charlcd.write_string.assert_called_once_with("cat")
+    assert mock_charlcd.cursor_pos == (0, 7)
+    # One cursor move and three characters, 8 I2C bytes each on a PCF8574
+    assert writer.last_update_bytes == 4 * 8
+
+  def test_shorter_text_blanks_leftover_cells(self, writer, mock_charlcd):
+    writer.write("Processing audio...")
+    writer.write("Processing")
+
+    assert writer.frame == ["Processing      ", "                "]
+
+  def test_text_wraps_to_next_row(self, writer, mock_charlcd):
+    writer.write("Audio service unavailable")
+
+    assert writer.frame == ["Audio service un", "available       "]
+
+  def test_full_change_uses_clear_when_cheaper(self, writer, mock_charlcd):
+    writer.write_lines(["abcdefghijklmnop", "abcdefghijklmnop"])
+    mock_charlcd.reset_mock()
+
+    writer.write_lines(["x"])
+
+    mock_charlcd.clear.assert_called_once()
+    mock_charlcd.write_string.assert_called_once_with("x")
+
+  def test_failed_write_forces_full_redraw(self, writer, mock_charlcd):
+    mock_charlcd.write_string.side_effect = [Exception("I2C error"), None]
+    with pytest.raises(Exception):
+      writer.write("Hello")
+
+    writer.write("Hello")
+
+    assert writer.frame[0].startswith("Hello")
+    mock_charlcd.clear.assert_called_once()
+
+  def test_counts_total_bytes(self, writer, mock_charlcd):
+    writer.write("Hi")
+    writer.clear()
+
+    assert writer.i2c_bytes == (2 + 1) * 8
+    assert writer.update_count == 2
+
+
+class TestCharLCDWriterGlyphs:
+  """
+  Tests for the CGRAM glyph cache: custom characters are uploaded on first
+  use, reused while resident and evicted least recently used first, never
+  while on the display.
+  """
+  def test_glyph_is_uploaded_once(self, writer, mock_charlcd):
+    writer.write("██▍")
+    writer.write("█▍ ")
+
+    assert mock_charlcd.create_char.call_count == 2
+    assert writer.glyph_uploads == 2
+    assert writer.glyph_hits == 2
+    assert writer.frame[0][:3] == "\x00\x01 "
+
+  def test_upload_is_counted_in_bytes(self, writer, mock_charlcd):
+    writer.write("█")
+
+    assert writer.last_update_bytes == (10 + 1) * 8
+
+  def test_redefined_glyph_upload_is_counted_on_unchanged_frame(self, writer, mock_charlcd):
+    writer.write("█")
+    writer.define_glyph("█", (1,) * 8)
+
+    writer.write("█")
+
+    mock_charlcd.create_char.assert_called_with(0, (1,) * 8)
+    assert writer.skipped_updates == 1
+    assert writer.last_update_bytes == 10 * 8
+
+  def test_lru_glyph_off_display_is_evicted(self, writer, mock_charlcd):
+    for index in range(8):
+      writer.define_glyph(chr(0xE000 + index), (index,) * 8)
+      writer.write(chr(0xE000 + index))
+    writer.write(chr(0xE001))
+    writer.define_glyph("", (31,) * 8)
+
+    writer.write("")
+
+    # Glyph 0 is the least recently used and not on the display
+    mock_charlcd.create_char.assert_called_with(0, (31,) * 8)
+    assert writer.glyph_evictions == 1
+
+  def test_glyph_replaced_on_display_is_evicted(self, writer, mock_charlcd):
+    for index in range(8):
+      writer.define_glyph(chr(0xE000 + index), (index,) * 8)
+    writer.write("".join(chr(0xE000 + index) for index in range(8)))
+    writer.define_glyph("", (31,) * 8)
+
+    writer.write("".join(chr(0xE000 + index) for index in range(7)) + "")
+
+    # Only the glyph this frame no longer shows gives up its slot
+    mock_charlcd.create_char.assert_called_with(7, (31,) * 8)
+    assert writer.glyph_evictions == 1
+    assert writer.frame[0][:8] == "".join(chr(slot) for slot in range(8))
+
+  def test_glyphs_of_the_frame_are_not_evicted(self, writer, mock_charlcd):
+    for index in range(8):
+      writer.define_glyph(chr(0xE000 + index), (index,) * 8)
+      writer.write(chr(0xE000 + index))
+    writer.write("x")
+    writer.define_glyph("\u25A0", (31,) * 8)
+
+    # Glyph 0 is the least recently used but this frame shows it
+    writer.write("\u25A0\uE000")
+
+    mock_charlcd.create_char.assert_called_with(1, (31,) * 8)
+    assert writer.glyph_evictions == 1
+    assert writer.frame[0][:2] == "\x01\x00"
+
+  def test_redefined_glyph_is_uploaded_again(self, writer, mock_charlcd):
+    writer.write("█")
+    writer.define_glyph("█", (1,) * 8)
+    writer.write("██")
+
+    assert writer.glyph_uploads == 2
@@ -0,0 +1,76 @@
+import itertools
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from src.lcd.implementations.pcf8574_writer import DATA, INSTRUCTIONS, PCF8574BlockWriter
+
+@pytest.fixture
+def mock_bus():
+  with patch('src.lcd.implementations.pcf8574_writer.SMBus') as mock_class, \
+      patch('src.lcd.implementations.pcf8574_writer.i2c_msg') as mock_msg, \
+      patch('src.lcd.implementations.pcf8574_writer.time.sleep'):
+    mock_msg.write.side_effect = lambda addr, buf: SimpleNamespace(addr=addr, buf=bytes(buf))
+    mock_instance = MagicMock()
+    mock_class.return_value = mock_instance
+    yield mock_instance
+
+@pytest.fixture
+def writer(mock_bus):
+  writer = PCF8574BlockWriter(address=0x27, port=1, cols=16, rows=2)
+  mock_bus.i2c_rdwr.reset_mock()
+  return writer
+
+def sent(mock_bus):
+  return [call.args[0].buf for call in mock_bus.i2c_rdwr.call_args_list]
+
+class TestPCF8574BlockWriter:
+  def test_data_byte_encoding(self):
+    # 'A' = 0x41: RS and backlight set, each nibble strobed with E
+    assert DATA[0x41] == bytes((0x49, 0x4D, 0x49, 0x19, 0x1D, 0x19))
+    assert INSTRUCTIONS[0x01] == bytes((0x08, 0x0C, 0x08, 0x18, 0x1C, 0x18))
+
+  def test_update_is_one_transaction(self, writer, mock_bus):
+    writer.write("Hello")
+
+    assert sent(mock_bus) == [b"".join(DATA[ord(c)] for c in "Hello")]
+
+  def test_transaction_address(self, writer, mock_bus):
+    writer.write("Hi")
+
+    assert mock_bus.i2c_rdwr.call_args.args[0].addr == 0x27
+
+  def test_counted_bytes_match_bus(self, writer, mock_bus):
+    writer.write("Audio: Dog bark")
+    writer.write("Audio: Siren\nConfidence: 0.64")
+    writer.write("Dog  █████▎  87%")
+
+    assert writer.i2c_bytes == sum(len(message) for message in sent(mock_bus))
+
+  def test_clear_is_sent_alone(self, writer, mock_bus):
+    writer.write("Hi")
+    writer.clear()
+
+    assert sent(mock_bus)[-1] == INSTRUCTIONS[0x01]
+
+  def test_failed_transaction_forces_full_redraw(self, writer, mock_bus):
+    mock_bus.i2c_rdwr.side_effect = itertools.chain([OSError("Remote I/O error")], itertools.repeat(None))
+    with pytest.raises(Exception) as excinfo:
+      writer.write("Hello")
+
+    assert "Error writing to LCD: Remote I/O error" in str(excinfo.value)
+    assert writer.frame is None
+
+    writer.write("Hello")
+    # A clear, then the text
+    assert sent(mock_bus)[-2] == INSTRUCTIONS[0x01]
+
+  def test_failed_transaction_uploads_glyphs_again(self, writer, mock_bus):
+    mock_bus.i2c_rdwr.side_effect = itertools.chain([OSError("Remote I/O error")], itertools.repeat(None))
+    with pytest.raises(Exception):
+      writer.write("█")
+
+    writer.write("█")
+
+    # The CGRAM upload is sent again with the redraw, the failed one never was
+    assert INSTRUCTIONS[0x40] in b"".join(sent(mock_bus)[1:])
+    assert writer.glyph_uploads == 2
@@ -0,0 +1,80 @@
+import pytest
+from src.lcd.implementations.virtual_lcd_writer import VirtualHD44780, VirtualLCDWriter
+from src.lcd.lcd_service import LCDService
+
+@pytest.fixture
+def writer():
+  return VirtualLCDWriter(cols=16, rows=2)
+
+class TestVirtualHD44780:
+  def test_text_continues_on_next_row(self):
+    lcd = VirtualHD44780(cols=16, rows=2)
+    lcd.write_string("Processing audio...")
+
+    assert lcd.row(0) == b"Processing audio"
+    assert lcd.row(1).startswith(b"...")
+    assert lcd.cursor_pos == (1, 3)
+    # 19 characters and the move to the second row
+    assert lcd.i2c_bytes == 20 * 8
+
+  def test_cursor_move_sets_ddram_address(self):
+    lcd = VirtualHD44780(cols=16, rows=2)
+    lcd.cursor_pos = (1, 4)
+    lcd.write_string("X")
+
+    assert lcd.ddram[0x44] == ord("X")
+
+  def test_clear_blanks_ddram_and_waits(self):
+    lcd = VirtualHD44780(cols=16, rows=2)
+    lcd.write_string("Hi")
+    lcd.clear()
+    lcd.write_string("A")
+
+    assert lcd.row(0) == b"A" + b" " * 15
+    assert lcd.busy_violations == 0
+
+  def test_instruction_during_clear_is_a_violation(self):
+    lcd = VirtualHD44780(cols=16, rows=2, clear_delay=0.0)
+    lcd.clear()
+    lcd.write_string("A")
+
+    assert lcd.busy_violations == 1
+
+class TestVirtualLCDWriter:
+  def test_write_shows_text(self, writer):
+    writer.write("Audio: Dog\nConfidence: 0.87")
+
+    assert writer.lines == ["Audio: Dog      ", "Confidence: 0.87"]
+
+  def test_counted_bytes_match_controller(self, writer):
+    writer.write("Audio: Dog bark")
+    writer.write("Audio: Siren")
+    writer.write_lines(["Dog  █████▎  87%"])
+    writer.clear()
+
+    assert writer.i2c_bytes == writer.lcd.i2c_bytes
+
+  def test_updates_are_recorded(self, writer):
+    writer.write("Welcome!")
+    writer.write("Welcome!")
+    writer.clear()
+
+    assert [u.operation for u in writer.updates] == ["write", "write", "clear"]
+    assert writer.updates[0].i2c_bytes == 8 * 8
+    assert writer.updates[0].duration > 0
+    assert writer.updates[1].i2c_bytes == 0
+    assert writer.updates[0].timestamp <= writer.updates[2].timestamp
+    assert writer.updates[2].lines == [" " * 16] * 2
+
+  def test_glyphs_are_shown_as_their_characters(self, writer):
+    writer.write("██▍")
+
+    assert writer.lines[0].startswith("██▍ ")
+
+  def test_on_update_callback(self):
+    seen = []
+    writer = VirtualLCDWriter(on_update=seen.append)
+    LCDService(writer).write("Goodbye!")
+
+    assert seen[0].text == "Goodbye!"
+    assert seen[0].lines[0] == "Goodbye!        "
@@ -0,0 +1,42 @@
+from src.lcd.frame import diff, layout, message_frames
+
+class TestLayout:
+  """
+  Tests for laying text out on the display and diffing frames.
+  """
+  def test_wraps_at_end_of_row(self):
+    assert layout("Processing audio...", 16, 2) == ["Processing audio", "...             "]
+
+  def test_newline_starts_next_row(self):
+    assert layout("Audio: Dog\nConfidence: 0.87", 16, 2) == ["Audio: Dog      ", "Confidence: 0.87"]
+
+  def test_diff_merges_close_runs(self):
+    old = ["Confidence: 0.87"]
+    new = ["Confidence: 0.91"]
+    assert diff(old, new) == [(0, 14, "91")]
+
+class TestMessageFrames:
+  """
+  Tests for the cached message frames used for word wrap and marquee scrolling.
+  """
+  def test_short_text_is_one_frame(self):
+    assert message_frames("Audio: Dog", 16, 2) == (("Audio: Dog      ", "                "),)
+
+  def test_wraps_on_words(self):
+    assert message_frames("Audio service unavailable", 16, 2) == (
+      ("Audio service   ", "unavailable     "),
+    )
+
+  def test_long_text_scrolls_on_top_row(self):
+    text = "Audio: Emergency vehicle siren, 0.92"
+    frames = message_frames(text, 16, 2, gap=4)
+
+    assert len(frames) == len(text) + 4
+    assert frames[0] == ("Audio: Emergency", " " * 16)
+    assert frames[1] == ("udio: Emergency ", " " * 16)
+    # The last frame leads back into the first
+    assert frames[-1][0][1:] == frames[0][0][:-1]
+
+  def test_frames_are_cached(self):
+    text = "Unrecognised card, please try again"
+    assert message_frames(text, 16, 2) is message_frames(text, 16, 2)
@@ -0,0 +1,27 @@
+from src.lcd.glyphs import BAR_GLYPHS, bar, bar_chart, column_bitmap
+
+class TestBars:
+  """
+  Tests for the bar text and the bitmaps of its partial cells.
+  """
+  def test_column_bitmap_lights_left_columns(self):
+    assert column_bitmap(2) == (0b11000,) * 7 + (0,)
+    assert column_bitmap(5) == (0b11111,) * 7 + (0,)
+
+  def test_bar_uses_full_and_partial_cells(self):
+    # 0.5 of 6 cells is 15 of 30 pixel columns
+    assert bar(0.5, 6) == "███   "
+    assert bar(0.47, 6) == "██▊   "
+
+  def test_bar_is_clamped(self):
+    assert bar(-1, 4) == "    "
+    assert bar(2, 4) == "████"
+
+  def test_every_bar_character_has_a_glyph(self):
+    assert set(bar(0.9, 6) + bar(0.37, 6)) - {" "} <= set(BAR_GLYPHS)
+    assert len(BAR_GLYPHS) == 5
+
+  def test_bar_chart_fills_rows(self):
+    rows = bar_chart([("Dog bark", 0.87), ("Car", 1.0)], 16).split("\n")
+
+    assert rows == ["Dog  █████▎  87%", "Car  ██████ 100%"]
@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import Mock, patch
 from src.lcd.lcd_service import LCDService
 from src.lcd.base import Writer
@@ -55,4 +57,195 @@ class TestLCDService:
     
     with patch("builtins.print") as mock_print:
       self.lcd_service.clear()
-      mock_print.assert_called_with("Error clearing LCD: Clear exception")
\ No newline at end of file
+      mock_print.assert_called_with("Error clearing LCD: Clear exception")
+
+class TestLCDServiceAsynchronous:
+  """
+  Tests for the asynchronous mode of LCDService, where a render thread owns
+  the display and pending requests are coalesced so only the newest is drawn.
+  """
+  def setup_method(self):
+    self.mock_writer = Mock(spec=Writer)
+
+  def test_write_returns_before_drawing(self):
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_write(text):
+      started.set()
+      release.wait(1)
+
+    self.mock_writer.write.side_effect = slow_write
+    lcd_service = LCDService(self.mock_writer, asynchronous=True)
+    try:
+      lcd_service.write("Processing audio...")
+      started.wait(1)
+      lcd_service.write("Audio: Dog")
+
+      assert lcd_service.queue_depth == 1
+    finally:
+      release.set()
+      lcd_service.close()
+
+  def test_pending_requests_coalesce_to_newest(self):
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_write(text):
+      started.set()
+      release.wait(1)
+
+    self.mock_writer.write.side_effect = slow_write
+    lcd_service = LCDService(self.mock_writer, asynchronous=True)
+    lcd_service.write("first")
+    started.wait(1)
+    lcd_service.write("second")
+    lcd_service.clear()
+    lcd_service.write("third")
+    release.set()
+
+    assert lcd_service.flush(timeout=1)
+    lcd_service.close()
+
+    assert [c.args[0] for c in self.mock_writer.write.call_args_list] == ["first", "third"]
+    self.mock_writer.clear.assert_not_called()
+    assert lcd_service.dropped_frames == 2
+    assert lcd_service.rendered_frames == 2
+    assert lcd_service.max_queue_depth == 3
+
+  def test_close_draws_last_request(self):
+    lcd_service = LCDService(self.mock_writer, asynchronous=True)
+    lcd_service.write("Goodbye!")
+    lcd_service.close()
+
+    self.mock_writer.write.assert_called_with("Goodbye!")
+    assert lcd_service.asynchronous is False
+
+  def test_render_errors_are_reported_not_raised(self):
+    self.mock_writer.write.side_effect = Exception("I2C error")
+    lcd_service = LCDService(self.mock_writer, asynchronous=True)
+
+    with patch("builtins.print") as mock_print:
+      lcd_service.write("text")
+      lcd_service.flush(timeout=1)
+      lcd_service.close()
+      mock_print.assert_called_with("Error writing to LCD: I2C error")
+
+class TestLCDServiceMarquee:
+  """
+  Tests for messages that do not fit the display: word wrap, and marquee
+  frames played by the render thread.
+  """
+  def setup_method(self):
+    self.mock_writer = Mock(spec=Writer)
+
+  def test_wrapped_text_is_written_as_lines(self):
+    lcd_service = LCDService(self.mock_writer)
+    lcd_service.write("Audio service unavailable")
+
+    self.mock_writer.write_lines.assert_called_once_with(["Audio service   ", "unavailable     "])
+    self.mock_writer.write.assert_not_called()
+
+  def test_synchronous_mode_shows_first_frame(self):
+    lcd_service = LCDService(self.mock_writer)
+    lcd_service.write("Audio: Emergency vehicle siren, 0.92")
+
+    self.mock_writer.write_lines.assert_called_once_with(["Audio: Emergency", " " * 16])
+
+  def test_render_thread_scrolls_until_next_request(self):
+    lcd_service = LCDService(self.mock_writer, asynchronous=True, scroll_interval=0.005)
+    try:
+      lcd_service.write("Audio: Emergency vehicle siren, 0.92")
+      deadline = time.monotonic() + 1
+      while lcd_service.scroll_steps < 3 and time.monotonic() < deadline:
+        time.sleep(0.002)
+      lcd_service.write("Audio: Dog")
+      assert lcd_service.flush(timeout=1)
+      steps = lcd_service.scroll_steps
+      time.sleep(0.03)
+    finally:
+      lcd_service.close()
+
+    rows = [c.args[0][0] for c in self.mock_writer.write_lines.call_args_list]
+    assert rows[:3] == ["Audio: Emergency", "udio: Emergency ", "dio: Emergency v"]
+    self.mock_writer.write.assert_called_with("Audio: Dog")
+    assert lcd_service.scroll_steps == steps
+
+
+class TestLCDServiceBars:
+  """
+  Tests for probability bars drawn through LCDService.
+  """
+  def setup_method(self):
+    self.mock_writer = Mock(spec=Writer)
+    self.lcd_service = LCDService(self.mock_writer)
+
+  def test_write_bar_writes_one_row_per_bar(self):
+    self.lcd_service.write_bar([("Dog", 0.5), ("Siren", 0.25), ("Car", 0.1)])
+
+    self.mock_writer.write_lines.assert_called_once_with(["Dog  ███     50%", "Sire █▋      25%"])
+
+class TestLCDServiceTransactions:
+  """
+  Tests for atomic updates shared between threads: show(), compare-and-skip
+  and contention counting.
+  """
+  def setup_method(self):
+    self.mock_writer = Mock(spec=Writer)
+    self.lcd_service = LCDService(self.mock_writer)
+
+  def test_show_replaces_all_rows(self):
+    self.lcd_service.show(["Audio: Dog"])
+
+    self.mock_writer.write_lines.assert_called_once_with(["Audio: Dog      ", " " * 16])
+
+  def test_same_content_is_skipped(self):
+    self.lcd_service.write("Welcome!")
+    self.lcd_service.write("Welcome!")
+    self.lcd_service.show(["Welcome!"])
+
+    self.mock_writer.write.assert_called_once_with("Welcome!")
+    self.mock_writer.write_lines.assert_not_called()
+    assert self.lcd_service.skipped_updates == 2
+
+  def test_clear_of_cleared_display_is_skipped(self):
+    self.lcd_service.clear()
+    self.lcd_service.clear()
+
+    self.mock_writer.clear.assert_called_once()
+
+  def test_failed_update_is_not_skipped_next_time(self):
+    self.mock_writer.write.side_effect = [Exception("I2C error"), None]
+    with patch("builtins.print"):
+      self.lcd_service.write("Welcome!")
+    self.lcd_service.write("Welcome!")
+
+    assert self.mock_writer.write.call_count == 2
+
+  def test_concurrent_updates_do_not_interleave(self):
+    drawing = threading.Event()
+    release = threading.Event()
+    overlaps = []
+
+    def slow_write(text):
+      if drawing.is_set():
+        overlaps.append(text)
+      drawing.set()
+      release.wait(1)
+      drawing.clear()
+
+    self.mock_writer.write.side_effect = slow_write
+    audio = threading.Thread(target=self.lcd_service.write, args=("Audio: Dog",))
+    audio.start()
+    drawing.wait(1)
+    main = threading.Thread(target=self.lcd_service.write, args=("Welcome!",))
+    main.start()
+    # Give the main thread time to block on the lock
+    time.sleep(0.05)
+    release.set()
+    audio.join(1)
+    main.join(1)
+
+    assert overlaps == []
+    assert self.lcd_service.contentions == 1
+    assert self.mock_writer.write.call_count == 2
@@ -0,0 +1,142 @@
+import threading
+import time
+from unittest.mock import Mock
+from src.lcd.base import Writer
+from src.lcd.lcd_service import LCDService
+from src.lcd.scheduler import Message, MessageScheduler, TimerWheel
+
+def wait_until(predicate, timeout=1.0):
+  deadline = time.monotonic() + timeout
+  while time.monotonic() < deadline:
+    if predicate():
+      return True
+    time.sleep(0.002)
+  return predicate()
+
+class TestTimerWheel:
+  """
+  Tests for TimerWheel scheduling and cancellation.
+  """
+  def setup_method(self):
+    self.wheel = TimerWheel(tick=0.005, slots=8)
+    self.wheel.start()
+
+  def teardown_method(self):
+    self.wheel.stop()
+
+  def test_fires_after_delay(self):
+    fired = threading.Event()
+    start = time.monotonic()
+    self.wheel.schedule(0.02, fired.set)
+
+    assert fired.wait(1)
+    assert time.monotonic() - start >= 0.02
+
+  def test_delay_longer_than_one_rotation(self):
+    fired = threading.Event()
+    start = time.monotonic()
+    self.wheel.schedule(0.1, fired.set)
+
+    assert fired.wait(1)
+    assert time.monotonic() - start >= 0.1
+
+  def test_cancelled_timer_does_not_fire(self):
+    fired = threading.Event()
+    timer = self.wheel.schedule(0.01, fired.set)
+    self.wheel.cancel(timer)
+
+    assert not fired.wait(0.05)
+    assert wait_until(lambda: len(self.wheel) == 0)
+
+
+class TestMessageScheduler:
+  """
+  Tests for MessageScheduler priorities, minimum display times, durations
+  and expiry.
+  """
+  def setup_method(self):
+    self.shown = []
+    self.scheduler = MessageScheduler(self.shown.append, TimerWheel(tick=0.005))
+
+  def teardown_method(self):
+    self.scheduler.close()
+
+  def texts(self):
+    return [None if message is None else message.text for message in self.shown]
+
+  def test_message_waits_for_min_display(self):
+    self.scheduler.post(Message("Audio: Dog", min_display=0.05))
+    self.scheduler.post(Message("Confidence: 0.9"))
+
+    assert self.texts() == ["Audio: Dog"]
+    assert wait_until(lambda: self.texts() == ["Audio: Dog", "Confidence: 0.9"])
+    assert self.shown[1].shown_at - self.shown[0].shown_at >= 0.05
+
+  def test_higher_priority_preempts(self):
+    self.scheduler.post(Message("Processing audio...", min_display=10))
+    self.scheduler.post(Message("Welcome!", priority=2))
+
+    assert self.texts() == ["Processing audio...", "Welcome!"]
+    assert self.scheduler.preempted_messages == 1
+
+  def test_lower_priority_waits_for_higher(self):
+    self.scheduler.post(Message("Welcome!", priority=2, min_display=0.03))
+    self.scheduler.post(Message("Processing audio...", priority=1))
+
+    assert self.texts() == ["Welcome!"]
+    assert wait_until(lambda: self.texts()[-1] == "Processing audio...")
+
+  def test_waiting_messages_by_priority_then_order(self):
+    self.scheduler.post(Message("Welcome!", priority=2, min_display=10))
+    self.scheduler.post(Message("a"))
+    self.scheduler.post(Message("b", priority=1))
+    self.scheduler.post(Message("c"))
+
+    assert [message.text for message in self.scheduler.waiting] == ["b", "a", "c"]
+
+  def test_duration_clears_display(self):
+    self.scheduler.post(Message("Goodbye!", duration=0.02))
+
+    assert wait_until(lambda: self.texts() == ["Goodbye!", None])
+    assert self.scheduler.current is None
+
+  def test_expired_message_is_dropped(self):
+    self.scheduler.post(Message("Welcome!", priority=2, min_display=0.05))
+    self.scheduler.post(Message("stale", expiry=0.01))
+
+    assert wait_until(lambda: self.scheduler.dropped_messages == 1)
+    time.sleep(0.06)
+    assert "stale" not in self.texts()
+
+
+class TestLCDServicePost:
+  """
+  Tests for LCDService.post(), which draws scheduled messages through the writer.
+  """
+  def test_post_writes_and_clears_after_duration(self):
+    writer = Mock(spec=Writer)
+    lcd_service = LCDService(writer)
+    try:
+      lcd_service.post("Welcome!", min_display=0.01, duration=0.01)
+
+      writer.write.assert_called_once_with("Welcome!")
+      assert wait_until(lambda: writer.clear.called)
+    finally:
+      lcd_service.close()
+
+  def test_direct_write_replaces_the_scheduled_message(self):
+    writer = Mock(spec=Writer)
+    lcd_service = LCDService(writer)
+    try:
+      lcd_service.post("Welcome!", min_display=1.0, duration=0.02)
+      lcd_service.write("Reader error")
+
+      assert lcd_service.scheduler.current is None
+      # The duration of the replaced message does not clear the direct write
+      time.sleep(0.1)
+      writer.clear.assert_not_called()
+
+      lcd_service.post("Goodbye!")
+      writer.write.assert_called_with("Goodbye!")
+    finally:
+      lcd_service.close()
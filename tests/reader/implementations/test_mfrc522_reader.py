@@ -1,6 +1,10 @@
 import pytest
+import threading
 from unittest.mock import MagicMock, patch
 from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.reader_service import ReaderService
+from src.reader.irq import FakeIRQBackend
+from src.reader.simulation import SimulatedMFRC522
 
 @pytest.fixture
 def mock_mfrc522():
@@ -101,4 +105,281 @@ class TestMFRC522Reader:
     
     assert str(exc_info.value) == "Failed to read UID from tag"
     mock_mfrc522.MFRC522_Request.assert_called_once()
-    mock_mfrc522.MFRC522_Anticoll.assert_called_once()
\ No newline at end of file
+    mock_mfrc522.MFRC522_Anticoll.assert_called_once()
+
+class TestMFRC522ReaderWaitForTag:
+  """
+  Test suite for MFRC522Reader.wait_for_tag().
+  Covers the interrupt-driven detection mode, using the simulated chip and
+  the fake IRQ backend, and the polling fallback without an IRQ backend.
+  """
+  UID = [0x12, 0x34, 0x56, 0x78, 0x08]
+
+  def test_init_with_chip_skips_driver(self, mock_mfrc522):
+    chip = SimulatedMFRC522()
+    reader = MFRC522Reader(chip=chip)
+    assert reader.reader is chip
+
+  def test_irq_mode_returns_uid_when_tag_answers(self):
+    irq = FakeIRQBackend()
+    chip = SimulatedMFRC522(irq=irq)
+    chip.present(self.UID)
+    reader = MFRC522Reader(chip=chip, irq=irq)
+
+    uid, text = reader.wait_for_tag(timeout=1)
+
+    assert uid == self.UID
+    assert text == "Sample Text"
+    assert irq.trigger_count == 1
+    # The armed request is answered, so no full request transaction is needed
+    assert chip.transactions == 1
+
+  def test_irq_mode_arms_receive_interrupt(self):
+    irq = FakeIRQBackend()
+    chip = SimulatedMFRC522(irq=irq)
+    chip.present(self.UID)
+    reader = MFRC522Reader(chip=chip, irq=irq)
+
+    reader.wait_for_tag(timeout=1)
+
+    assert chip.registers[chip.CommIEnReg] == 0xA0
+    assert chip.registers[chip.FIFODataReg] == chip.PICC_REQIDL
+    assert chip.registers[chip.BitFramingReg] == 0x87
+
+  def test_irq_mode_wakes_when_tag_arrives(self):
+    irq = FakeIRQBackend()
+    chip = SimulatedMFRC522(irq=irq)
+    reader = MFRC522Reader(chip=chip, irq=irq, rearm_interval=0.005)
+    timer = threading.Timer(0.02, chip.present, args=(self.UID,))
+    timer.start()
+
+    uid, text = reader.wait_for_tag(timeout=1)
+
+    assert uid == self.UID
+
+  def test_irq_mode_timeout(self):
+    irq = FakeIRQBackend()
+    chip = SimulatedMFRC522(irq=irq)
+    reader = MFRC522Reader(chip=chip, irq=irq, rearm_interval=0.005)
+
+    with pytest.raises(Exception) as exc_info:
+      reader.wait_for_tag(timeout=0.02)
+
+    assert str(exc_info.value) == "No tag detected"
+    assert chip.transactions == 0
+
+  def test_irq_mode_polls_when_irq_line_is_not_wired(self):
+    # The chip never drives the IRQ line
+    chip = SimulatedMFRC522(request_timeout=0.0)
+    chip.present(self.UID)
+    reader = MFRC522Reader(chip=chip, irq=FakeIRQBackend(), rearm_interval=0.001, poll_every=5)
+
+    uid, text = reader.wait_for_tag(timeout=1)
+
+    assert uid == self.UID
+    assert reader.missed_irqs == 1
+
+  def test_polling_fallback_without_irq(self, reader, mock_mfrc522):
+    mock_mfrc522.MI_OK = 0
+    mock_mfrc522.PICC_REQIDL = 1
+    mock_mfrc522.MFRC522_Request.side_effect = [(1, None), (0, "some_tag_type")]
+    mock_mfrc522.MFRC522_Anticoll.return_value = (0, [1, 2, 3, 4, 5])
+
+    uid, text = reader.wait_for_tag(timeout=1, poll_interval=0.001)
+
+    assert uid == [1, 2, 3, 4, 5]
+    assert mock_mfrc522.MFRC522_Request.call_count == 2
+
+
+class TestMFRC522ReaderSession:
+  """
+  Test suite for the session lifecycle of MFRC522Reader: cleanup(), open() and reset().
+  """
+
+  def test_cleanup_releases_owned_chip(self, reader, mock_mfrc522):
+    reader.cleanup()
+
+    mock_mfrc522.AntennaOff.assert_called_once()
+    mock_mfrc522.spi.close.assert_called_once()
+    mock_mfrc522.Close_MFRC522.assert_not_called()
+    assert reader.is_open is False
+
+  def test_cleanup_releases_spi_when_antenna_off_fails(self, reader, mock_mfrc522):
+    mock_mfrc522.AntennaOff.side_effect = OSError("SPI transfer failed")
+
+    with pytest.raises(OSError):
+      reader.cleanup()
+
+    mock_mfrc522.spi.close.assert_called_once()
+    assert reader.is_open is False
+
+  def test_unresponsive_chip_read_returns_none(self, reader, mock_mfrc522):
+    mock_mfrc522.MFRC522_Request.side_effect = OSError("SPI transfer failed")
+    mock_mfrc522.MFRC522_Init.side_effect = OSError("SPI transfer failed")
+    mock_mfrc522.AntennaOff.side_effect = OSError("SPI transfer failed")
+    service = ReaderService(reader=reader)
+
+    assert service.read() == (None, None)
+    assert service.wait_for_tag(timeout=0) == (None, None)
+    # One error per read, the failed reset is not counted again
+    assert service.error_count == 2
+    assert service.reset_count == 2
+    assert service.is_open is False
+    # Each session released its SPI handle
+    assert mock_mfrc522.spi.close.call_count == 2
+
+  def test_cleanup_twice_is_noop(self, reader, mock_mfrc522):
+    reader.cleanup()
+    reader.cleanup()
+
+    mock_mfrc522.AntennaOff.assert_called_once()
+
+  def test_open_recreates_owned_chip(self, mock_mfrc522):
+    with patch('src.reader.implementations.mfrc522_reader.MFRC522') as mock_class:
+      reader = MFRC522Reader()
+      reader.cleanup()
+      reader.open()
+
+      assert mock_class.call_count == 2
+      assert reader.is_open is True
+
+  def test_open_reinitialises_injected_chip(self):
+    chip = SimulatedMFRC522()
+    reader = MFRC522Reader(chip=chip)
+    reader.cleanup()
+    assert chip.antenna_on is False
+
+    reader.open()
+
+    assert chip.init_count == 1
+    assert chip.antenna_on is True
+
+  def test_reset_recovers_hung_chip(self):
+    chip = SimulatedMFRC522()
+    chip.hang()
+    reader = MFRC522Reader(chip=chip)
+
+    reader.reset()
+
+    assert chip.responding is True
+
+  def test_reset_raises_when_chip_does_not_answer(self, reader, mock_mfrc522):
+    mock_mfrc522.Read_MFRC522.return_value = 0x00
+
+    with pytest.raises(Exception) as exc_info:
+      reader.reset()
+
+    assert "Reader not responding" in str(exc_info.value)
+    mock_mfrc522.MFRC522_Init.assert_called_once()
+
+
+class TestMFRC522ReaderInventory:
+  """
+  Test suite for MFRC522Reader.inventory() and wait_for_inventory(), using the
+  simulated chip to model several tags in the field at once.
+  """
+  UIDS = [
+    [0x12, 0x34, 0x56, 0x78, 0x08],
+    [0x9A, 0xBC, 0xDE, 0xF0, 0x08],
+    [0x01, 0x02, 0x03, 0x04, 0x04],
+  ]
+
+  def test_inventory_finds_every_tag(self):
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    for uid in self.UIDS:
+      chip.present(uid)
+    reader = MFRC522Reader(chip=chip)
+
+    assert reader.inventory() == self.UIDS
+
+  def test_inventory_halts_enumerated_tags(self):
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    for uid in self.UIDS:
+      chip.present(uid)
+    reader = MFRC522Reader(chip=chip)
+
+    reader.inventory()
+
+    assert [chip.tag_state(uid) for uid in self.UIDS] == ["halt"] * 3
+    assert chip.registers[chip.TReloadRegL] == MFRC522Reader.DEFAULT_TIMER_RELOAD
+
+  def test_inventory_wakes_tags_halted_by_previous_cycle(self):
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    for uid in self.UIDS:
+      chip.present(uid)
+    reader = MFRC522Reader(chip=chip)
+
+    reader.inventory()
+
+    assert reader.inventory() == self.UIDS
+
+  def test_inventory_empty_field(self):
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    reader = MFRC522Reader(chip=chip)
+
+    assert reader.inventory() == []
+
+  def test_inventory_respects_max_tags(self):
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    for uid in self.UIDS:
+      chip.present(uid)
+    reader = MFRC522Reader(chip=chip, max_tags=2)
+
+    assert reader.inventory() == self.UIDS[:2]
+
+  def test_inventory_retries_failed_anticollision(self):
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    for uid in self.UIDS[:2]:
+      chip.present(uid)
+    chip.collide()
+    reader = MFRC522Reader(chip=chip)
+
+    assert reader.inventory() == self.UIDS[:2]
+    assert reader.collision_count == 1
+
+  def test_inventory_collision_keeps_halted_tags_out(self):
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    for uid in self.UIDS:
+      chip.present(uid)
+    select = chip.MFRC522_SelectTag
+    selected = []
+
+    def select_then_collide(uid):
+      # The rounds after the first tag is halted collide once
+      if not selected:
+        chip.collide()
+      selected.append(uid)
+      return select(uid)
+
+    chip.MFRC522_SelectTag = select_then_collide
+    reader = MFRC522Reader(chip=chip)
+
+    assert reader.inventory() == self.UIDS
+    assert selected == self.UIDS
+    assert reader.collision_count == 1
+
+  def test_wait_for_inventory_irq_mode(self):
+    irq = FakeIRQBackend()
+    chip = SimulatedMFRC522(irq=irq, request_timeout=0.001)
+    for uid in self.UIDS:
+      chip.present(uid)
+    reader = MFRC522Reader(chip=chip, irq=irq)
+
+    assert reader.wait_for_inventory(timeout=1) == self.UIDS
+    assert chip.registers[chip.FIFODataReg] == chip.PICC_REQALL
+
+  def test_wait_for_inventory_polls_when_irq_line_is_not_wired(self):
+    chip = SimulatedMFRC522(request_timeout=0.0)
+    for uid in self.UIDS:
+      chip.present(uid)
+    reader = MFRC522Reader(chip=chip, irq=FakeIRQBackend(), rearm_interval=0.001, poll_every=5)
+
+    assert reader.wait_for_inventory(timeout=1) == self.UIDS
+    assert reader.missed_irqs == 1
+
+  def test_wait_for_inventory_timeout(self):
+    irq = FakeIRQBackend()
+    chip = SimulatedMFRC522(irq=irq)
+    reader = MFRC522Reader(chip=chip, irq=irq, rearm_interval=0.005)
+
+    assert reader.wait_for_inventory(timeout=0.02) == []
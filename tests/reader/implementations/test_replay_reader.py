@@ -0,0 +1,130 @@
+import json
+import pytest
+import time
+from unittest import mock
+from src.reader.base import Reader, NoTagDetected
+from src.reader.implementations.replay_reader import ReplayReader, load_trace
+from src.reader.implementations.recording_reader import RecordingReader
+from src.reader.reader_service import ReaderService
+
+TRACE = [
+  {"t": 0.0, "uid": [1, 2, 3, 4, 4], "text": "a"},
+  {"t": 0.05, "error": "Failed to read UID from tag"},
+  {"t": 0.1, "uid": [5, 6, 7, 8, 8], "text": "b"},
+]
+
+class TestReplayReader:
+  """
+  Tests for ReplayReader playback at real, scaled and unthrottled speed.
+  """
+  def test_as_fast_as_possible_plays_back_to_back(self):
+    reader = ReplayReader(TRACE, speed=None)
+
+    assert reader.read() == ([1, 2, 3, 4, 4], "a")
+    with pytest.raises(Exception) as exc_info:
+      reader.read()
+    assert str(exc_info.value) == "Failed to read UID from tag"
+    assert reader.read() == ([5, 6, 7, 8, 8], "b")
+    assert reader.finished
+    with pytest.raises(NoTagDetected):
+      reader.read()
+
+  def test_read_before_entry_is_due_finds_no_tag(self):
+    reader = ReplayReader([{"t": 10.0, "uid": [1], "text": ""}], speed=1.0)
+    reader.open()
+
+    with pytest.raises(NoTagDetected):
+      reader.read()
+
+  def test_speed_scales_the_wait(self):
+    reader = ReplayReader([{"t": 1.0, "uid": [1], "text": "x"}], speed=20.0)
+    reader.open()
+    start = time.monotonic()
+
+    assert reader.wait_for_tag(timeout=1) == ([1], "x")
+    assert 0.04 <= time.monotonic() - start < 0.5
+
+  def test_wait_for_tag_times_out_before_entry(self):
+    reader = ReplayReader([{"t": 10.0, "uid": [1], "text": ""}], speed=1.0)
+
+    with pytest.raises(NoTagDetected):
+      reader.wait_for_tag(timeout=0.01)
+    assert reader.position == 0
+
+  def test_loop_restarts_playback(self):
+    reader = ReplayReader(TRACE[:1], speed=None, loop=True)
+
+    assert [reader.read()[0] for _ in range(3)] == [[1, 2, 3, 4, 4]] * 3
+    assert not reader.finished
+
+  def test_rejects_invalid_speed(self):
+    with pytest.raises(ValueError):
+      ReplayReader(TRACE, speed=0)
+
+  def test_rejects_looping_a_trace_without_duration(self):
+    with pytest.raises(ValueError):
+      ReplayReader(TRACE[:1], speed=1.0, loop=True)
+
+  def test_through_reader_service(self):
+    service = ReaderService(reader=ReplayReader(TRACE, speed=None), max_retries=0)
+
+    results = [service.read() for _ in range(3)]
+
+    assert results == [([1, 2, 3, 4, 4], "a"), (None, None), ([5, 6, 7, 8, 8], "b")]
+    assert service.error_count == 1
+
+
+class TestRecordingReader:
+  """
+  Tests for RecordingReader and the round trip through ReplayReader.
+  """
+  def test_records_reads_and_errors_but_not_empty_polls(self, tmp_path):
+    path = tmp_path / "trace.jsonl"
+    reader = mock.MagicMock(spec=Reader)
+    reader.read.side_effect = [([1, 2, 3, 4, 4], "a"), NoTagDetected(), Exception("SPI error")]
+    recorder = RecordingReader(reader, path=str(path))
+
+    recorder.read()
+    with pytest.raises(NoTagDetected):
+      recorder.read()
+    with pytest.raises(Exception):
+      recorder.read()
+    recorder.close()
+
+    entries = load_trace(str(path))
+    assert [entry.get("uid") for entry in entries] == [[1, 2, 3, 4, 4], None]
+    assert entries[1]["error"] == "SPI error"
+    assert entries[0]["t"] <= entries[1]["t"]
+
+  def test_recorded_trace_replays(self, tmp_path, mock_reader):
+    path = tmp_path / "trace.jsonl"
+    recorder = RecordingReader(mock_reader, path=str(path))
+    recorder.read()
+    recorder.read()
+    recorder.close()
+
+    replay = ReplayReader(str(path), speed=None)
+
+    assert [replay.read() for _ in range(2)] == [([1, 2, 3, 4, 5], "Test Card")] * 2
+
+  def test_appended_recording_follows_the_first(self, tmp_path):
+    path = tmp_path / "trace.jsonl"
+    path.write_text(json.dumps({"t": 5.0, "uid": [1], "text": "first"}) + "\n")
+    reader = mock.MagicMock(spec=Reader)
+    reader.read.return_value = ([2], "second")
+    recorder = RecordingReader(reader, path=str(path))
+    recorder.read()
+    recorder.close()
+
+    entries = load_trace(str(path))
+
+    assert [entry["text"] for entry in entries] == ["first", "second"]
+    assert entries[1]["t"] >= 5.0
+
+  def test_delegates_lifecycle(self, mock_reader):
+    recorder = RecordingReader(mock_reader)
+
+    recorder.cleanup()
+
+    assert mock_reader.cleanup_called
+    assert recorder.entries == []
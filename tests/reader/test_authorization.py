@@ -0,0 +1,140 @@
+import json
+import os
+import pytest
+import time
+from src.reader.authorization import AuthorizationIndex, BloomFilter
+from src.reader.uid import parse_uid
+
+def write_list(path, data, mtime_ns=None):
+  path.write_text(json.dumps(data))
+  if mtime_ns is not None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+class TestParseUid:
+  """
+  Tests for parse_uid() normalisation of configured UIDs.
+  """
+  def test_formats_normalise_to_the_same_integer(self):
+    forms = [0x1234567808, [0x12, 0x34, 0x56, 0x78, 0x08], "12:34:56:78:08", "0x1234567808", "12-34-56-78-08"]
+
+    assert {parse_uid(form) for form in forms} == {0x1234567808}
+
+  @pytest.mark.parametrize("value", ["", "zz:11", [256], True, 1.5])
+  def test_rejects_invalid_values(self, value):
+    with pytest.raises(ValueError):
+      parse_uid(value)
+
+
+class TestBloomFilter:
+  """
+  Tests for BloomFilter.
+  """
+  def test_no_false_negatives(self):
+    bloom = BloomFilter(1000, 0.01)
+    for uid in range(1000):
+      bloom.add(uid)
+
+    assert all(uid in bloom for uid in range(1000))
+
+  def test_false_positive_rate_near_target(self):
+    bloom = BloomFilter(1000, 0.01)
+    for uid in range(1000):
+      bloom.add(uid)
+
+    false_positives = sum(uid in bloom for uid in range(10000, 20000))
+
+    assert false_positives < 300
+
+
+class TestAuthorizationIndex:
+  """
+  Tests for AuthorizationIndex lookups and hot reload.
+  """
+  @pytest.fixture
+  def path(self, tmp_path):
+    path = tmp_path / "access.json"
+    write_list(path, {"allow": ["12:34:56:78:08", 42], "deny": [7]}, mtime_ns=1_000_000_000)
+    return path
+
+  @pytest.mark.parametrize("use_bloom", [False, True])
+  def test_allow_and_deny(self, path, use_bloom):
+    index = AuthorizationIndex(str(path), use_bloom=use_bloom)
+    index.load()
+
+    assert index.is_authorized([0x12, 0x34, 0x56, 0x78, 0x08])
+    assert index.is_authorized(42)
+    assert not index.is_authorized(7)
+    assert not index.is_authorized(43)
+    assert len(index) == 3
+
+  def test_deny_only_allows_everyone_else(self, tmp_path):
+    path = tmp_path / "access.json"
+    write_list(path, {"deny": [7]})
+    index = AuthorizationIndex(str(path))
+    index.load()
+
+    assert index.is_authorized(8)
+    assert not index.is_authorized(7)
+
+  def test_plain_list_is_an_allow_list(self, tmp_path):
+    path = tmp_path / "access.json"
+    write_list(path, [1, 2])
+    index = AuthorizationIndex(str(path))
+    index.load()
+
+    assert 1 in index
+    assert 3 not in index
+
+  def test_load_missing_file_raises(self, tmp_path):
+    index = AuthorizationIndex(str(tmp_path / "missing.json"))
+
+    with pytest.raises(OSError):
+      index.load()
+
+  def test_maybe_reload_only_when_mtime_changes(self, path):
+    index = AuthorizationIndex(str(path))
+    index.load()
+
+    assert index.maybe_reload() is False
+
+    write_list(path, {"allow": [43]}, mtime_ns=2_000_000_000)
+
+    assert index.maybe_reload() is True
+    assert index.is_authorized(43)
+    assert not index.is_authorized(42)
+    assert index.reload_count == 2
+
+  def test_failed_reload_keeps_previous_list(self, path):
+    index = AuthorizationIndex(str(path))
+    index.load()
+    path.write_text("{not json")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+
+    assert index.maybe_reload() is False
+    assert index.is_authorized(42)
+    assert index.reload_errors == 1
+
+  @pytest.mark.parametrize("data", [{"allow": 5}, {"deny": "12:34"}, {"allow": [{"uid": 1}]}])
+  def test_malformed_list_is_a_failed_reload(self, path, data):
+    index = AuthorizationIndex(str(path))
+    index.load()
+    write_list(path, data, mtime_ns=2_000_000_000)
+
+    assert index.maybe_reload() is False
+    assert index.is_authorized(42)
+    assert index.reload_errors == 1
+
+  def test_watcher_picks_up_changes(self, path):
+    index = AuthorizationIndex(str(path))
+    index.load()
+    index.start_watching(interval=0.005)
+    try:
+      write_list(path, {"allow": [43]}, mtime_ns=2_000_000_000)
+      for _ in range(200):
+        if index.is_authorized(43):
+          break
+        time.sleep(0.005)
+    finally:
+      index.stop_watching()
+
+    assert index.is_authorized(43)
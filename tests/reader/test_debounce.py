@@ -0,0 +1,92 @@
+from src.reader.debounce import TagDebouncer
+from src.reader.events import TagEventType
+from src.reader.uid import num_to_uid, uid_to_num
+
+UID_A = 0x0102030405
+UID_B = 0x0A0B0C0D0E
+
+class TestTagDebouncer:
+  """
+  Tests for TagDebouncer.
+  Time is passed in explicitly so that windows can be checked without sleeping.
+  """
+  def setup_method(self):
+    self.debouncer = TagDebouncer(presence_timeout=0.5, hold_off=3.0)
+
+  def kinds(self, events):
+    return [(event.kind, event.uid) for event in events]
+
+  def test_first_read_arrives(self):
+    events = self.debouncer.observe(UID_A, "r0", now=0.0)
+    assert self.kinds(events) == [(TagEventType.ARRIVED, UID_A)]
+    assert events[0].reader_id == "r0"
+
+  def test_held_tag_is_reported_once(self):
+    self.debouncer.observe(UID_A, "r0", now=0.0)
+    for step in range(1, 10):
+      assert self.debouncer.observe(UID_A, "r0", now=step * 0.1) == []
+    assert self.debouncer.suppressed == 9
+
+  def test_tag_leaves_after_presence_timeout(self):
+    self.debouncer.observe(UID_A, "r0", now=0.0)
+    assert self.debouncer.expire("r0", now=0.4) == []
+    assert self.kinds(self.debouncer.expire("r0", now=0.5)) == [(TagEventType.LEFT, UID_A)]
+    # The edge is only reported once
+    assert self.debouncer.expire("r0", now=0.6) == []
+
+  def test_reswipe_within_hold_off_is_absorbed(self):
+    self.debouncer.observe(UID_A, "r0", now=0.0)
+    self.debouncer.expire("r0", now=1.0)
+
+    assert self.debouncer.observe(UID_A, "r0", now=2.0) == []
+    # The absorbed visit leaves silently too
+    assert self.debouncer.expire("r0", now=2.6) == []
+
+  def test_reswipe_after_hold_off_arrives_again(self):
+    self.debouncer.observe(UID_A, "r0", now=0.0)
+    self.debouncer.expire("r0", now=1.0)
+
+    events = self.debouncer.observe(UID_A, "r0", now=3.5)
+
+    assert self.kinds(events) == [(TagEventType.ARRIVED, UID_A)]
+
+  def test_hold_off_per_uid(self):
+    debouncer = TagDebouncer(presence_timeout=0.5, hold_off=3.0, hold_offs={UID_B: 0.0})
+    for uid in (UID_A, UID_B):
+      debouncer.observe(uid, "r0", now=0.0)
+    debouncer.expire("r0", now=1.0)
+
+    assert debouncer.observe(UID_A, "r0", now=1.5) == []
+    assert self.kinds(debouncer.observe(UID_B, "r0", now=1.5)) == [(TagEventType.ARRIVED, UID_B)]
+
+  def test_entries_expire_after_hold_off(self):
+    self.debouncer.observe(UID_A, "r0", now=0.0)
+    self.debouncer.expire("r0", now=1.0)
+    assert len(self.debouncer) == 1
+
+    self.debouncer.expire("r0", now=3.0)
+
+    assert len(self.debouncer) == 0
+
+  def test_lru_eviction_reports_left(self):
+    debouncer = TagDebouncer(max_entries=2)
+    debouncer.observe(1, "r0", now=0.0)
+    debouncer.observe(2, "r0", now=0.1)
+    debouncer.observe(1, "r0", now=0.2)
+
+    events = debouncer.observe(3, "r0", now=0.3)
+
+    assert self.kinds(events) == [(TagEventType.LEFT, 2), (TagEventType.ARRIVED, 3)]
+    assert len(debouncer) == 2
+
+
+class TestUidToNum:
+  def test_list_is_packed_big_endian(self):
+    assert uid_to_num([1, 2, 3, 4, 5]) == 0x0102030405
+
+  def test_bytes_and_int(self):
+    assert uid_to_num(b"\x01\x02") == 0x0102
+    assert uid_to_num(42) == 42
+
+  def test_num_to_uid_restores_the_bytes(self):
+    assert num_to_uid(uid_to_num([0, 2, 3, 4, 1])) == [0, 2, 3, 4, 1]
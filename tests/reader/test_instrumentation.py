@@ -0,0 +1,106 @@
+import pytest
+from unittest import mock
+from src.reader.base import Reader, NoTagDetected
+from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.instrumentation import LatencyHistogram, ReadPathMetrics
+from src.reader.reader_service import ReaderService
+from src.reader.simulation import SimulatedMFRC522
+
+class TestLatencyHistogram:
+  """
+  Tests for LatencyHistogram bucketing and percentiles.
+  """
+  def test_percentiles_report_bucket_upper_bounds(self):
+    histogram = LatencyHistogram(bounds=(0.001, 0.01, 0.1))
+    for _ in range(90):
+      histogram.record(0.0005)
+    for _ in range(9):
+      histogram.record(0.005)
+    histogram.record(0.05)
+
+    assert histogram.percentile(0.50) == 0.001
+    assert histogram.percentile(0.95) == 0.01
+    assert histogram.percentile(0.99) == 0.01
+    assert histogram.percentile(1.0) == 0.05
+
+  def test_overflow_reports_max(self):
+    histogram = LatencyHistogram(bounds=(0.001,))
+    histogram.record(2.5)
+
+    assert histogram.percentile(0.99) == 2.5
+    assert histogram.counts == [0, 1]
+
+  def test_empty_summary(self):
+    summary = LatencyHistogram().summary()
+
+    assert summary['count'] == 0
+    assert summary['p99'] == 0.0
+
+
+class TestReadPathMetrics:
+  """
+  Tests for the ReadPathMetrics hooks in MFRC522Reader and ReaderService.
+  """
+  UID = [0x12, 0x34, 0x56, 0x78, 0x08]
+
+  def test_reader_times_request_and_anticoll(self):
+    metrics = ReadPathMetrics()
+    chip = SimulatedMFRC522(request_timeout=0.001)
+    chip.present(self.UID)
+    reader = MFRC522Reader(chip=chip, metrics=metrics)
+
+    reader.read()
+    chip.remove(self.UID)
+    with pytest.raises(NoTagDetected):
+      reader.read()
+
+    snapshot = metrics.snapshot()
+    assert snapshot['stages']['request']['count'] == 2
+    assert snapshot['stages']['anticoll']['count'] == 1
+    assert snapshot['counters'] == {'no_tag': 1}
+
+  def test_reader_counts_anticoll_failures(self):
+    metrics = ReadPathMetrics()
+    chip = mock.MagicMock()
+    chip.MI_OK = 0
+    chip.MFRC522_Request.return_value = (0, 0x10)
+    chip.MFRC522_Anticoll.return_value = (2, [])
+    reader = MFRC522Reader(chip=chip, metrics=metrics)
+
+    with pytest.raises(Exception):
+      reader.read()
+
+    assert metrics.counters == {'anticoll_failure': 1}
+
+  def test_service_times_reads_recovery_and_sleep(self):
+    metrics = ReadPathMetrics()
+    reader = mock.MagicMock(spec=Reader)
+    reader.read.side_effect = [Exception("SPI error"), (1, "a")]
+    service = ReaderService(reader=reader, metrics=metrics)
+
+    service.read()
+
+    snapshot = metrics.snapshot()
+    assert snapshot['stages']['read']['count'] == 1
+    assert snapshot['stages']['recovery']['count'] == 1
+    assert snapshot['counters'] == {'error': 1}
+
+  def test_polling_sleep_is_recorded(self):
+    metrics = ReadPathMetrics()
+    chip = SimulatedMFRC522(request_timeout=0.0)
+    reader = MFRC522Reader(chip=chip, metrics=metrics)
+
+    with pytest.raises(NoTagDetected):
+      reader.wait_for_tag(timeout=0.01, poll_interval=0.002)
+
+    assert metrics.snapshot()['stages']['sleep']['count'] >= 1
+
+  def test_format_lists_stages_and_counters(self):
+    metrics = ReadPathMetrics()
+    metrics.record("request", 0.002)
+    metrics.count("no_tag")
+
+    text = metrics.format()
+
+    assert "request" in text
+    assert "no_tag=1" in text
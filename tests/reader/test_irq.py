@@ -0,0 +1,53 @@
+import threading
+from unittest.mock import Mock
+from src.reader.irq import GPIOIRQBackend, FakeIRQBackend
+
+class TestGPIOIRQBackend:
+  """
+  Tests for the GPIO driven IRQ backend.
+  Verifies that the IRQ pin is configured as a pulled-up input with falling
+  edge detection, and that edges wake waiters.
+  """
+  def setup_method(self):
+    self.mock_gpio = Mock()
+
+  def test_init_configures_pin(self):
+    backend = GPIOIRQBackend(self.mock_gpio, 24)
+    self.mock_gpio.setup.assert_called_once_with(24, self.mock_gpio.IN, pull_up_down=self.mock_gpio.PUD_UP)
+    self.mock_gpio.add_event_detect.assert_called_once_with(24, self.mock_gpio.FALLING, callback=backend._on_edge)
+
+  def test_edge_wakes_wait(self):
+    backend = GPIOIRQBackend(self.mock_gpio, 24)
+    backend._on_edge(24)
+    assert backend.wait(timeout=0) is True
+    # The edge is consumed by the first wait
+    assert backend.wait(timeout=0) is False
+
+  def test_close_removes_event_detect(self):
+    backend = GPIOIRQBackend(self.mock_gpio, 24)
+    backend.close()
+    self.mock_gpio.remove_event_detect.assert_called_once_with(24)
+
+
+class TestFakeIRQBackend:
+  """
+  Tests for the in-memory IRQ backend used in tests and benchmarks.
+  """
+  def test_wait_times_out_without_trigger(self):
+    backend = FakeIRQBackend()
+    assert backend.wait(timeout=0.01) is False
+    assert backend.trigger_count == 0
+
+  def test_trigger_from_other_thread_wakes_wait(self):
+    backend = FakeIRQBackend()
+    timer = threading.Timer(0.01, backend.trigger)
+    timer.start()
+    assert backend.wait(timeout=1) is True
+    assert backend.trigger_count == 1
+    assert backend.last_trigger is not None
+
+  def test_clear_discards_pending_edge(self):
+    backend = FakeIRQBackend()
+    backend.trigger()
+    backend.clear()
+    assert backend.wait(timeout=0) is False
@@ -0,0 +1,105 @@
+import pytest
+import time
+from unittest import mock
+from src.reader.base import Reader, NoTagDetected
+from src.reader.debounce import TagDebouncer
+from src.reader.events import TagEvent, TagEventType
+from src.reader.implementations.mfrc522_reader import MFRC522Reader
+from src.reader.irq import FakeIRQBackend
+from src.reader.multi_reader_service import MultiReaderService
+from src.reader.reader_service import ReaderService
+from src.reader.simulation import SimulatedMFRC522
+
+class TestMultiReaderService:
+  """
+  Tests for MultiReaderService.
+  Verifies that each reader is driven by its own worker, that events from
+  all readers are merged into one queue tagged with their reader id, and
+  that per-reader statistics are exposed.
+  """
+  def make_simulated(self, reader_id):
+    irq = FakeIRQBackend()
+    chip = SimulatedMFRC522(irq=irq)
+    service = ReaderService(
+      reader=MFRC522Reader(chip=chip, irq=irq, rearm_interval=0.005),
+      reader_id=reader_id,
+      debouncer=TagDebouncer(presence_timeout=0.5),
+    )
+    return chip, service
+
+  def test_duplicate_reader_ids_rejected(self):
+    services = [ReaderService(reader=mock.MagicMock(spec=Reader), reader_id="a") for _ in range(2)]
+    with pytest.raises(ValueError):
+      MultiReaderService(services)
+
+  def test_events_from_all_readers_are_merged(self):
+    entrance_chip, entrance = self.make_simulated("entrance")
+    exit_chip, exit_ = self.make_simulated("exit")
+    entrance_chip.present([1, 2, 3, 4, 4])
+    exit_chip.present([5, 6, 7, 8, 12])
+
+    with MultiReaderService([entrance, exit_], poll_timeout=0.05) as readers:
+      events = [readers.get(timeout=1), readers.get(timeout=1)]
+
+    assert {event.reader_id for event in events} == {"entrance", "exit"}
+    assert all(event.kind == TagEventType.ARRIVED for event in events)
+    assert entrance.is_open is False
+    assert exit_.is_open is False
+
+  def test_idle_reader_does_not_delay_others(self):
+    idle_chip, idle = self.make_simulated("idle")
+    busy_chip, busy = self.make_simulated("busy")
+    readers = MultiReaderService([idle, busy], poll_timeout=1.0)
+    readers.start()
+    try:
+      start = time.monotonic()
+      busy_chip.present([1, 2, 3, 4, 4])
+      event = readers.get(timeout=1)
+      latency = time.monotonic() - start
+    finally:
+      readers.stop()
+
+    assert event.reader_id == "busy"
+    assert latency < 0.5
+
+  def test_get_events_returns_pending_in_timestamp_order(self):
+    readers = MultiReaderService([])
+    for timestamp in (3.0, 1.0, 2.0):
+      readers._publish(TagEvent(uid=1, timestamp=timestamp, reader_id="a"))
+
+    events = readers.get_events(timeout=0)
+
+    assert [event.timestamp for event in events] == [1.0, 2.0, 3.0]
+    assert readers.get_events(timeout=0) == []
+
+  def test_full_queue_drops_events(self):
+    readers = MultiReaderService([], max_queue=1)
+    readers._publish(TagEvent(uid=1, timestamp=1.0, reader_id="a"))
+    readers._publish(TagEvent(uid=2, timestamp=2.0, reader_id="a"))
+
+    assert readers.dropped_events == 1
+
+  def test_stats_report_per_reader_counts(self):
+    reader = mock.MagicMock(spec=Reader)
+    reader.wait_for_tag.side_effect = NoTagDetected("No tag detected")
+    service = ReaderService(reader=reader, reader_id="entrance")
+
+    with MultiReaderService([service], poll_timeout=0.01) as readers:
+      time.sleep(0.05)
+      stats = readers.stats()
+
+    assert stats["entrance"]["polls"] > 0
+    assert stats["entrance"]["poll_rate"] > 0
+    assert stats["entrance"]["errors"] == 0
+    assert stats["entrance"]["events"] == 0
+
+  def test_errors_escaping_a_poll_are_counted(self):
+    reader = mock.MagicMock(spec=Reader)
+    reader.wait_for_tag.return_value = (["not", "a", "uid"], "")
+    service = ReaderService(reader=reader, reader_id="entrance")
+
+    with MultiReaderService([service], poll_timeout=0.01) as readers:
+      time.sleep(0.05)
+      stats = readers.stats()
+
+    assert stats["entrance"]["errors"] > 0
@@ -1,13 +1,19 @@
 import pytest
+import asyncio
+import threading
 from unittest import mock
 from src.reader.reader_service import ReaderService
-from src.reader.base import Reader
+from src.reader.base import Reader, NoTagDetected
+from src.reader.events import TagEvent, TagEventType
+from src.reader.debounce import TagDebouncer
+from src.reader.uid import uid_to_num
 
 class TestReaderService:
   """
   TestReaderService is a test class for the ReaderService implementation.
   This test class verifies the behavior of the ReaderService, ensuring that:
   - Card reading functionality works correctly
+  - The reader session stays open across polls and is closed on shutdown
   - GPIO cleanup occurs properly even when exceptions are raised
   The tests use mock objects to simulate the hardware components, allowing
   for isolated testing of the service logic.
@@ -38,7 +44,8 @@ class TestReaderService:
 
     # Assert
     self.mock_reader.read.assert_called_once()
-    self.mock_reader.cleanup.assert_called_once()
+    self.mock_reader.open.assert_called_once()
+    self.mock_reader.cleanup.assert_not_called()
     assert id == 12345
     assert text == "test card"
 
@@ -55,5 +62,233 @@ class TestReaderService:
 
     assert id is None
     assert text is None
-    # Verify cleanup was called even with exception
-    self.mock_reader.cleanup.assert_called_once()
\ No newline at end of file
+    # Verify the reader was reset and retried before being cleaned up
+    self.mock_reader.reset.assert_called_once()
+    assert self.mock_reader.read.call_count == 2
+    self.mock_reader.cleanup.assert_called_once()
+    assert self.reader.is_open is False
+    assert self.reader.error_count == 2
+    assert self.reader.reset_count == 1
+
+  def test_session_stays_open_across_polls(self):
+    """
+    Test that repeated polls reuse one reader session instead of cleaning up every time.
+    """
+    self.mock_reader.read.side_effect = NoTagDetected("No tag detected")
+
+    for _ in range(10):
+      assert self.reader.read() == (None, None)
+
+    self.mock_reader.open.assert_called_once()
+    self.mock_reader.cleanup.assert_not_called()
+    self.mock_reader.reset.assert_not_called()
+    assert self.reader.error_count == 0
+
+  def test_reset_and_retry_recovers(self):
+    """
+    Test that a single read error is recovered by resetting the reader and retrying.
+    """
+    self.mock_reader.read.side_effect = [OSError("SPI transfer failed"), (12345, "test card")]
+
+    id, text = self.reader.read()
+
+    assert id == 12345
+    self.mock_reader.reset.assert_called_once()
+    self.mock_reader.cleanup.assert_not_called()
+    assert self.reader.is_open is True
+
+  def test_failed_reset_and_cleanup_return_none(self):
+    """
+    Test that a reset and a cleanup failing on an unresponsive reader do not escape read().
+    """
+    self.mock_reader.read.side_effect = OSError("SPI transfer failed")
+    self.mock_reader.reset.side_effect = OSError("SPI transfer failed")
+    self.mock_reader.cleanup.side_effect = OSError("SPI transfer failed")
+
+    id, text = self.reader.read()
+
+    assert (id, text) == (None, None)
+    assert self.mock_reader.read.call_count == 1
+    assert self.reader.error_count == 1
+    assert self.reader.is_open is False
+
+  def test_read_reopens_after_error_close(self):
+    """
+    Test that the session is reopened on the next read after an error closed it.
+    """
+    self.mock_reader.read.side_effect = Exception("Test exception")
+    self.reader.read()
+    self.mock_reader.read.side_effect = None
+
+    id, text = self.reader.read()
+
+    assert id == 12345
+    assert self.mock_reader.open.call_count == 2
+
+  def test_context_manager_closes_session(self):
+    """
+    Test that using the service as a context manager opens and closes the reader once.
+    """
+    with self.reader as service:
+      service.read()
+      service.read()
+      self.mock_reader.cleanup.assert_not_called()
+
+    self.mock_reader.open.assert_called_once()
+    self.mock_reader.cleanup.assert_called_once()
+    assert self.reader.is_open is False
+
+  def test_close_without_open_is_noop(self):
+    """
+    Test that closing a service that was never opened does not touch the reader.
+    """
+    self.reader.close()
+    self.mock_reader.cleanup.assert_not_called()
+  def test_wait_for_tag_returns_id_and_text(self):
+    """
+    Test that wait_for_tag() delegates to the reader with the configured poll interval.
+    """
+    self.mock_reader.wait_for_tag.return_value = (12345, "test card")
+
+    id, text = self.reader.wait_for_tag(timeout=1)
+
+    self.mock_reader.wait_for_tag.assert_called_once_with(timeout=1, poll_interval=0.1)
+    assert id == 12345
+    assert text == "test card"
+
+  def test_wait_for_tag_returns_none_on_timeout(self):
+    """
+    Test that wait_for_tag() returns None for ID and text when no tag is read in time.
+    """
+    self.mock_reader.wait_for_tag.side_effect = NoTagDetected("No tag detected")
+
+    id, text = self.reader.wait_for_tag(timeout=0)
+
+    assert id is None
+    assert text is None
+
+
+class TestReaderServiceEvents:
+  """
+  Tests for the asynchronous TagEvent stream of ReaderService.
+  The stream is consumed with asyncio.run() so no asyncio plugin is needed.
+  """
+  def setup_method(self):
+    self.mock_reader = mock.MagicMock(spec=Reader)
+    self.service = ReaderService(reader=self.mock_reader, reader_id="entrance")
+
+  def collect(self, count, **kwargs):
+    async def consume():
+      events = []
+      stream = self.service.events(**kwargs)
+      try:
+        async for event in stream:
+          events.append(event)
+          if len(events) == count:
+            break
+      finally:
+        await stream.aclose()
+      return events
+    return asyncio.run(consume())
+
+  def test_events_yields_tag_events(self):
+    self.mock_reader.wait_for_tag.side_effect = [
+      ([1, 2, 3, 4, 5], "a"),
+      NoTagDetected("No tag detected"),
+      ([6, 7, 8, 9, 10], "b"),
+    ] + [NoTagDetected("No tag detected")] * 100
+
+    events = self.collect(2, poll_timeout=0.01)
+
+    assert [event.uid for event in events] == [uid_to_num([1, 2, 3, 4, 5]), uid_to_num([6, 7, 8, 9, 10])]
+    assert all(isinstance(event, TagEvent) for event in events)
+    assert all(event.reader_id == "entrance" for event in events)
+    assert events[0].timestamp <= events[1].timestamp
+
+  def test_events_reads_off_the_event_loop_thread(self):
+    threads = []
+    def wait_for_tag(timeout, poll_interval):
+      threads.append(threading.current_thread().name)
+      return [1, 2, 3, 4, 5], "a"
+    self.mock_reader.wait_for_tag.side_effect = wait_for_tag
+
+    self.collect(1)
+
+    assert threads[0].startswith("reader-entrance")
+
+  def test_events_raises_poll_errors_to_the_consumer(self):
+    self.mock_reader.wait_for_tag.side_effect = [
+      ([1, 2, 3, 4, 5], "a"),
+      (["not", "a", "uid"], "b"),
+    ]
+
+    async def consume():
+      events = []
+      stream = self.service.events(poll_timeout=0.01)
+      try:
+        with pytest.raises(TypeError):
+          async for event in stream:
+            events.append(event)
+      finally:
+        await stream.aclose()
+      return events
+
+    events = asyncio.run(asyncio.wait_for(consume(), timeout=1))
+
+    assert [event.uid for event in events] == [uid_to_num([1, 2, 3, 4, 5])]
+
+  def test_events_drops_oldest_when_buffer_full(self):
+    queue = asyncio.Queue(maxsize=2)
+    for uid in (1, 2, 3):
+      self.service._publish(queue, TagEvent(uid=uid, timestamp=0.0, reader_id="entrance"))
+
+    assert self.service.dropped_events == 1
+    assert queue.get_nowait().uid == 2
+    assert queue.get_nowait().uid == 3
+
+
+class TestReaderServicePollEvents:
+  """
+  Tests for ReaderService.poll_events() with and without a debouncer.
+  """
+  def setup_method(self):
+    self.mock_reader = mock.MagicMock(spec=Reader)
+    self.mock_reader.wait_for_tag.return_value = ([1, 2, 3, 4, 5], "a")
+
+  def test_without_debouncer_every_read_is_an_event(self):
+    service = ReaderService(reader=self.mock_reader)
+
+    assert len(service.poll_events(timeout=0)) == 1
+    assert len(service.poll_events(timeout=0)) == 1
+
+  def test_no_tag_produces_no_event(self):
+    self.mock_reader.wait_for_tag.side_effect = NoTagDetected("No tag detected")
+    service = ReaderService(reader=self.mock_reader)
+
+    assert service.poll_events(timeout=0) == []
+
+  def test_debouncer_suppresses_held_tag(self):
+    service = ReaderService(reader=self.mock_reader, debouncer=TagDebouncer(presence_timeout=10))
+
+    first = service.poll_events(timeout=0)
+    repeats = [service.poll_events(timeout=0) for _ in range(5)]
+
+    assert [event.kind for event in first] == [TagEventType.ARRIVED]
+    assert first[0].uid == 0x0102030405
+    assert repeats == [[]] * 5
+
+  def test_inventory_mode_reports_every_tag(self):
+    self.mock_reader.wait_for_inventory.return_value = [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]]
+    service = ReaderService(reader=self.mock_reader, inventory=True)
+
+    events = service.poll_events(timeout=0)
+
+    assert [event.uid for event in events] == [0x0102030405, 0x060708090A]
+    self.mock_reader.wait_for_tag.assert_not_called()
+
+  def test_read_inventory_returns_empty_list_on_error(self):
+    self.mock_reader.wait_for_inventory.side_effect = Exception("SPI error")
+    service = ReaderService(reader=self.mock_reader, max_retries=0)
+
+    assert service.read_inventory(timeout=0) == []
+    assert service.error_count == 1
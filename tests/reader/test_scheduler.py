@@ -0,0 +1,100 @@
+import pytest
+from unittest import mock
+from src.reader.base import Reader, NoTagDetected
+from src.reader.reader_service import ReaderService
+from src.reader.scheduler import AdaptivePollScheduler
+
+class TestAdaptivePollScheduler:
+  """
+  Tests for AdaptivePollScheduler, driven with explicit timestamps.
+  """
+  def setup_method(self):
+    self.scheduler = AdaptivePollScheduler(min_interval=0.1, max_interval=0.8, backoff=2.0, idle_after=1.0)
+
+  def test_backs_off_when_idle(self):
+    intervals = []
+    for _ in range(5):
+      self.scheduler.record(False, now=100.0)
+      intervals.append(self.scheduler.next_interval())
+
+    assert intervals == [0.2, 0.4, 0.8, 0.8, 0.8]
+
+  def test_detection_jumps_back_to_min_interval(self):
+    for _ in range(3):
+      self.scheduler.record(False, now=100.0)
+
+    self.scheduler.record(True, now=100.0)
+
+    assert self.scheduler.next_interval() == 0.1
+    assert self.scheduler.detection_count == 1
+
+  def test_stays_fast_during_grace_period(self):
+    self.scheduler.record(True, now=100.0)
+    self.scheduler.record(False, now=100.5)
+
+    assert self.scheduler.next_interval() == 0.1
+
+    self.scheduler.record(False, now=101.5)
+
+    assert self.scheduler.next_interval() == 0.2
+
+  def test_active_session_keeps_min_interval(self):
+    self.scheduler.set_active(True)
+    for _ in range(5):
+      self.scheduler.record(False)
+
+    assert self.scheduler.next_interval() == 0.1
+    assert self.scheduler.active is True
+
+  def test_stats_report_polls_and_duty_cycle(self):
+    self.scheduler.record(False, busy=0.0)
+    self.scheduler.record(True, busy=0.0)
+
+    stats = self.scheduler.stats()
+
+    assert stats['polls'] == 2
+    assert stats['detections'] == 1
+    assert 0.0 <= stats['duty_cycle'] <= 1.0
+
+  def test_rejects_invalid_intervals(self):
+    with pytest.raises(ValueError):
+      AdaptivePollScheduler(min_interval=1.0, max_interval=0.5)
+
+
+class TestReaderServiceScheduled:
+  """
+  Tests for ReaderService polling through an AdaptivePollScheduler.
+  """
+  def setup_method(self):
+    self.mock_reader = mock.MagicMock(spec=Reader)
+    self.scheduler = AdaptivePollScheduler(min_interval=0.001, max_interval=0.004, idle_after=0)
+
+  def test_polls_until_tag_found(self):
+    self.mock_reader.read.side_effect = [NoTagDetected(), NoTagDetected(), (12345, "card")]
+    service = ReaderService(reader=self.mock_reader, scheduler=self.scheduler)
+
+    assert service.wait_for_tag(timeout=1) == (12345, "card")
+    assert self.scheduler.poll_count == 3
+    assert self.scheduler.next_interval() == 0.001
+    self.mock_reader.wait_for_tag.assert_not_called()
+
+  def test_returns_none_on_timeout(self):
+    self.mock_reader.read.side_effect = NoTagDetected()
+    service = ReaderService(reader=self.mock_reader, scheduler=self.scheduler)
+
+    assert service.wait_for_tag(timeout=0.02) == (None, None)
+    assert self.scheduler.next_interval() == 0.004
+
+  def test_inventory_mode_uses_inventory(self):
+    self.mock_reader.inventory.return_value = [[1, 2, 3, 4, 5]]
+    service = ReaderService(reader=self.mock_reader, scheduler=self.scheduler, inventory=True)
+
+    assert len(service.poll_events(timeout=1)) == 1
+    self.mock_reader.wait_for_inventory.assert_not_called()
+
+  def test_set_active_reaches_scheduler(self):
+    service = ReaderService(reader=self.mock_reader, scheduler=self.scheduler)
+
+    service.set_active(True)
+
+    assert self.scheduler.active is True
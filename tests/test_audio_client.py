@@ -1,7 +1,50 @@
+import asyncio
+import grpc
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import os
-from src.audio_client import AudioServiceClient
+from src.audio_client import AsyncAudioServiceClient, AudioServiceClient
+
+class FakeStreamCall:
+  """
+  Streaming call yielding responses, then raising an error if given.
+  """
+  def __init__(self, responses, error=None):
+    self.responses = responses
+    self.error = error
+    self.cancelled = False
+
+  def __iter__(self):
+    for response in self.responses:
+      if self.cancelled:
+        return
+      yield response
+    if self.error is not None:
+      raise self.error
+
+  def cancel(self):
+    self.cancelled = True
+
+class FakeRpcError(grpc.RpcError):
+  def __init__(self, code):
+    self._code = code
+
+  def code(self):
+    return self._code
+
+  def details(self):
+    return self._code.name
+
+def window_response(index, predicted_class="dog"):
+  response = Mock()
+  response.success = True
+  response.session_id = "test-session-id"
+  response.predicted_class = predicted_class
+  response.confidence = 0.8
+  response.top_predictions = []
+  response.window_start = index * 5.0
+  response.window_end = (index + 1) * 5.0
+  return response
 
 @patch('src.audio_client.audio_service_pb2_grpc.AudioServiceStub')
 @patch('src.audio_client.grpc.insecure_channel')
@@ -191,4 +234,130 @@ class TestAudioServiceClient:
     
     client.close()
     
-    client.channel.close.assert_called_once()
\ No newline at end of file
+    client.channel.close.assert_called_once()
+  
+  def test_stream_classifications_yields_windows(self, mock_channel, mock_stub):
+    """Test that every streamed window is converted to a result"""
+    client = AudioServiceClient()
+    call = FakeStreamCall([window_response(0), window_response(1, "music")])
+    client.stub.StreamClassifications.return_value = call
+    
+    results = list(client.stream_classifications(window_duration=5, session_id="test-session-id", max_windows=2))
+    
+    request = client.stub.StreamClassifications.call_args[0][0]
+    assert request.session_id == "test-session-id"
+    assert request.window_duration == 5
+    assert request.max_windows == 2
+    assert [r['predicted_class'] for r in results] == ["dog", "music"]
+    assert [(r['window_start'], r['window_end']) for r in results] == [(0.0, 5.0), (5.0, 10.0)]
+    assert call.cancelled
+  
+  def test_stream_classifications_close_cancels_call(self, mock_channel, mock_stub):
+    """Test that closing the generator cancels the call"""
+    client = AudioServiceClient()
+    call = FakeStreamCall([window_response(i) for i in range(10)])
+    client.stub.StreamClassifications.return_value = call
+    
+    stream = client.stream_classifications()
+    next(stream)
+    stream.close()
+    
+    assert call.cancelled
+    assert client._streams == set()
+  
+  def test_stream_classifications_unimplemented(self, mock_channel, mock_stub):
+    """Test that a service without streaming is remembered"""
+    client = AudioServiceClient()
+    client.stub.StreamClassifications.return_value = FakeStreamCall([], FakeRpcError(grpc.StatusCode.UNIMPLEMENTED))
+    
+    assert list(client.stream_classifications()) == []
+    assert client.streaming_supported is False
+  
+  def test_stream_classifications_error_ends_stream(self, mock_channel, mock_stub):
+    """Test that a failing stream ends after the windows already received"""
+    client = AudioServiceClient()
+    client.stub.StreamClassifications.return_value = FakeStreamCall(
+      [window_response(0)], FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+    )
+    
+    results = list(client.stream_classifications())
+    
+    assert len(results) == 1
+    assert client.streaming_supported is True
+
+@patch('src.audio_client.audio_service_pb2_grpc.AudioServiceStub')
+@patch('src.audio_client.grpc.aio.insecure_channel')
+class TestAsyncAudioServiceClient:
+  """
+  Tests the grpc.aio AsyncAudioServiceClient class with a mocked channel and
+  stub: the calls are awaited and failures are reported as in
+  AudioServiceClient.
+  """
+  
+  def test_init_default_address(self, mock_channel, mock_stub):
+    """Test initialization with default server address"""
+    client = AsyncAudioServiceClient()
+    
+    mock_channel.assert_called_once_with('localhost:50051')
+    mock_stub.assert_called_once_with(mock_channel.return_value)
+    assert client.timeout == 30
+  
+  def test_health_check(self, mock_channel, mock_stub):
+    """Test health check success and failure"""
+    client = AsyncAudioServiceClient()
+    client.stub.HealthCheck = AsyncMock(return_value=Mock(status="SERVING"))
+    
+    assert asyncio.run(client.health_check()) is True
+    
+    client.stub.HealthCheck.side_effect = Exception("gRPC error")
+    assert asyncio.run(client.health_check()) is False
+  
+  @patch('src.audio_client.asyncio.sleep', new_callable=AsyncMock)
+  def test_wait_for_service_timeout(self, mock_sleep, mock_channel, mock_stub):
+    """Test waiting for service timeout"""
+    client = AsyncAudioServiceClient()
+    client.stub.HealthCheck = AsyncMock(side_effect=Exception("Service unavailable"))
+    
+    result = asyncio.run(client.wait_for_service(max_retries=2, retry_delay=1))
+    
+    assert result is False
+    assert client.stub.HealthCheck.call_count == 2
+    assert mock_sleep.await_count == 2
+  
+  def test_start_audio_processing(self, mock_channel, mock_stub):
+    """Test audio processing results and exceptions"""
+    client = AsyncAudioServiceClient()
+    client.stub.StartAudioProcessing = AsyncMock(return_value=window_response(0))
+    
+    result = asyncio.run(client.start_audio_processing(duration=5))
+    
+    assert result['success'] is True
+    assert result['predicted_class'] == "dog"
+    assert client.stub.StartAudioProcessing.call_args[1]['timeout'] == 30
+    
+    client.stub.StartAudioProcessing.side_effect = Exception("gRPC error")
+    assert asyncio.run(client.start_audio_processing()) is None
+  
+  def test_get_processing_status(self, mock_channel, mock_stub):
+    """Test processing status retrieval"""
+    client = AsyncAudioServiceClient()
+    client.stub.GetProcessingStatus = AsyncMock(return_value=Mock(
+      session_id="test-session-id", status="completed", current_operation="analysis_complete"
+    ))
+    
+    result = asyncio.run(client.get_processing_status("test-session-id"))
+    
+    assert result == {
+      'session_id': "test-session-id",
+      'status': "completed",
+      'current_operation': "analysis_complete",
+    }
+  
+  def test_close(self, mock_channel, mock_stub):
+    """Test closing the connection"""
+    mock_channel.return_value.close = AsyncMock()
+    client = AsyncAudioServiceClient()
+    
+    asyncio.run(client.close())
+    
+    client.channel.close.assert_awaited_once()
@@ -0,0 +1,156 @@
+import pytest
+import threading
+import time
+from src.audio_pipeline import AudioPipeline, CoverageMeter
+
+class FakeClient:
+  """
+  Client whose calls take `call_time` seconds and return the given results in turn.
+  """
+  def __init__(self, call_time=0.02, results=None):
+    self.call_time = call_time
+    self.results = results
+    self.calls = []
+
+  def start_audio_processing(self, duration=5, session_id=None):
+    self.calls.append((time.monotonic(), session_id))
+    time.sleep(self.call_time)
+    if self.results is not None:
+      return self.results[(len(self.calls) - 1) % len(self.results)]
+    return {'success': True, 'session_id': session_id or f"call {len(self.calls)}", 'predicted_class': f"class {len(self.calls)}"}
+
+def run_for(pipeline, seconds, session_id=None):
+  deadline = time.monotonic() + seconds
+  pipeline.run(keep_running=lambda: time.monotonic() < deadline, session_id=session_id)
+
+class TestCoverageMeter:
+  def test_ratio(self):
+    meter = CoverageMeter()
+    assert meter.ratio == 0.0
+
+    meter.start()
+    meter.add(0.05)
+    time.sleep(0.1)
+    meter.stop()
+
+    assert 0.3 < meter.ratio < 0.55
+    assert meter.stats()['recorded_seconds'] == 0.05
+
+  def test_elapsed_frozen_after_stop(self):
+    meter = CoverageMeter()
+    meter.start()
+    meter.stop()
+    elapsed = meter.elapsed
+    time.sleep(0.02)
+
+    assert meter.elapsed == elapsed
+
+class TestAudioPipeline:
+  """
+  Tests for AudioPipeline: calls are issued back to back, results are
+  presented on another thread without holding up recording, and the
+  coverage of the session is measured.
+  """
+  def test_calls_are_back_to_back(self):
+    client = FakeClient(call_time=0.02)
+    presented = []
+    pipeline = AudioPipeline(client, presented.append, duration=1)
+    run_for(pipeline, 0.2)
+
+    gaps = [b - a for (a, _), (b, _) in zip(client.calls, client.calls[1:])]
+    assert len(client.calls) >= 5
+    assert max(gaps) < 0.02 + 0.015
+    assert len(presented) == len(client.calls)
+    assert pipeline.presented == len(client.calls)
+
+  def test_each_call_is_its_own_session(self):
+    client = FakeClient(call_time=0.01)
+    presented = []
+    pipeline = AudioPipeline(client, presented.append, duration=1, pipeline_id="pipeline")
+    run_for(pipeline, 0.05)
+
+    # The client generates a session ID per call, results share the pipeline ID
+    assert {session_id for _, session_id in client.calls} == {None}
+    assert len({result['session_id'] for result in presented}) == len(presented)
+    assert {result['pipeline_id'] for result in presented} == {"pipeline"}
+
+  def test_session_id_given_by_caller_is_used(self):
+    client = FakeClient(call_time=0.01)
+    pipeline = AudioPipeline(client, lambda result: None, duration=1)
+    run_for(pipeline, 0.05, session_id="session")
+
+    assert {session_id for _, session_id in client.calls} == {"session"}
+
+  def test_slow_presentation_does_not_delay_recording(self):
+    client = FakeClient(call_time=0.01)
+    presented = []
+
+    def present(result):
+      time.sleep(0.05)
+      presented.append(result)
+
+    pipeline = AudioPipeline(client, present, duration=1)
+    run_for(pipeline, 0.2)
+
+    # Recording kept its pace, the presenter skipped the results it could not keep up with
+    assert len(client.calls) >= 12
+    assert pipeline.dropped > 0
+    assert len(presented) + pipeline.dropped == len(client.calls)
+    assert presented[-1] == {
+      'success': True,
+      'session_id': f"call {len(client.calls)}",
+      'predicted_class': f"class {len(client.calls)}",
+      'pipeline_id': pipeline.pipeline_id,
+    }
+
+  def test_coverage_counts_successful_recordings(self):
+    client = FakeClient(call_time=0.02, results=[{'success': True}, {'success': False, 'error_message': "busy"}])
+    pipeline = AudioPipeline(client, lambda result: None, duration=0.02, retry_delay=0.02)
+    run_for(pipeline, 0.2)
+
+    successes = (len(client.calls) + 1) // 2
+    assert pipeline.coverage.recorded == pytest.approx(successes * 0.02)
+    assert 0.2 < pipeline.coverage.ratio < 0.6
+
+  def test_failed_calls_are_presented_and_retried_later(self):
+    client = FakeClient(call_time=0.0, results=[None])
+    presented = []
+    pipeline = AudioPipeline(client, presented.append, retry_delay=0.05)
+    run_for(pipeline, 0.12)
+
+    assert 2 <= len(client.calls) <= 4
+    assert presented == [None] * len(client.calls)
+    assert pipeline.coverage.recorded == 0
+
+  def test_stop_from_another_thread(self):
+    pipeline = AudioPipeline(FakeClient(call_time=0.02), lambda result: None)
+    thread = threading.Thread(target=pipeline.run)
+    thread.start()
+    time.sleep(0.05)
+    pipeline.stop()
+    thread.join(timeout=1)
+
+    assert not thread.is_alive()
+    assert pipeline.coverage.stopped is not None
+
+  def test_coverage_started_by_caller_is_kept(self):
+    coverage = CoverageMeter()
+    coverage.start()
+    coverage.add(5)
+    pipeline = AudioPipeline(FakeClient(), lambda result: None, duration=1, coverage=coverage)
+    run_for(pipeline, 0.05)
+
+    assert coverage.recorded >= 6
+    assert coverage.stopped is None
+
+  def test_presenter_errors_do_not_stop_recording(self):
+    client = FakeClient(call_time=0.01)
+
+    def present(result):
+      raise RuntimeError("display unplugged")
+
+    pipeline = AudioPipeline(client, present)
+    run_for(pipeline, 0.1)
+
+    assert len(client.calls) >= 5
+    assert pipeline.presented == 0